@@ -5,7 +5,9 @@ and mundane but critical procedural support. It also sets constant variables for
 file locations and analysis parameters such as the years of data to be analyzed and reported.
 """
 import fnmatch
+import hashlib
 import importlib
+import json
 import os
 import re
 import shutil
@@ -15,6 +17,7 @@ import tempfile
 import time
 import uuid
 from collections.abc import Iterable
+from functools import reduce
 from pathlib import Path
 
 EPSG_LL = 4326
@@ -52,8 +55,11 @@ __classes__ = [
     "Comp",
     "And",
     "Or",
+    "CriteriaTable",
     "NetLoader",
     "ServiceAreaAnalysis",
+    "NetResultCache",
+    "SkimMatrix",
 ]
 __functions__ = [
     "make_path",
@@ -480,6 +486,65 @@ class Or:
         return np.logical_or.reduce([c.eval(self.vector) for c in self.criteria])
 
 
+class CriteriaTable:
+    """
+    A lookup table compiled from a dictionary of criteria (`Comp`, `And`, or iterables of these,
+    which imply an `Or` operation) over an integer code domain, such as land use codes. Evaluating
+    all criteria for a vector of codes is a single index into the table.
+
+    Attributes:
+        criteria (dict): `{name: criteria}`; the criteria for each named column
+        names (list): criteria names, in the order of table columns
+        low (int): the lowest code in the domain
+        high (int): the highest code in the domain
+        table (np.array): ((high - low + 1) x len(names)) boolean array; True where a code meets
+            the named criteria
+    """
+
+    def __init__(self, criteria, domain=range(0, 103)):
+        self.criteria = criteria
+        self.names = list(criteria.keys())
+        self.low = min(domain)
+        self.high = max(domain)
+        codes = np.arange(self.low, self.high + 1)
+        self.table = np.zeros((len(codes), len(self.names)), dtype=bool)
+        for k, name in enumerate(self.names):
+            self.table[:, k] = Or(codes, criteria[name]).eval()
+
+    def eval(self, vector, names=None):
+        """
+        Returns an (n x k) boolean array that has True values where the values in `vector`
+        evaluate to True for the criteria of each name. Values outside the integer domain (nulls,
+        e.g.) are evaluated against the criteria directly.
+
+        args:
+            vector (np.array-like): A vector of values to test against the criteria
+            names (list, default=None): criteria (columns) to evaluate; all if None
+        """
+        if names is None:
+            names = self.names
+        cols = [self.names.index(name) for name in names]
+        values = np.asarray(vector)
+        result = np.zeros((len(values), len(cols)), dtype=bool)
+        try:
+            numeric = values.astype(np.float64)
+        except (TypeError, ValueError):
+            numeric = np.full(len(values), np.nan)
+        with np.errstate(invalid="ignore"):
+            in_domain = (
+                    (numeric >= self.low)
+                    & (numeric <= self.high)
+                    & (numeric == np.floor(numeric))
+            )
+        codes = numeric[in_domain].astype(np.int64) - self.low
+        result[in_domain] = self.table[codes[:, None], cols]
+        other = ~in_domain
+        if other.any():
+            for k, name in enumerate(names):
+                result[other, k] = Or(values[other], self.criteria[name]).eval()
+        return result
+
+
 class NetLoader:
     """
     A naive class for specifying network location loading preferences.
@@ -611,6 +676,532 @@ class ServiceAreaAnalysis:
             )
 
 
+class NetResultCache:
+    """
+    A persistent, content-addressed cache of network analysis outputs. Entries are keyed by a
+    hash of the analysis inputs (network datasets, facility and zone features, e.g.) and the
+    solver parameters, so a network problem solved before - in this run or a previous one - can
+    be restored rather than solved again. When the cache grows beyond `max_size`, the least
+    recently used entries are evicted.
+
+    Inputs are fingerprinted by content: files and folders (including file geodatabases) by
+    hashing their files, and feature classes or tables in a geodatabase by hashing their rows.
+    Other datasets in a geodatabase (network datasets, e.g.) are fingerprinted by their parent
+    workspace. File hashes are remembered by size and modification time, so unchanged inputs
+    are only read once.
+
+    Each entry is a folder in `cache_dir` holding copies of the outputs: files and folders
+    (csv tables, skim stores, e.g.) are copied as-is and geodatabase feature classes and tables
+    are copied to an `outputs.gdb` in the entry.
+
+    Args:
+        cache_dir (str): Path to the cache folder (created if it does not exist)
+        max_size (int, default=50 GB): Maximum size of the cache (bytes)
+    """
+    manifest_name = "manifest.json"
+    fingerprints_name = "fingerprints.json"
+
+    def __init__(self, cache_dir, max_size=50 * 1024 ** 3):
+        self.cache_dir = validate_directory(cache_dir)
+        self.max_size = max_size
+        self._fingerprints_path = make_path(self.cache_dir, self.fingerprints_name)
+        try:
+            with open(self._fingerprints_path) as f:
+                self._file_hashes = json.load(f)
+        except (OSError, ValueError):
+            self._file_hashes = {}
+
+    def key(self, inputs, **params):
+        """
+        Generate a cache key from analysis inputs and solver parameters.
+
+        Args:
+            inputs (str, list): [String, ...]; paths to the input datasets of the analysis
+            params: Solver parameters (cutoffs, restrictions, `NetLoader` objects, e.g.)
+
+        Returns:
+            str: hexadecimal key
+        """
+        if isinstance(inputs, string_types):
+            inputs = [inputs]
+        spec = {
+            "inputs": [self.fingerprint(in_data) for in_data in inputs],
+            "params": params,
+        }
+        spec = json.dumps(spec, sort_keys=True, default=self._param_value_)
+        self._save_file_hashes_()
+        return hashlib.sha1(spec.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _param_value_(value):
+        if hasattr(value, "__dict__"):
+            return {type(value).__name__: vars(value)}
+        return repr(value)
+
+    def fingerprint(self, in_data):
+        """
+        Generate a content hash for a file, folder, or geodatabase dataset.
+
+        Args:
+            in_data (str): Path to the dataset
+
+        Returns:
+            str: hexadecimal content hash
+        """
+        in_data = str(in_data)
+        if os.path.isfile(in_data):
+            base_dir = os.path.dirname(in_data)
+            if in_data.lower().endswith(".shp"):
+                stem = os.path.splitext(os.path.basename(in_data))[0]
+                files = [
+                    make_path(base_dir, f)
+                    for f in os.listdir(base_dir)
+                    if os.path.splitext(f)[0] == stem and not f.endswith(".lock")
+                ]
+            else:
+                files = [in_data]
+            return self._hash_files_(files, base_dir)
+        if os.path.isdir(in_data):
+            files = [
+                make_path(root, f)
+                for root, _, names in os.walk(in_data)
+                for f in names
+                if not f.endswith(".lock")
+            ]
+            return self._hash_files_(files, in_data)
+        if has_arcpy and arcpy.Exists(in_data):
+            desc = arcpy.Describe(in_data)
+            if desc.dataType in ["FeatureClass", "Table"]:
+                return self._hash_rows_(in_data, desc)
+        # hash other datasets (network datasets, feature datasets) by their workspace
+        workspace, name = os.path.split(in_data)
+        if not workspace or workspace == in_data:
+            raise ValueError(f"Cannot fingerprint {in_data}, dataset not found")
+        fp = f"{self.fingerprint(workspace)}/{name}"
+        return hashlib.sha1(fp.encode("utf-8")).hexdigest()
+
+    def _hash_file_(self, in_file):
+        stat = os.stat(in_file)
+        in_file = os.path.abspath(in_file)
+        memo = self._file_hashes.get(in_file)
+        if memo and memo[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return memo[2]
+        h = hashlib.sha1()
+        with open(in_file, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(block)
+        self._file_hashes[in_file] = [stat.st_size, stat.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def _hash_files_(self, files, base_dir):
+        h = hashlib.sha1()
+        for in_file in sorted(files):
+            rel_path = os.path.relpath(in_file, base_dir).replace(os.sep, "/")
+            h.update(f"{rel_path}:{self._hash_file_(in_file)};".encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def _hash_rows_(in_table, desc):
+        fields = [
+            f.name
+            for f in arcpy.ListFields(in_table)
+            if f.type not in ["OID", "Geometry", "Blob", "Raster"]
+        ]
+        h = hashlib.sha1(repr(sorted(fields)).encode("utf-8"))
+        if hasattr(desc, "shapeType"):
+            fields.append("SHAPE@WKB")
+            h.update(desc.spatialReference.exportToString().encode("utf-8"))
+        with arcpy.da.SearchCursor(in_table, fields) as c:
+            for row in c:
+                h.update(repr(row).encode("utf-8"))
+        return h.hexdigest()
+
+    def _save_file_hashes_(self):
+        with open(self._fingerprints_path, "w") as f:
+            json.dump(self._file_hashes, f)
+
+    def _entry_(self, key):
+        return make_path(self.cache_dir, key)
+
+    @staticmethod
+    def _file_stats_(path):
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            return [("", stat.st_size, stat.st_mtime_ns)]
+        stats = []
+        for root, _, names in os.walk(path):
+            for f in names:
+                stat = os.stat(make_path(root, f))
+                rel_path = os.path.relpath(make_path(root, f), path)
+                stats.append((rel_path, stat.st_size, stat.st_mtime_ns))
+        return sorted(stats)
+
+    @staticmethod
+    def _delete_(path):
+        if os.path.isfile(path):
+            os.remove(path)
+        elif os.path.isdir(path):
+            shutil.rmtree(path)
+        elif has_arcpy and arcpy.Exists(path):
+            arcpy.Delete_management(path)
+
+    def fetch(self, key, outputs):
+        """
+        Restore cached outputs for a cache key.
+
+        Args:
+            key (str): A key generated by `self.key`
+            outputs (str, list): [String, ...]; paths to which cached outputs are restored, in the
+                order in which they were stored. Existing outputs are overwritten.
+
+        Returns:
+            bool: True if the outputs were found and restored, False otherwise
+        """
+        if isinstance(outputs, string_types):
+            outputs = [outputs]
+        manifest = make_path(self._entry_(key), self.manifest_name)
+        if not os.path.isfile(manifest):
+            return False
+        with open(manifest) as f:
+            items = json.load(f)["outputs"]
+        if [item["name"] for item in items] != [os.path.basename(o) for o in outputs]:
+            return False
+        print(f"- restoring cached results ({key[:10]})")
+        for item, out_data in zip(items, outputs):
+            cached = make_path(self._entry_(key), item["path"])
+            print(f" - - {item['name']}")
+            if item["kind"] == "dataset":
+                self._delete_(out_data)
+                arcpy.Copy_management(cached, out_data)
+            elif not os.path.exists(out_data) or self._file_stats_(
+                    out_data
+            ) != self._file_stats_(cached):
+                self._delete_(out_data)
+                if item["kind"] == "file":
+                    shutil.copy2(cached, out_data)
+                else:
+                    shutil.copytree(cached, out_data)
+        # mark as recently used
+        os.utime(manifest)
+        return True
+
+    def store(self, key, outputs):
+        """
+        Copy analysis outputs to the cache, then evict least recently used entries if the
+        cache exceeds `self.max_size`.
+
+        Args:
+            key (str): A key generated by `self.key`
+            outputs (str, list): [String, ...]; paths to the outputs to cache (files, folders, or
+                geodatabase feature classes and tables)
+
+        Returns:
+            None
+        """
+        if isinstance(outputs, string_types):
+            outputs = [outputs]
+        entry = self._entry_(key)
+        temp_entry = f"{entry}_temp"
+        for path in [entry, temp_entry]:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+        os.makedirs(temp_entry)
+        items = []
+        for i, out_data in enumerate(outputs):
+            name = os.path.basename(out_data)
+            if os.path.isfile(out_data):
+                item = {"name": name, "kind": "file", "path": f"{i}_{name}"}
+                shutil.copy2(out_data, make_path(temp_entry, item["path"]))
+            elif os.path.isdir(out_data):
+                item = {"name": name, "kind": "folder", "path": f"{i}_{name}"}
+                shutil.copytree(out_data, make_path(temp_entry, item["path"]))
+            elif has_arcpy and arcpy.Exists(out_data):
+                item = {"name": name, "kind": "dataset", "path": make_path("outputs.gdb", f"_{i}_{name}")}
+                if not arcpy.Exists(make_path(temp_entry, "outputs.gdb")):
+                    arcpy.CreateFileGDB_management(temp_entry, "outputs.gdb")
+                arcpy.Copy_management(out_data, make_path(temp_entry, item["path"]))
+            else:
+                shutil.rmtree(temp_entry)
+                raise ValueError(f"Cannot cache {out_data}, output not found")
+            items.append(item)
+        size = sum(stat[1] for stat in self._file_stats_(temp_entry))
+        with open(make_path(temp_entry, self.manifest_name), "w") as f:
+            json.dump({"outputs": items, "size": size}, f)
+        os.rename(temp_entry, entry)
+        self.evict(keep=[key])
+
+    def evict(self, keep=None):
+        """
+        Delete least recently used cache entries until the cache size is within `self.max_size`.
+
+        Args:
+            keep (list, default=None): [String, ...]; keys of entries that should not be evicted
+
+        Returns:
+            None
+        """
+        keep = keep or []
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            manifest = make_path(self._entry_(key), self.manifest_name)
+            if os.path.isfile(manifest):
+                with open(manifest) as f:
+                    size = json.load(f)["size"]
+                entries.append((os.path.getmtime(manifest), size, key))
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            if key in keep:
+                continue
+            print(f"- evicting cached results ({key[:10]})")
+            shutil.rmtree(self._entry_(key))
+            total -= size
+
+
+class SkimMatrix:
+    """
+    A dense representation of a (nearly complete) square origin-destination skim. Zone id's
+    are mapped to row/column positions once, and each OD attribute (auto time, local and premium
+    transit time, trips, distance, e.g.) is stored as a 2-D "layer" array, so that zone-to-zone
+    calculations become array operations instead of merges on long OD tables.
+
+    Attributes:
+        zones (np.array): Sorted unique zone id's. The position of each id is its row (origin)
+            and column (destination) index in every layer.
+        dtype (np.dtype, default=np.float64): The data type of layer arrays. The default matches
+            calculations on long OD tables; np.float32 halves memory use at the cost of precision.
+        layers (dict): {name: np.array}; (n_zones x n_zones) arrays of OD values. Missing values are nan.
+        mask (np.array): (n_zones x n_zones) boolean array that is True for OD pairs loaded from
+            a long table.
+    """
+
+    def __init__(self, zones, dtype=np.float64):
+        self.zones = np.unique(zones)
+        self.dtype = dtype
+        self.layers = {}
+        n = len(self.zones)
+        self.mask = np.zeros((n, n), dtype=bool)
+
+    def zone_index(self, zone_ids):
+        """
+        Returns the row/column positions of the given zone id's.
+
+        args:
+            zone_ids (array-like): zone id's to look up
+
+        Raises:
+            KeyError: if any of `zone_ids` is not in `self.zones`
+        """
+        zone_ids = np.asarray(zone_ids)
+        idx = np.searchsorted(self.zones, zone_ids)
+        found = idx < len(self.zones)
+        found[found] = self.zones[idx[found]] == zone_ids[found]
+        if not found.all():
+            missing = np.unique(zone_ids[~found])
+            raise KeyError(f"{len(missing)} zone id's not found in skim matrix, e.g. {missing[:5]}")
+        return idx
+
+    def zone_vector(self, values, fill=0.0):
+        """
+        Aligns zone-level values (activities, e.g.) to `self.zones` for use in matrix-vector products.
+
+        args:
+            values (pd.Series or pd.DataFrame): values indexed by zone id
+            fill (numeric, default=0.0): value for zones missing from `values`
+
+        Returns:
+            np.array: (n_zones,) or (n_zones x n_columns) array
+        """
+        return values.reindex(self.zones, fill_value=fill).to_numpy(dtype=np.float64)
+
+    def add_layer(self, name, fill=np.nan):
+        """
+        Adds a new layer filled with a constant value.
+
+        args:
+            name (str): name of the new layer
+            fill (numeric, default=np.nan): initial value for all OD pairs
+
+        Returns:
+            np.array: the new layer
+        """
+        n = len(self.zones)
+        self.layers[name] = np.full((n, n), fill, dtype=self.dtype)
+        return self.layers[name]
+
+    def load_long(self, df, o_field, d_field, layers):
+        """
+        Loads values from a long OD table into layers, creating layers as needed. Later records
+        for the same OD pair replace earlier ones.
+
+        args:
+            df (pd.DataFrame): long OD table
+            o_field (str): origin zone field in `df`
+            d_field (str): destination zone field in `df`
+            layers (list or dict): columns in `df` to load. A list loads each column into a layer
+                of the same name; a dict maps layer names (keys) to columns (values).
+        """
+        if isinstance(layers, string_types):
+            layers = [layers]
+        if not isinstance(layers, dict):
+            layers = {col: col for col in layers}
+        o_idx = self.zone_index(df[o_field].values)
+        d_idx = self.zone_index(df[d_field].values)
+        for layer, col in layers.items():
+            if layer not in self.layers:
+                self.add_layer(layer)
+            self.layers[layer][o_idx, d_idx] = df[col].values
+        self.mask[o_idx, d_idx] = True
+
+    @classmethod
+    def from_long_tables(cls, tables, o_field, d_field, layers, zones=None, dtype=np.float64):
+        """
+        Creates a SkimMatrix from one or more long OD data frames (chunks of a skim table, e.g.).
+
+        args:
+            tables (iterable): pd.DataFrames of long OD data
+            o_field (str): origin zone field in `tables`
+            d_field (str): destination zone field in `tables`
+            layers (list or dict): see `load_long`
+            zones (array-like, default=None): zone id's to index. If None, zones are taken from
+                the origins and destinations in `tables` (which are then held in memory).
+            dtype (np.dtype, default=np.float64): see `SkimMatrix`
+
+        Returns:
+            SkimMatrix
+        """
+        if zones is None:
+            tables = list(tables)
+            zones = np.unique(
+                np.concatenate(
+                    [t[o_field].values for t in tables] + [t[d_field].values for t in tables]
+                )
+            )
+        skim = cls(zones, dtype=dtype)
+        for table in tables:
+            skim.load_long(table, o_field, d_field, layers)
+        return skim
+
+    @classmethod
+    def from_csv(
+            cls, csv_path, o_field, d_field, layers, zones=None, dtype=np.float64,
+            chunksize=100000, **kwargs
+    ):
+        """
+        Creates a SkimMatrix from a long OD table stored in a csv file (or a skim store).
+
+        args:
+            csv_path (str): path to a long OD table in csv format
+            o_field (str): origin zone field in `csv_path`
+            d_field (str): destination zone field in `csv_path`
+            layers (list or dict): see `load_long`
+            zones (array-like, default=None): zone id's to index. If None, a first pass
+                over the origin and destination columns collects zone id's.
+            dtype (np.dtype, default=np.float64): see `SkimMatrix`
+            chunksize (int, default=100000): number of rows to read at a time
+            kwargs: keyword arguments passed to `pd.read_csv`
+
+        Returns:
+            SkimMatrix
+
+        See Also:
+            prepare_helpers.skim_to_matrix
+        """
+        # imported here, as prepare_helpers imports this module
+        from PMT_tools.prepare.prepare_helpers import skim_to_matrix
+
+        return skim_to_matrix(
+            csv_path, o_field, d_field, layers, zones=zones, dtype=dtype,
+            chunksize=chunksize, **kwargs
+        )
+
+    def replace(self, replace_vals, layers=None):
+        """
+        Replaces values in layers, like `pd.DataFrame.replace` with a dict.
+
+        args:
+            replace_vals (dict): keys are values to replace, values are replacements
+            layers (list, default=None): layers to update. If None, all layers are updated.
+        """
+        if layers is None:
+            layers = list(self.layers.keys())
+        for layer in layers:
+            arr = self.layers[layer]
+            hits = [(arr == old, new) for old, new in replace_vals.items()]
+            for hit, new in hits:
+                arr[hit] = new
+
+    def layer_min(self, out_layer, competing_layers):
+        """
+        Sets `out_layer` to the elementwise minimum of `competing_layers`, ignoring nan values
+        (as `pd.DataFrame.min(axis=1)` does). Combined with `replace`, this reproduces
+        `prepare_helpers.update_transit_times`.
+
+        args:
+            out_layer (str): layer to create or overwrite
+            competing_layers (list): layers to compare
+
+        Returns:
+            np.array: `out_layer`
+        """
+        self.layers[out_layer] = reduce(
+            np.fmin, [self.layers[layer] for layer in competing_layers]
+        ).astype(self.dtype)
+        return self.layers[out_layer]
+
+    def reach(self, layer, values, low=-np.inf, high=np.inf, by="O"):
+        """
+        Sums zone-level values over OD pairs whose `layer` value is in [`low`, `high`) as a
+        matrix-vector product (jobs reachable from each origin within 30 minutes, e.g.).
+
+        args:
+            layer (str): the impedance layer to test
+            values (np.array): (n_zones,) or (n_zones x k) values aligned to `self.zones`
+                (see `zone_vector`)
+            low (numeric, default=-np.inf): inclusive lower impedance bound
+            high (numeric, default=np.inf): exclusive upper impedance bound
+            by (str, default="O"): "O" sums destination values for each origin;
+                "D" sums origin values for each destination.
+
+        Returns:
+            np.array: sums aligned to `self.zones`
+        """
+        arr = self.layers[layer]
+        within = np.logical_and(arr >= low, arr < high).astype(np.float64)
+        if by == "O":
+            return within @ values
+        elif by == "D":
+            return within.T @ values
+        raise ValueError(f"Expected 'O' or 'D' as `by` value - got {by}")
+
+    def to_long(self, layers=None, o_field="OName", d_field="DName", loaded_only=True):
+        """
+        Exports layers as a long OD table.
+
+        args:
+            layers (list, default=None): layers to export. If None, all layers are exported.
+            o_field (str, default="OName"): name of the origin column
+            d_field (str, default="DName"): name of the destination column
+            loaded_only (bool, default=True): if True, only OD pairs loaded from long tables
+                (see `mask`) are exported; otherwise all zone pairs are exported.
+
+        Returns:
+            pd.DataFrame: long OD table sorted by origin and destination
+        """
+        if layers is None:
+            layers = list(self.layers.keys())
+        if loaded_only:
+            o_idx, d_idx = np.nonzero(self.mask)
+        else:
+            n = len(self.zones)
+            o_idx, d_idx = np.divmod(np.arange(n * n), n)
+        out = {o_field: self.zones[o_idx], d_field: self.zones[d_idx]}
+        for layer in layers:
+            out[layer] = self.layers[layer][o_idx, d_idx]
+        return pd.DataFrame(out)
+
+
 # %% FUNCTIONS
 def make_inmem_path(file_name=None):
     """Generates an in_memory path usable by arcpy that is unique to avoid any overlapping names. If a file_name is
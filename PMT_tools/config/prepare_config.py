@@ -648,6 +648,11 @@ SKIM_O_FIELD = "OName"
 SKIM_D_FIELD = "DName"
 SKIM_RENAMES = {"F_TAZ": SKIM_O_FIELD, "T_TAZ": SKIM_D_FIELD, "TOTTIME": SKIM_IMP_FIELD}
 SKIM_DTYPES = {"F_TAZ": int, "T_TAZ": int, SKIM_IMP_FIELD: float, "TOTTIME": float}
+# - OD table storage: skim stores are folders of memory-mapped binary columns (see
+#   prepare_helpers.df_to_skim_store); set SKIM_EXT = SKIM_STORE_EXT to write SERPM and
+#   OSM skims as stores instead of csv tables
+SKIM_STORE_EXT = ".skim"
+SKIM_EXT = ".csv"
 
 # - MAZ aggregation specs
 MAZ_AGG_COLS = [
@@ -768,6 +773,22 @@ OSM_IMPED = "Minutes"
 OSM_CUTOFF = "15 30"
 BIKE_RESTRICTIONS = "Oneway;IsCycleway;LTS1;LTS2;LTS3;LTS4"
 BIKE_PED_CUTOFF = 60
+# network graph settings for the pure-python network engine (`prepare_helpers.osm_od_table`),
+#   mirroring the network dataset templates (ref//osm_{mode}_template.xml)
+OSM_GRAPH_SPEEDS = {"walk": 80, "bike": 215}  # meters per minute
+OSM_CYCLEWAY_FACTOR = 1.25  # bike speed multiplier on cycleways
+OSM_RESTRICTION_USAGE = {  # -1 prohibits travel, other values scale edge costs
+    "Oneway": -1,
+    "IsCycleway": 0.2,
+    "LTS1": 5,
+    "LTS2": 2,
+    "LTS3": 0.8,
+    "LTS4": 0.5,
+}
+# network analysis results are cached in CLEANED//{NET_CACHE_DIR}; least recently used
+#   results are evicted when the cache exceeds NET_CACHE_MAX_SIZE (bytes)
+NET_CACHE_DIR = "net_cache"
+NET_CACHE_MAX_SIZE = 50 * 1024 ** 3
 
 # centrality config
 CENTRALITY_IMPED = "Length"
@@ -784,25 +805,32 @@ CENTRALITY_NET_LOADER = NetLoader(
 )
 
 # walk times config
-TIME_BIN_CODE_BLOCK = """
-def assignBin(value):
-    if value is None:
-        return ""
-    elif value <= 5:
-        return "0 to 5 minutes"
-    elif value <= 10:
-        return "5 to 10 minutes"
-    elif value <= 15:
-        return "10 to 15 minutes"
-    elif value <= 20:
-        return "15 to 20 minutes"
-    elif value <= 25:
-        return "20 to 25 minutes"
-    elif value <= 30:
-        return "25 to 30 minutes"
-    else:
-        return "over 30 minutes"
-"""
+# walk time bins as break points and labels (see `prepare_helpers.walk_time_bins`): a time is
+#   assigned the label of the first break it does not exceed, times beyond the last break get the
+#   last label, and missing times get an empty string
+TIME_BIN_BREAKS = [5, 10, 15, 20, 25, 30]
+TIME_BIN_LABELS = [
+    "0 to 5 minutes",
+    "5 to 10 minutes",
+    "10 to 15 minutes",
+    "15 to 20 minutes",
+    "20 to 25 minutes",
+    "25 to 30 minutes",
+    "over 30 minutes",
+]
+# the same bins as a field calculator code block, generated from the breaks and labels
+TIME_BIN_CODE_BLOCK = (
+    "\ndef assignBin(value):\n"
+    "    if value is None:\n"
+    '        return ""\n'
+    + "".join(
+        f"    elif value <= {brk}:\n"
+        f'        return "{label}"\n'
+        for brk, label in zip(TIME_BIN_BREAKS, TIME_BIN_LABELS)
+    )
+    + "    else:\n"
+    f'        return "{TIME_BIN_LABELS[-1]}"\n'
+)
 IDEAL_WALK_MPH = 3.0
 IDEAL_WALK_RADIUS = "7920 Feet"
 
@@ -826,7 +854,9 @@ Configuration variables to be used in contiguity + developable area
 
 # will use YEAR_GDB_FORMAT for parcels_path
 # will use PARCEL_COMMON_KEY for parcels_id_field
-CTGY_CHUNKS = 20
+CTGY_CHUNKS = 20  # number of tiles (quadrats) contiguity is scored in
+CTGY_WORKERS = 1  # number of processes scoring contiguity tiles
+CTGY_RASTERIZER = "arcpy"  # "arcpy" or "numpy" (rasterize tiles without arcpy)
 CTGY_CELL_SIZE = 40
 CTGY_WEIGHTS = "nn"
 CTGY_SAVE_FULL = False  # should the table of sub-polygon results be saved to?
@@ -854,6 +884,7 @@ DIV_RELEVANT_LAND_USES = [
     "sf",
     "shopping",
 ]
+DIV_FLOATING_ZONE = None  # e.g. "2640 Feet"; if set, parcel floating zone diversity is also calculated
 # DIV_CHISQ_PROPS = None
 # DIV_REGIONAL_ADJ = True
 # DIV_REGIONAL_CONSTS = None
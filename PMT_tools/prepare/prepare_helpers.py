@@ -5,19 +5,31 @@ and parameterized than the purpose-built methods in `preparer`.
 """
 import csv
 import fnmatch
+import hashlib
 import json
+import pickle
 import re
+import shutil
 import tempfile
 import zipfile
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import time
 from functools import reduce
+from itertools import chain
 from json.decoder import JSONDecodeError
 import os
 
 import dask.dataframe as dd
+import geopandas as gpd
+from dask import delayed
 import networkx as nx
 import scipy
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
+from shapely import wkb
+from shapely.geometry import LineString
 import xlrd
 from six import string_types
 from sklearn import linear_model
@@ -40,6 +52,13 @@ __all__ = [
     "split_date",
     "add_xy_from_poly",
     "clean_and_drop",
+    "is_skim_store",
+    "df_to_skim_store",
+    "read_skim",
+    "iter_skim_chunks",
+    "write_skim_chunk",
+    "csv_to_skim_store",
+    "skim_to_matrix",
     "combine_csv_dask",
     "update_transit_times",
     "make_basic_features",
@@ -56,6 +75,7 @@ __all__ = [
     "clean_parcel_geometry",
     "prep_parcel_land_use_tbl",
     "enrich_bg_with_parcels",
+    "polygon_point_pairs",
     "enrich_bg_with_parcels",
     "get_field_dtype",
     "enrich_bg_with_econ_demog",
@@ -64,9 +84,15 @@ __all__ = [
     "prep_imperviousness",
     "analyze_imperviousness",
     "agg_to_zone",
+    "load_blockgroup_panel",
     "model_blockgroup_data",
     "apply_blockgroup_model",
+    "apply_blockgroup_models",
+    "share_matrix",
     "allocate_bg_to_parcels",
+    "allocate_bg_to_parcels_by_year",
+    "activity_lu_matrix",
+    "allocate_activities",
     "estimate_maz_from_parcels",
     "consolidate_cols",
     "patch_local_regional_maz",
@@ -74,9 +100,13 @@ __all__ = [
     "lines_to_centrality",
     "network_centrality",
     "parcel_walk_time_bin",
+    "walk_time_bins",
     "parcel_walk_times",
     "parcel_ideal_walk_time",
+    "parcel_network_walk_times",
+    "access_bin_sums",
     "summarize_access",
+    "summarize_access_by_year",
     "generate_od_table",
     "taz_travel_stats",
     "generate_chunking_fishnet",
@@ -84,20 +114,36 @@ __all__ = [
     "merge_and_subset",
     "get_filename",
     "validate_weights",
+    "contiguity_kernel",
+    "contiguity_tile_counts",
+    "contiguity_from_counts",
+    "contiguity_tiles",
+    "rasterize_polygons",
     "calculate_contiguity_index",
     "calculate_contiguity_summary",
+    "diversity_indices",
     "simpson_diversity",
     "shannon_diversity",
     "berger_parker_diversity",
     "enp_diversity",
     "assign_features_to_agg_area",
     "lu_diversity",
+    "floating_zone_diversity",
     "match_units_fields",
     "create_permits_units_reference",
     "build_short_term_parcels",
     "clean_skim_csv",
     "skim_to_graph",
     "transit_skim_joins",
+    "full_skim",
+    "skims_to_csr",
+    "full_skim_csr",
+    "osm_to_csr",
+    "snap_to_nodes",
+    "nearest_feature_join",
+    "ideal_walk_times",
+    "osm_od_table",
+    "network_centrality_csr",
 ]
 
 
@@ -319,6 +365,341 @@ def clean_and_drop(feature_class, use_cols=None, rename_dict=None):
             )
 
 
+# skim storage functions
+def is_skim_store(path):
+    """
+    Test if a path refers to a binary skim store rather than a csv table. Skim stores are
+    folders named with the `SKIM_STORE_EXT` extension (see `df_to_skim_store`).
+
+    Args:
+        path (str): path to a long OD table
+
+    Returns:
+        bool
+    """
+    return os.path.splitext(str(path))[1].lower() == p_conf.SKIM_STORE_EXT
+
+
+def _read_skim_manifest_(store):
+    """
+    Internal helper to read the manifest of a skim store
+
+    See Also: df_to_skim_store
+    """
+    with open(os.path.join(store, "manifest.json")) as f:
+        return json.load(f)
+
+
+# csv text-formatting options that have no meaning for binary columns; accepted and ignored by
+#   skim store readers so that the same kwargs can be passed for csv tables and skim stores
+_CSV_FORMAT_KWARGS_ = {
+    "sep", "delimiter", "thousands", "decimal", "encoding", "quotechar", "escapechar",
+    "low_memory", "engine", "memory_map", "float_precision",
+}
+
+
+def _check_skim_store_kwargs_(store, kwargs, supported=("dtype",)):
+    """
+    Internal helper to reject `pd.read_csv` keyword arguments that skim store readers cannot honor
+
+    Raises:
+        ValueError: if `kwargs` has keys other than `supported` or csv formatting options
+    """
+    unsupported = sorted(set(kwargs) - set(supported) - _CSV_FORMAT_KWARGS_)
+    if unsupported:
+        raise ValueError(f"Arguments not supported when reading skim store {store}: {unsupported}")
+
+
+def _map_skim_store_(store):
+    """
+    Internal helper to memory-map every column in a skim store. No data are read from disk
+    until the returned arrays are sliced and copied.
+
+    Returns:
+        arrays (dict): {column: np.memmap}
+        n_rows (int): number of rows in the store
+    """
+    manifest = _read_skim_manifest_(store)
+    n_rows = manifest["rows"]
+    arrays = {}
+    for i, (col, dtype) in enumerate(zip(manifest["columns"], manifest["dtypes"])):
+        if n_rows:
+            arrays[col] = np.memmap(
+                os.path.join(store, f"col_{i}.bin"), dtype=dtype, mode="r", shape=(n_rows,)
+            )
+        else:
+            arrays[col] = np.empty(0, dtype=dtype)
+    return arrays, n_rows
+
+
+def df_to_skim_store(df, out_store, mode="w"):
+    """
+    Writes a long OD table to a binary skim store: a folder holding one raw binary file per
+    column and a json manifest of column names, dtypes and row count. Columns are memory-mapped
+    when read, so loading is limited by disk bandwidth rather than csv parsing.
+
+    Only numeric columns are stored. Text columns that hold numbers (OD names split from
+    Network Analyst outputs, e.g.) are converted; other text columns (such as "Name") are dropped.
+    The data frame index is not stored.
+
+    Args:
+        df (pd.DataFrame): long OD table
+        out_store (str): path to the skim store folder to create or extend (see `is_skim_store`)
+        mode (str, default="w"): "w" creates a new store, replacing any existing one; "a" appends
+            rows to an existing store. Stored columns are promoted (`np.result_type`) when appended
+            values do not fit their dtype, e.g. fractional or missing values in an integer column.
+
+    Raises:
+        ValueError: if an appended column cannot be stored as a numeric dtype
+
+    Returns:
+        out_store (str)
+    """
+    if mode == "a" and os.path.exists(out_store):
+        manifest = _read_skim_manifest_(out_store)
+    else:
+        if os.path.exists(out_store):
+            shutil.rmtree(out_store)
+        os.makedirs(out_store)
+        manifest = {"columns": [], "dtypes": [], "rows": 0}
+        for col in df.columns:
+            values = df[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                try:
+                    values = pd.to_numeric(values)
+                except (ValueError, TypeError):
+                    continue
+            manifest["columns"].append(str(col))
+            manifest["dtypes"].append(values.to_numpy().dtype.str)
+    for i, (col, dtype) in enumerate(zip(manifest["columns"], manifest["dtypes"])):
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values)
+        values = values.to_numpy()
+        col_path = os.path.join(out_store, f"col_{i}.bin")
+        new_dtype = np.result_type(np.dtype(dtype), values.dtype)
+        if new_dtype.kind not in "biuf":
+            raise ValueError(
+                f"Column {col} of dtype {values.dtype} cannot be stored in skim store {out_store}"
+            )
+        if new_dtype != np.dtype(dtype):
+            # promote the stored column (int64 -> float64 when NaN's appear, e.g.) so no values
+            #   are truncated by the cast
+            if manifest["rows"]:
+                stored = np.fromfile(col_path, dtype=dtype).astype(new_dtype)
+                stored.tofile(col_path)
+            manifest["dtypes"][i] = new_dtype.str
+        with open(col_path, "ab") as f:
+            np.ascontiguousarray(values, dtype=new_dtype).tofile(f)
+    manifest["rows"] += len(df)
+    with open(os.path.join(out_store, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+    return out_store
+
+
+def _skim_store_frame_(arrays, n_rows, usecols=None, rows=None, filters=None, dtype=None):
+    """
+    Internal helper to build a data frame from memory-mapped skim store columns, reading
+    only the requested columns and rows.
+
+    See Also: read_skim
+    """
+    if usecols is None:
+        usecols = list(arrays.keys())
+    missing = [c for c in list(usecols) + list(filters or {}) if c not in arrays]
+    if missing:
+        raise ValueError(f"Columns not found in skim store: {missing}")
+    if rows is None:
+        rows = slice(0, n_rows)
+    index = pd.RangeIndex(n_rows)[rows]
+    mask = None
+    for col, values in (filters or {}).items():
+        col_mask = np.isin(arrays[col][rows], values)
+        mask = col_mask if mask is None else mask & col_mask
+    if mask is not None:
+        index = index[mask]
+    df = pd.DataFrame(
+        {
+            c: np.array(arrays[c][rows] if mask is None else arrays[c][rows][mask])
+            for c in arrays
+            if c in usecols
+        },
+        index=index,
+    )
+    if dtype:
+        df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+    return df
+
+
+def read_skim(skim_table, usecols=None, rows=None, filters=None, **kwargs):
+    """
+    Reads a long OD table from a csv or a binary skim store into a data frame.
+
+    Args:
+        skim_table (str): Path to a csv table or skim store (see `is_skim_store`)
+        usecols (list, default=None): Columns to read. If None, all columns are read.
+        rows (slice, default=None): A contiguous range of rows to read, e.g. `slice(0, 100000)`. Skim
+            stores read only this range from disk.
+        filters (dict, default=None): {column: values}; only rows whose value in each column is
+            among `values` are returned. Skim stores scan only the filter columns to find them.
+        kwargs: Keyword arguments passed to `pd.read_csv` when `skim_table` is a csv. For skim
+            stores only `dtype` is honored; csv formatting options (`thousands`, `sep`, ...) are
+            ignored and any other argument raises ValueError.
+
+    Returns:
+        pd.DataFrame: rows keep their position in `skim_table` as the index
+    """
+    if is_skim_store(skim_table):
+        _check_skim_store_kwargs_(skim_table, kwargs)
+        arrays, n_rows = _map_skim_store_(skim_table)
+        return _skim_store_frame_(
+            arrays, n_rows, usecols, rows, filters, dtype=kwargs.get("dtype")
+        )
+    read_cols = usecols
+    if usecols is not None and filters:
+        read_cols = list(usecols) + [c for c in filters if c not in usecols]
+    if rows is not None:
+        start = rows.start or 0
+        kwargs["skiprows"] = range(1, start + 1)
+        kwargs["nrows"] = None if rows.stop is None else rows.stop - start
+    df = pd.read_csv(skim_table, usecols=read_cols, **kwargs)
+    if rows is not None:
+        df.index += start
+    for col, values in (filters or {}).items():
+        df = df[df[col].isin(values)]
+    if read_cols is not usecols:
+        df = df[[c for c in df.columns if c in usecols]]
+    return df
+
+
+def iter_skim_chunks(skim_table, usecols=None, chunksize=100000, **kwargs):
+    """
+    Iterates over a long OD table in a csv or binary skim store in chunks of rows.
+
+    Args:
+        skim_table (str): Path to a csv table or skim store (see `is_skim_store`)
+        usecols (list, default=None): Columns to read. If None, all columns are read.
+        chunksize (int, default=100000): Number of rows in each chunk
+        kwargs: Keyword arguments passed to `pd.read_csv` when `skim_table` is a csv. For skim
+            stores only `dtype` is honored; csv formatting options (`thousands`, `sep`, ...) are
+            ignored and any other argument raises ValueError.
+
+    Yields:
+        pd.DataFrame: chunks indexed by row position in `skim_table`, as with `pd.read_csv`
+    """
+    if is_skim_store(skim_table):
+        _check_skim_store_kwargs_(skim_table, kwargs)
+        arrays, n_rows = _map_skim_store_(skim_table)
+        for start in range(0, n_rows, chunksize):
+            yield _skim_store_frame_(
+                arrays,
+                n_rows,
+                usecols,
+                rows=slice(start, start + chunksize),
+                dtype=kwargs.get("dtype"),
+            )
+    else:
+        for chunk in pd.read_csv(
+                skim_table, usecols=usecols, chunksize=chunksize, **kwargs
+        ):
+            yield chunk
+
+
+def write_skim_chunk(df, out_table, mode="w", **kwargs):
+    """
+    Writes (or appends) a chunk of a long OD table to a csv or a binary skim store. A header is
+    written to csv tables only when `mode` is "w".
+
+    Args:
+        df (pd.DataFrame): long OD table chunk
+        out_table (str): Path to a csv table or skim store (see `is_skim_store`)
+        mode (str, default="w"): "w" to create `out_table`, "a" to append to it
+        kwargs: Keyword arguments passed to `pd.DataFrame.to_csv` when `out_table` is a csv
+
+    Returns:
+        out_table (str)
+    """
+    if is_skim_store(out_table):
+        df_to_skim_store(df, out_table, mode=mode)
+    else:
+        df.to_csv(out_table, mode=mode, header=(mode == "w"), **kwargs)
+    return out_table
+
+
+def csv_to_skim_store(in_csv, out_store, usecols=None, chunksize=100000, **kwargs):
+    """
+    Converts a long OD table in csv format to a binary skim store, reading the csv in chunks.
+
+    Args:
+        in_csv (str): Path to a long OD table in csv format
+        out_store (str): Path to the skim store to create (see `is_skim_store`)
+        usecols (list, default=None): Columns to keep. If None, all numeric columns are kept.
+        chunksize (int, default=100000): Number of rows to process at a time
+        kwargs: Keyword arguments passed to `pd.read_csv`
+
+    Returns:
+        out_store (str)
+    """
+    mode = "w"
+    for chunk in iter_skim_chunks(in_csv, usecols=usecols, chunksize=chunksize, **kwargs):
+        df_to_skim_store(chunk, out_store, mode=mode)
+        mode = "a"
+    return out_store
+
+
+def skim_to_matrix(
+        skim_table, o_field, d_field, layers, zones=None, dtype=np.float64, chunksize=100000, **kwargs
+):
+    """
+    Loads a long OD table (csv or skim store) into a dense `PMT.SkimMatrix`.
+
+    Args:
+        skim_table (str): Path to a csv table or skim store (see `is_skim_store`)
+        o_field (str): Origin zone field
+        d_field (str): Destination zone field
+        layers (list or dict): Columns to load as matrix layers (see `PMT.SkimMatrix.load_long`)
+        zones (array-like, default=None): Zone id's to index. If None, a first pass over
+            `o_field` and `d_field` collects the zone id's found in `skim_table`.
+        dtype (np.dtype, default=np.float64): Data type of matrix layers (see `PMT.SkimMatrix`)
+        chunksize (int, default=100000): Number of rows to read at a time
+        kwargs: Keyword arguments passed to `read_skim`/`iter_skim_chunks`
+
+    Returns:
+        PMT.SkimMatrix
+    """
+    if zones is None:
+        zones = np.unique(read_skim(skim_table, usecols=[o_field, d_field], **kwargs).values)
+    chunks = iter_skim_chunks(skim_table, chunksize=chunksize, **kwargs)
+    return PMT.SkimMatrix.from_long_tables(
+        chunks, o_field, d_field, layers, zones=zones, dtype=dtype
+    )
+
+
+def _skim_to_dask_(skim_table, chunksize=1000000, **kwargs):
+    """
+    Internal helper to open a csv table or skim store as a dask data frame. Skim stores are
+    partitioned into ranges of `chunksize` rows that are read lazily.
+
+    See Also: combine_csv_dask
+    """
+    if not is_skim_store(skim_table):
+        return dd.read_csv(skim_table, **kwargs)
+    _check_skim_store_kwargs_(skim_table, kwargs, supported=("usecols", "dtype"))
+    usecols = kwargs.get("usecols")
+    dtype = kwargs.get("dtype")
+    n_rows = _read_skim_manifest_(skim_table)["rows"]
+    meta = read_skim(skim_table, usecols=usecols, rows=slice(0, 0), dtype=dtype)
+    parts = [
+        delayed(read_skim)(
+            skim_table, usecols=usecols, rows=slice(start, start + chunksize), dtype=dtype
+        )
+        for start in range(0, n_rows, chunksize)
+    ]
+    if not parts:
+        return dd.from_pandas(meta, npartitions=1)
+    return dd.from_delayed(parts, meta=meta)
+
+
 def _merge_df_(x_specs, y_specs, on=None, how="inner", **kwargs):
     """
     Internal helper function when using dask frames
@@ -362,9 +743,12 @@ def combine_csv_dask(
             with `nan` values for unmatched pairs in any table.
         kwargs:
             Any keyword arguments are passed to the dask dataframes `read_csv` method.
+
+    Notes:
+        `out_table` and any of the `tables` may be binary skim stores (see `is_skim_store`).
     """
     # Read csvs
-    ddfs = [dd.read_csv(t, **kwargs) for t in tables]
+    ddfs = [_skim_to_dask_(t, **kwargs) for t in tables]
     # Rename
     if col_renames:
         ddfs = [ddf.rename(columns=col_renames) for ddf in ddfs]
@@ -398,9 +782,15 @@ def combine_csv_dask(
         df, _ = reduce(
             lambda this, next: _merge_df_(this, next, on=merge_fields, how=how), specs
         )
-    df.to_csv(
-        out_table, single_file=True, index=False, header_first_partition_only=True
-    )
+    if is_skim_store(out_table):
+        mode = "w"
+        for part in df.to_delayed():
+            df_to_skim_store(part.compute(), out_table, mode=mode)
+            mode = "a"
+    else:
+        df.to_csv(
+            out_table, single_file=True, index=False, header_first_partition_only=True
+        )
 
 
 def update_transit_times(
@@ -417,8 +807,8 @@ def update_transit_times(
     between origin-destination pairs as indicated by the provided parameters.
 
     Args:
-        od_table (str): path to a csv of OD data that includes transit travel time estimates
-        out_table (str): path to the new output csv table containing updated values
+        od_table (str): path to a csv or skim store of OD data that includes transit travel time estimates
+        out_table (str): path to the new output csv table or skim store containing updated values
         competing_cols (list, default=[]): The minimum value among competing columns will be
             written to `out_col`
         out_col (str, default=None): A new column to be populated with updated transit travel time
@@ -442,15 +832,13 @@ def update_transit_times(
         )
     # Iterate over chunks
     mode = "w"
-    header = True
-    for chunk in pd.read_csv(od_table, chunksize=chunksize, **kwargs):
+    for chunk in iter_skim_chunks(od_table, chunksize=chunksize, **kwargs):
         if replace_vals:
             chunk = chunk.replace(replace_vals)
         if competing_cols:
             chunk[out_col] = chunk[competing_cols].min(axis=1)
-        chunk.to_csv(out_table, mode=mode, header=header)
+        write_skim_chunk(chunk, out_table, mode=mode)
         mode = "a"
-        header = False
 
 
 # basic features functions
@@ -1359,6 +1747,7 @@ def enrich_bg_with_parcels(
         par_lu_field=None,
         par_bld_area=None,
         par_sum_fields=None,
+        engine="arcpy",
 ):
     """
     Relates parcels to block groups based on parcel centroid location and summarizes
@@ -1380,6 +1769,10 @@ def enrich_bg_with_parcels(
         par_id_field (str): parcel primary key attribute, default="PARCELNO"
         par_lu_field (str): parcel land use attribute, default="DOR_UC"
         par_bld_area (str): parcel building area attribute, default="TOT_LVG_AREA"
+        engine (str, default="arcpy"): "arcpy" selects the parcels in each block group in turn
+            (`SelectLayerByLocation`); "bulk" reads parcel centroids and block group polygons once,
+            assigns all parcels to block groups with a vectorized point-in-polygon test, and
+            summarizes all block groups in a single groupby.
     Returns:
         bg_df (pd.DataFrame): DataFrame of block group ids and related/summarized parcel data
     """
@@ -1405,13 +1798,30 @@ def enrich_bg_with_parcels(
         sum_crit = {}
     # PMT.checkOverwriteOutput(output=out_tbl, overwrite=overwrite)
     sr = arcpy.Describe(parcels_fc).spatialReference
-
-    # Make parcel feature layer
-    parcel_fl = arcpy.MakeFeatureLayer_management(parcels_fc, "__parcels__")
     par_fields = [par_id_field, par_lu_field, par_bld_area]
     if isinstance(par_sum_fields, string_types):
         par_sum_fields = [par_sum_fields]
     par_fields += [psf for psf in par_sum_fields if psf not in par_fields]
+    # Compile land use criteria to a lookup table
+    crit_table = PMT.CriteriaTable(sum_crit)
+    if engine == "bulk":
+        return _enrich_bg_with_parcels_bulk_(
+            bg_fc=bg_fc,
+            parcels_fc=parcels_fc,
+            sr=sr,
+            crit_table=crit_table,
+            bg_id_field=bg_id_field,
+            par_id_field=par_id_field,
+            par_lu_field=par_lu_field,
+            par_bld_area=par_bld_area,
+            par_fields=par_fields,
+            par_sum_fields=par_sum_fields,
+        )
+    elif engine != "arcpy":
+        raise ValueError(f"Expected engine to be one of ['arcpy', 'bulk'] - got {engine}")
+
+    # Make parcel feature layer
+    parcel_fl = arcpy.MakeFeatureLayer_management(parcels_fc, "__parcels__")
 
     try:
         # Iterate over bg features
@@ -1441,10 +1851,10 @@ def enrich_bg_with_parcels(
                 bg_grp_fields = [bg_id_field] + par_sum_fields
                 bg_sum = par_sum[bg_grp_fields].groupby(bg_id_field).sum()
                 # Select and summarize new fields
-                for grouping in sum_crit.keys():
+                crit_masks = crit_table.eval(par_df[par_lu_field])
+                for k, grouping in enumerate(crit_table.names):
                     # Mask based on land use criteria
-                    crit = PMT.Or(par_df[par_lu_field], sum_crit[grouping])
-                    mask = crit.eval()
+                    mask = crit_masks[:, k]
                     # Summarize masked data
                     #  - Parcel means (to account for multi-poly's)
                     area = par_df[mask].groupby([par_id_field]).mean()[par_bld_area]
@@ -1467,6 +1877,125 @@ def enrich_bg_with_parcels(
         arcpy.Delete_management(parcel_fl)
 
 
+def _points_in_polygon_(polygon, x, y):
+    """
+    Internal helper to flag points (coordinate arrays) within or on the boundary of a polygon
+
+    See Also: polygon_point_pairs
+    """
+    try:
+        from shapely import intersects_xy
+    except ImportError:  # shapely < 2.0
+        from shapely.vectorized import contains, touches
+
+        return contains(polygon, x, y) | touches(polygon, x, y)
+    return intersects_xy(polygon, x, y)
+
+
+def polygon_point_pairs(polygons, xy):
+    """
+    Relates points to the polygons they fall within (or on the boundary of). Candidate points are
+    found from each polygon's bounding box using points sorted by x coordinate, then tested
+    against the polygon in one vectorized point-in-polygon call.
+
+    Args:
+        polygons (list): shapely polygons
+        xy (np.array): (n x 2) point coordinates; points with missing coordinates are not related
+
+    Returns:
+        poly_pos, point_pos (np.array): positions in `polygons` and `xy` of each related polygon
+            and point; pairs are ordered by polygon, then point. Points on shared boundaries
+            are related to every polygon they touch.
+    """
+    xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+    located = np.flatnonzero(np.isfinite(xy).all(axis=1))
+    order = located[np.argsort(xy[located, 0], kind="stable")]
+    xs = xy[order, 0]
+    poly_pos = []
+    point_pos = []
+    for i, polygon in enumerate(polygons):
+        if polygon is None or polygon.is_empty:
+            continue
+        xmin, ymin, xmax, ymax = polygon.bounds
+        lo = np.searchsorted(xs, xmin, side="left")
+        hi = np.searchsorted(xs, xmax, side="right")
+        cand = order[lo:hi]
+        cand = cand[(xy[cand, 1] >= ymin) & (xy[cand, 1] <= ymax)]
+        if len(cand) == 0:
+            continue
+        hits = np.sort(cand[_points_in_polygon_(polygon, xy[cand, 0], xy[cand, 1])])
+        poly_pos.append(np.full(len(hits), i, dtype=np.int64))
+        point_pos.append(hits)
+    if not poly_pos:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    return np.concatenate(poly_pos), np.concatenate(point_pos)
+
+
+def _enrich_bg_with_parcels_bulk_(
+        bg_fc,
+        parcels_fc,
+        sr,
+        crit_table,
+        bg_id_field,
+        par_id_field,
+        par_lu_field,
+        par_bld_area,
+        par_fields,
+        par_sum_fields,
+):
+    """
+    Internal helper to relate parcels to block groups by centroid and summarize parcel fields for
+        all block groups at once
+
+    See Also: enrich_bg_with_parcels
+    """
+    print("--- reading block group and parcel features")
+    bg_ids = []
+    bg_polys = []
+    with arcpy.da.SearchCursor(
+            bg_fc, ["SHAPE@WKB", bg_id_field], spatial_reference=sr
+    ) as bgc:
+        for bg_wkb, bg_id in bgc:
+            bg_ids.append(bg_id)
+            bg_polys.append(None if bg_wkb is None else wkb.loads(bytes(bg_wkb)))
+    par_df = pd.DataFrame(
+        arcpy.da.FeatureClassToNumPyArray(
+            parcels_fc,
+            par_fields + ["SHAPE@X", "SHAPE@Y"],
+            spatial_reference=sr,
+            null_value=0,
+        )
+    )
+
+    print("--- relating parcels to block group features")
+    bg_pos, par_pos = polygon_point_pairs(
+        bg_polys, par_df[["SHAPE@X", "SHAPE@Y"]].values
+    )
+    par_df = par_df.iloc[par_pos].reset_index(drop=True)
+    par_df["_BG_POS_"] = bg_pos
+    empty = np.setdiff1d(np.arange(len(bg_ids)), bg_pos)
+    for pos in empty:
+        print(f"---  --- no parcels found for BG {bg_ids[pos]}")
+
+    print("--- summarizing parcels by block group")
+    # Get mean parcel values (for multi-part parcels), then summarize totals to BG level
+    grp_fields = ["_BG_POS_", par_id_field]
+    par_sum = par_df.groupby(grp_fields)[par_sum_fields].mean()
+    bg_sum = par_sum.groupby(level="_BG_POS_").sum()
+    # Select and summarize new fields
+    crit_masks = crit_table.eval(par_df[par_lu_field])
+    for k, grouping in enumerate(crit_table.names):
+        # Mask based on land use criteria
+        mask = crit_masks[:, k]
+        area = par_df[mask].groupby(grp_fields)[par_bld_area].mean()
+        bg_sum[grouping] = area.groupby(level="_BG_POS_").sum()
+        bg_sum[grouping] = bg_sum[grouping].fillna(0)
+    bg_sum.insert(0, bg_id_field, np.asarray(bg_ids, dtype=object)[bg_sum.index])
+    bg_df = bg_sum.reset_index(drop=True)
+    print(f"---  --- {len(bg_df)} block group rows")
+    return bg_df
+
+
 def get_field_dtype(in_table, field):
     """
     Helper function to map data types from arcgis type to pandas type
@@ -1781,8 +2310,159 @@ def agg_to_zone(parcel_fc, agg_field, zone_fc, zone_id):
     return df
 
 
+def _load_blockgroup_year_(load_path, year, fields, acs_years, lodes_years):
+    """Reads one year of enriched block group data and adds the derived modeling columns"""
+    tab = PMT.featureclass_to_df(in_fc=load_path, keep_fields=fields, null_val=0.0)
+
+    # Edit
+    tab["Year"] = year
+    tab["Since_2013"] = year - 2013
+    tab["Total_Emp_Area"] = reduce(
+        lambda a, b: a + b, [tab[f"CNS_{i:02d}_par"] for i in range(1, 21)]
+    )
+    if year in lodes_years:
+        tab["Total_Employment"] = reduce(
+            lambda a, b: a + b, [tab[f"CNS{i:02d}"] for i in range(1, 21)]
+        )
+    if year in acs_years:
+        tab["Total_Population"] = tab["Total_Non_Hisp"] + tab["Total_Hispanic"]
+    return tab
+
+
+def _write_panel_year_(tab, out_file):
+    """
+    Internal helper to write one year of the block group panel as a columnar .npz file (one array
+        per column), returning the column names and those holding text, or None if a column
+        cannot be stored without pickling
+
+    See Also: load_blockgroup_panel
+    """
+    arrays = {}
+    text_cols = []
+    for i, col in enumerate(tab.columns):
+        values = tab[col].to_numpy()
+        if values.dtype == object:
+            if not all(isinstance(v, string_types) for v in values):
+                return None
+            values = values.astype(str)
+            text_cols.append(col)
+        arrays[f"c{i}"] = values
+    tmp_file = f"{out_file}.tmp"
+    with open(tmp_file, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_file, out_file)
+    return {"columns": [str(c) for c in tab.columns], "text_columns": text_cols}
+
+
+def _read_panel_year_(in_file, layout):
+    """
+    Internal helper to read one year of the block group panel written by `_write_panel_year_`
+
+    See Also: load_blockgroup_panel
+    """
+    with np.load(in_file, allow_pickle=False) as npz:
+        tab = pd.DataFrame(
+            {col: npz[f"c{i}"] for i, col in enumerate(layout["columns"])},
+            columns=layout["columns"],
+        )
+    for col in layout["text_columns"]:
+        tab[col] = tab[col].astype(object)
+    return tab
+
+
+def load_blockgroup_panel(
+        data_path, bg_enrich_tbl_name, years, fields="*", acs_years=None, lodes_years=None,
+        cache_dir=None,
+):
+    """
+    Stacks enriched block group data for several years into a single block group x year table,
+    adding the derived columns used for modeling (Year, Since_2013, Total_Emp_Area, and
+    Total_Employment/Total_Population in LODES/ACS years).
+
+    If `cache_dir` is given, each year's table is stored there as a columnar file keyed by a
+    content fingerprint of its source (see Notes). On later calls only years whose source
+    changed (or that are missing from the cache) are read again; all others come from the cache.
+
+    Args:
+        data_path (str): path to the directory holding the PMT_YEAR.gdb geodatabases
+        bg_enrich_tbl_name (str): name of enriched block group table in each year geodatabase
+        years (list): list of int, years to stack
+        fields (list): list of fields to read from the enriched table, "*" reads all fields
+        acs_years (list): list of int
+            years for which ACS variables (population, commutes) are present in the data
+        lodes_years (list): list of int
+            years for which LODES variables (employment) are present in the data
+        cache_dir (str, default=None): path to a folder caching the per-year tables; created if
+            it does not exist
+
+    Notes:
+        Sources are fingerprinted with `PMT.NetResultCache`, which hashes the rows of
+        geodatabase tables, so other tables in the same geodatabase (e.g. Modeled_blockgroups)
+        do not affect the key. Changing `fields`, `acs_years` or `lodes_years` invalidates the
+        years whose derived columns depend on them.
+
+        Each year is stored as panel_{year}.npz, one numpy array per column, and read with
+        pickling disabled; panel.json records the keys and column layouts. Years holding text
+        columns with non-string values are not cached.
+
+    Returns:
+        pandas.DataFrame: block group data for all `years`, stacked in year order
+    """
+    acs_years = [] if acs_years is None else list(acs_years)
+    lodes_years = [] if lodes_years is None else list(lodes_years)
+    year_gdb = PMT.make_path(data_path, "PMT_YEAR.gdb")
+    manifest = {}
+    if cache_dir is not None:
+        fingerprints = PMT.NetResultCache(cache_dir)
+        manifest_path = PMT.make_path(cache_dir, "panel.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+
+    df = []
+    updated = False
+    for year in years:
+        load_path = PMT.make_path(year_gdb.replace("YEAR", str(year)), bg_enrich_tbl_name)
+        if cache_dir is not None:
+            key = fingerprints.key(
+                [load_path],
+                fields=fields,
+                acs=bool(year in acs_years),
+                lodes=bool(year in lodes_years),
+            )
+            cached = manifest.get(str(year))
+            year_file = PMT.make_path(cache_dir, f"panel_{year}.npz")
+            if cached is not None and cached["key"] == key and os.path.exists(year_file):
+                print(" ".join(["----> Loading", str(year), "(cached)"]))
+                df.append(_read_panel_year_(year_file, cached))
+                continue
+        print(" ".join(["----> Loading", str(year)]))
+        tab = _load_blockgroup_year_(
+            load_path=load_path,
+            year=year,
+            fields=fields,
+            acs_years=acs_years,
+            lodes_years=lodes_years,
+        )
+        if cache_dir is not None:
+            layout = _write_panel_year_(tab, year_file)
+            if layout is None:
+                manifest.pop(str(year), None)
+            else:
+                manifest[str(year)] = dict(key=key, **layout)
+            updated = True
+        df.append(tab)
+
+    if updated:
+        print("--- --- updating block group panel cache")
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+    return pd.concat(df, ignore_index=True)
+
+
 def model_blockgroup_data(
         data_path, bg_enrich_tbl_name, bg_key, fields="*", acs_years=None, lodes_years=None,
+        cache_dir=None,
 ):
     """
     Fit linear models to block group-level total employment, population, and
@@ -1800,6 +2480,8 @@ def model_blockgroup_data(
             years for which ACS variables (population, commutes) are present in the data
         lodes_years (list): list of int
             years for which LODES variables (employment) are present in the data
+        cache_dir (str, default=None): path to a panel cache folder; if provided, the stacked
+            block group table is read through the cache (see `load_blockgroup_panel`)
     
     Notes:
         in `bg_enrich_path`, replace the presence of a year with the string
@@ -1812,66 +2494,16 @@ def model_blockgroup_data(
     """
 
     print("--- reading input data (block group)")
-    df = []
-    year_gdb = PMT.make_path(data_path, "PMT_YEAR.gdb")
     years = np.unique(np.concatenate([acs_years, lodes_years]))
-    for year in years:
-        print(" ".join(["----> Loading", str(year)]))
-        load_path = PMT.make_path(year_gdb.replace("YEAR", str(year)), bg_enrich_tbl_name)
-        tab = PMT.featureclass_to_df(in_fc=load_path, keep_fields=fields, null_val=0.0)
-
-        # Edit
-        tab["Year"] = year
-        tab["Since_2013"] = year - 2013
-        tab["Total_Emp_Area"] = (
-                tab["CNS_01_par"]
-                + tab["CNS_02_par"]
-                + tab["CNS_03_par"]
-                + tab["CNS_04_par"]
-                + tab["CNS_05_par"]
-                + tab["CNS_06_par"]
-                + tab["CNS_07_par"]
-                + tab["CNS_08_par"]
-                + tab["CNS_09_par"]
-                + tab["CNS_10_par"]
-                + tab["CNS_11_par"]
-                + tab["CNS_12_par"]
-                + tab["CNS_13_par"]
-                + tab["CNS_14_par"]
-                + tab["CNS_15_par"]
-                + tab["CNS_16_par"]
-                + tab["CNS_17_par"]
-                + tab["CNS_18_par"]
-                + tab["CNS_19_par"]
-                + tab["CNS_20_par"]
-        )
-        if year in lodes_years:
-            tab["Total_Employment"] = (
-                    tab["CNS01"]
-                    + tab["CNS02"]
-                    + tab["CNS03"]
-                    + tab["CNS04"]
-                    + tab["CNS05"]
-                    + tab["CNS06"]
-                    + tab["CNS07"]
-                    + tab["CNS08"]
-                    + tab["CNS09"]
-                    + tab["CNS10"]
-                    + tab["CNS11"]
-                    + tab["CNS12"]
-                    + tab["CNS13"]
-                    + tab["CNS14"]
-                    + tab["CNS15"]
-                    + tab["CNS16"]
-                    + tab["CNS17"]
-                    + tab["CNS18"]
-                    + tab["CNS19"]
-                    + tab["CNS20"]
-            )
-        if year in acs_years:
-            tab["Total_Population"] = tab["Total_Non_Hisp"] + tab["Total_Hispanic"]
-        df.append(tab)
-    df = pd.concat(df, ignore_index=True)
+    df = load_blockgroup_panel(
+        data_path=data_path,
+        bg_enrich_tbl_name=bg_enrich_tbl_name,
+        years=years,
+        fields=fields,
+        acs_years=acs_years,
+        lodes_years=lodes_years,
+        cache_dir=cache_dir,
+    )
 
     # 2. Model
     # Variable setup: defines our variables of interest for modeling
@@ -1975,6 +2607,7 @@ def apply_blockgroup_model(
         bg_id_field,
         model_coefficients,
         shares_from=None,
+        shares_cache=None,
 ):
     """
     Predict block group-level total employment, population, and commutes using
@@ -2000,11 +2633,29 @@ def apply_blockgroup_model(
             ACS variables.
             The default is None, which assumes LODES and ACS data are available
             for the year of interest in the provided `bg_enrich` file
+        shares_cache (dict): optional
+            if provided, shares data read from `shares_from` paths are stored in (and
+            reused from) this dictionary, so files shared by several years are read once
     
     Returns:
         alloc (pd.DataFrame): pd.DataFrame of model application results
+
+    See Also:
+        apply_blockgroup_models
+    """
+    df = _blockgroup_model_inputs_(year, bg_enrich_path)
+    pwrite = _predict_blockgroup_totals_([df], bg_id_field, model_coefficients)[0]
+    return _apply_blockgroup_shares_(
+        df, pwrite, bg_geometry_path, bg_id_field, shares_from, shares_cache
+    )
+
+
+def _blockgroup_model_inputs_(year, bg_enrich_path):
     """
+    Internal helper to read enriched block group data and prepare the model variables
 
+    See Also: apply_blockgroup_model
+    """
     print("--- reading input data (block group)")
     fields = [f.name for f in arcpy.ListFields(bg_enrich_path)]
     df = PMT.featureclass_to_df(in_fc=bg_enrich_path, keep_fields=fields, null_val=0.0)
@@ -2066,24 +2717,45 @@ def apply_blockgroup_model(
     ]
     parcel_na_dict = {iv: 0 for iv in independent_variables}
     df.fillna(parcel_na_dict, inplace=True)
+    return df
+
+
+def _predict_blockgroup_totals_(dfs, bg_id_field, model_coefficients):
+    """
+    Internal helper to predict block group totals for a list of prepared data frames (one per
+        year) with a single matrix multiplication, returning one frame of predictions per input
 
-    # 2. Apply models
-    # ---------------
+    See Also: apply_blockgroup_model
+    """
     print("--- applying models to predict totals")
     # Load the coefficients
     coefs = model_coefficients
-    # Predict using matrix multiplication
-    mod_inputs = df[coefs["Variable"]]
+    # Predict using one matrix multiplication over all years' rows, then split by year
+    mod_inputs = np.concatenate([df[coefs["Variable"]].to_numpy() for df in dfs])
     coef_values = coefs.drop(columns="Variable")
-    preds = np.matmul(mod_inputs.to_numpy(), coef_values.to_numpy())
-    preds = pd.DataFrame(data=preds)
-    preds.columns = coef_values.columns.tolist()
-    pwrite = pd.concat([df[[bg_id_field]], preds], axis=1)
-    # If any prediction is below 0, turn it to 0
-    pwrite.loc[pwrite.Total_Employment < 0, "Total_Employment"] = 0
-    pwrite.loc[pwrite.Total_Population < 0, "Total_Population"] = 0
-    pwrite.loc[pwrite.Total_Commutes < 0, "Total_Commutes"] = 0
+    all_preds = np.matmul(mod_inputs, coef_values.to_numpy())
+    pwrites = []
+    ends = np.cumsum([len(df) for df in dfs])
+    for df, preds in zip(dfs, np.split(all_preds, ends[:-1])):
+        preds = pd.DataFrame(data=preds)
+        preds.columns = coef_values.columns.tolist()
+        pwrite = pd.concat([df[[bg_id_field]], preds], axis=1)
+        # If any prediction is below 0, turn it to 0
+        pwrite.loc[pwrite.Total_Employment < 0, "Total_Employment"] = 0
+        pwrite.loc[pwrite.Total_Population < 0, "Total_Population"] = 0
+        pwrite.loc[pwrite.Total_Commutes < 0, "Total_Commutes"] = 0
+        pwrites.append(pwrite)
+    return pwrites
+
+
+def _apply_blockgroup_shares_(
+        df, pwrite, bg_geometry_path, bg_id_field, shares_from=None, shares_cache=None
+):
+    """
+    Internal helper to subdivide predicted block group totals into subgroups by shares
 
+    See Also: apply_blockgroup_model
+    """
     # 3. Shares
     # Variable setup: defines our variables of interest for modeling
     dependent_variables_emp = [
@@ -2141,18 +2813,16 @@ def apply_blockgroup_model(
     # Format
     if shares_from is not None:
         if "LODES" in shares_from.keys():
-            lodes = PMT.featureclass_to_df(
-                in_fc=shares_from["LODES"],
-                keep_fields=[bg_id_field] + dependent_variables_emp,
-                null_val=0.0,
+            lodes = _read_shares_(
+                shares_from["LODES"],
+                [bg_id_field] + dependent_variables_emp,
+                shares_cache,
             )
         else:
             lodes = df[[bg_id_field] + dependent_variables_emp]
         if "ACS" in shares_from.keys():
-            acs = PMT.featureclass_to_df(
-                in_fc=shares_from["ACS"],
-                keep_fields=[bg_id_field] + acs_vars,
-                null_val=0.0,
+            acs = _read_shares_(
+                shares_from["ACS"], [bg_id_field] + acs_vars, shares_cache
             )
         else:
             acs = df[[bg_id_field] + acs_vars]
@@ -2166,22 +2836,17 @@ def apply_blockgroup_model(
     # Step 2: Calculate shares relative to total
     # This is done relative to the "Total" variable for each group
     print("--- calculating shares")
+    share_groups = {
+        "Emp": dependent_variables_emp,
+        "Pop_Tot": dependent_variables_pop_tot,
+        "Pop_Sub": dependent_variables_pop_sub,
+        "Comm": dependent_variables_trn,
+    }
+    shares = share_matrix(shares_df, share_groups)
     shares_dict = {}
-    for name, variables in zip(
-            ["Emp", "Pop_Tot", "Pop_Sub", "Comm"],
-            [
-                dependent_variables_emp,
-                dependent_variables_pop_tot,
-                dependent_variables_pop_sub,
-                dependent_variables_trn,
-            ],
-    ):
-        sdf = shares_df[variables]
-        sdf["TOTAL"] = sdf.sum(axis=1)
-        for d in variables:
-            sdf[d] = sdf[d] / sdf["TOTAL"]
+    for name, variables in share_groups.items():
+        sdf = shares[variables].copy()
         sdf[bg_id_field] = shares_df[bg_id_field]
-        sdf.drop(columns="TOTAL", inplace=True)
         shares_dict[name] = sdf
 
     # Step 3: some rows have NA shares because the total for that class of variables was 0. For these block groups,
@@ -2259,66 +2924,410 @@ def apply_blockgroup_model(
     # So, all we have to do is multiply the shares by the appropriate column
     # First, we'll merge our estimates and shares
     alloc = pd.merge(pwrite, cs_shares, on=bg_id_field)
-    # We'll do employment first
-    for d in dependent_variables_emp:
-        alloc[d] = alloc[d] * alloc.Total_Employment
-    # Now population
-    for d in dependent_variables_pop_tot:
-        alloc[d] = alloc[d] * alloc.Total_Population
-    for d in dependent_variables_pop_sub:
-        alloc[d] = alloc[d] * alloc.Total_Population
-    # Finally commutes
-    for d in dependent_variables_trn:
-        alloc[d] = alloc[d] * alloc.Total_Commutes
+    # Employment, population, and commutes shares times their modeled totals
+    share_totals = [
+        (dependent_variables_emp, "Total_Employment"),
+        (dependent_variables_pop_tot, "Total_Population"),
+        (dependent_variables_pop_sub, "Total_Population"),
+        (dependent_variables_trn, "Total_Commutes"),
+    ]
+    share_cols = [d for variables, _ in share_totals for d in variables]
+    total_cols = [total for variables, total in share_totals for _ in variables]
+    alloc[share_cols] = alloc[share_cols].to_numpy() * alloc[total_cols].to_numpy()
 
     return alloc
 
 
-def allocate_bg_to_parcels(
-        bg_modeled_df,
-        bg_geom,
-        bg_id_field,
-        parcel_fc,
-        parcels_id="FOLIO",
-        parcel_wc="",
-        parcel_lu="DOR_UC",
-        parcel_liv_area="TOT_LVG_AREA",
-):
+def _read_shares_(in_fc, fields, shares_cache=None):
     """
-    Allocate block group data to parcels using relative abundances (proportions of total among all parcels)
-    of parcel building square footage
+    Internal helper to read shares data from a feature class or table, reusing data already read
+        into `shares_cache` (if given)
+
+    See Also: apply_blockgroup_model
+    """
+    key = (in_fc, tuple(fields))
+    if shares_cache is not None and key in shares_cache:
+        return shares_cache[key].copy()
+    shares_df = PMT.featureclass_to_df(in_fc=in_fc, keep_fields=fields, null_val=0.0)
+    if shares_cache is not None:
+        shares_cache[key] = shares_df.copy()
+    return shares_df
+
+
+def share_matrix(in_df, share_groups):
+    """
+    Calculates the share of each variable in the total of its group of variables for all groups at
+    once, as a single normalized matrix. Group totals are summed variable by variable (in the
+    order given), so shares match those calculated group by group with `DataFrame.sum(axis=1)`.
 
     Args:
-        bg_modeled_df (pd.DataFrame): pandas DataFrame of modeled block group job, population, and commute
-            data for allocation
-        bg_geom (str): Path; path to feature class of block group polygons
-        bg_id_field (str): block group key
-        parcel_fc (str): Path to shape of parcel polygons, containing at a minimum a unique ID
-            field, land use field, and total living area field (Florida DOR)
-        parcels_id (str, default="FOLIO"): unique ID field in the parcels shape
-        parcel_wc (str, default=""): where clause to select out parcels and limit allocation to only the
-            selected parcels (as when allocating NearTerm permitted parcels)
-        parcel_lu (str, default="DOR_UC"): land use code field in the parcels shape
-        parcel_liv_area (str, default="TOT_LVG_AREA"): building square footage field in the parcels shape
+        in_df (pd.DataFrame): data frame of variables (without nulls)
+        share_groups (dict): `{group name: [variable, ...]}`; variables are divided by the sum of
+            all variables in their group
 
     Returns:
-        intersect_df (pd.DataFrame): dataframe of the resultant allocation based on model
+        pd.DataFrame: shares for all variables in `share_groups` (columns in group order), with
+            nan shares where a group total is 0
+    """
+    variables = [v for group in share_groups.values() for v in group]
+    sizes = [len(group) for group in share_groups.values()]
+    starts = np.cumsum([0] + sizes[:-1])
+    # variables x rows; group totals accumulate one variable at a time
+    values = in_df[variables].to_numpy(dtype=np.float64).T
+    totals = np.array(
+        [reduce(np.add, values[start: start + size]) for start, size in zip(starts, sizes)]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = values / np.repeat(totals, sizes, axis=0)
+    return pd.DataFrame(shares.T, columns=variables, index=in_df.index)
 
+
+def apply_blockgroup_models(
+        bg_enrich_paths,
+        bg_geometry_paths,
+        bg_id_field,
+        model_coefficients,
+        model_years=None,
+        shares_from=None,
+):
     """
-    if parcels_id is None:
-        parcels_id = "FOLIO"
-    if parcel_lu is None:
-        parcel_lu = "DOR_UC"
-    if parcel_liv_area is None:
-        parcel_liv_area = "TOT_LVG_AREA"
+    Apply pre-fit block group models (see `apply_blockgroup_model`) for several years in one call,
+    yielding each year's results as they complete. Model inputs for all years are read first and
+    totals are predicted with one matrix multiplication over the stacked rows of all years; shares
+    are then applied year by year, with shares data read from `shares_from` paths cached and reused
+    across years.
 
-    # Organize constants for allocation
-    lodes_attrs = [
-        "CNS01",
-        "CNS02",
-        "CNS03",
-        "CNS04",
-        "CNS05",
+    Args:
+        bg_enrich_paths (dict): `{year: path}`; paths to enriched block group data
+        bg_geometry_paths (dict): `{year: path}`; paths to geometry of block groups
+        bg_id_field (str): block group unique id column
+        model_coefficients (pd.DataFrame): pandas.DataFrame of model coefficients
+        model_years (dict): optional
+            `{year: model year}`; the year at which models are applied for each year (as for
+            "NearTerm"). By default, each year is used.
+        shares_from (dict): optional
+            `{year: shares_from}`; shares sources for each year (see `apply_blockgroup_model`)
+
+    Yields:
+        year, alloc (tuple): the year and a pd.DataFrame of model application results
+    """
+    if model_years is None:
+        model_years = {}
+    if shares_from is None:
+        shares_from = {}
+    years = list(bg_enrich_paths.keys())
+    dfs = []
+    for year in years:
+        print(f"{year}: ")
+        dfs.append(_blockgroup_model_inputs_(model_years.get(year, year), bg_enrich_paths[year]))
+    pwrites = _predict_blockgroup_totals_(dfs, bg_id_field, model_coefficients)
+    shares_cache = {}
+    for year, df, pwrite in zip(years, dfs, pwrites):
+        print(f"{year}: ")
+        yield year, _apply_blockgroup_shares_(
+            df,
+            pwrite,
+            bg_geometry_path=bg_geometry_paths[year],
+            bg_id_field=bg_id_field,
+            shares_from=shares_from.get(year),
+            shares_cache=shares_cache,
+        )
+
+
+# land uses (DOR_UC) to which each activity may be allocated
+_ALLOCATION_CRITERIA_ = {
+    "CNS01": PMT.And([PMT.Comp(">=", 50), PMT.Comp("<=", 69)]),
+    "CNS02": PMT.Comp("==", 92),
+    "CNS03": PMT.Comp("==", 91),
+    "CNS04": [PMT.Comp("==", 17), PMT.Comp("==", 19)],
+    "CNS05": [PMT.Comp("==", 41), PMT.Comp("==", 42)],
+    "CNS06": PMT.Comp("==", 29),
+    "CNS07": PMT.And([PMT.Comp(">=", 11), PMT.Comp("<=", 16)]),
+    "CNS08": [PMT.Comp("==", 48), PMT.Comp("==", 49), PMT.Comp("==", 20)],
+    "CNS09": [PMT.Comp("==", 17), PMT.Comp("==", 18), PMT.Comp("==", 19)],
+    "CNS10": [PMT.Comp("==", 23), PMT.Comp("==", 24)],
+    "CNS11": [PMT.Comp("==", 17), PMT.Comp("==", 18), PMT.Comp("==", 19)],
+    "CNS12": [PMT.Comp("==", 17), PMT.Comp("==", 18), PMT.Comp("==", 19)],
+    "CNS13": [PMT.Comp("==", 17), PMT.Comp("==", 18), PMT.Comp("==", 19)],
+    "CNS14": PMT.Comp("==", 89),
+    "CNS15": [PMT.Comp("==", 72), PMT.Comp("==", 83), PMT.Comp("==", 84)],
+    "CNS16": [PMT.Comp("==", 73), PMT.Comp("==", 85)],
+    "CNS17": [PMT.And([PMT.Comp(">=", 30), PMT.Comp("<=", 38)]), PMT.Comp("==", 82)],
+    "CNS18": [PMT.Comp("==", 21), PMT.Comp("==", 22), PMT.Comp("==", 33), PMT.Comp("==", 39)],
+    "CNS19": [PMT.Comp("==", 27), PMT.Comp("==", 28)],
+    "CNS20": PMT.And([PMT.Comp(">=", 86), PMT.Comp("<=", 89)]),
+    "Population": [
+        PMT.And([PMT.Comp(">=", 1), PMT.Comp("<=", 9)]),
+        PMT.And([PMT.Comp(">=", 100), PMT.Comp("<=", 102)]),
+    ],
+}
+# all land uses relevant to any non-NAICS-1-or-2 job type
+_NON_RES_LU_CODES_ = [
+    11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 27, 28, 29, 30, 31, 32, 33, 34, 35,
+    36, 37, 38, 39, 41, 42, 48, 49, 72, 73, 82, 84, 85, 86, 87, 88, 89,
+]
+# non-res land uses plus residential land uses
+_ALL_DEV_LU_CODES_ = _NON_RES_LU_CODES_ + [1, 2, 3, 4, 5, 6, 7, 8, 9, 100, 101, 102]
+# activity and fallback level land uses compiled to a lookup table over DOR_UC codes
+_ALLOCATION_TABLE_ = PMT.CriteriaTable(
+    dict(
+        _ALLOCATION_CRITERIA_,
+        non_res=[PMT.Comp("==", c) for c in _NON_RES_LU_CODES_],
+        all_dev=[PMT.Comp("==", c) for c in _ALL_DEV_LU_CODES_],
+    )
+)
+# allocation fallback levels, in order of preference
+_ALLOCATION_LEVELS_ = ["lu_mask", "non_res", "all_dev", "living_area", "land_area"]
+
+
+def activity_lu_matrix(land_uses, activities=None):
+    """
+    Encodes the land use to activity eligibility used in block group allocation as a boolean
+    matrix (parcels x activities)
+
+    Args:
+        land_uses (array-like): parcel land use codes (Florida DOR); nulls are not eligible for
+            any activity
+        activities (list, default=None): activities (columns) to include. If None, all activities
+            in `_ALLOCATION_CRITERIA_` are included. "non_res" and "all_dev" give the fallback
+            levels' land uses.
+
+    Returns:
+        np.array: (n x k) boolean matrix flagging the activities each parcel may receive
+    """
+    if activities is None:
+        activities = list(_ALLOCATION_CRITERIA_)
+    return _ALLOCATION_TABLE_.eval(land_uses, names=activities)
+
+
+def _group_matrix_(codes, n_groups):
+    """
+    Internal helper to build a sparse (groups x rows) membership matrix from row group codes
+        (rows with negative codes belong to no group). Products with this matrix sum the rows of
+        each group in row order, as `groupby().sum()`.
+
+    See Also: allocate_activities
+    """
+    member = np.flatnonzero(codes >= 0)
+    order = member[np.argsort(codes[member], kind="stable")]
+    indptr = np.concatenate(
+        [[0], np.cumsum(np.bincount(codes[member], minlength=n_groups))]
+    )
+    return csr_matrix(
+        (np.ones(len(order)), order, indptr), shape=(n_groups, len(codes))
+    )
+
+
+def allocate_activities(
+        intersect_df,
+        bg_id_field,
+        parcels_id="FOLIO",
+        parcel_lu="DOR_UC",
+        parcel_liv_area="TOT_LVG_AREA",
+        parcel_land_area="Shape_Area",
+):
+    """
+    Allocate block group activities to parcels using relative abundances of parcel building
+    square footage. All activities are allocated at once: block group denominators for every
+    fallback level (land uses matched to the activity, all non-residential, all developed, all
+    living area, and land area) are computed with grouped sums, and the first level with a
+    nonzero denominator is chosen for each block group and activity.
+
+    This function is not intended to be run directly. Use `allocate_bg_to_parcels`.
+
+    Args:
+        intersect_df (pd.DataFrame): parcels (one row per parcel and block group) with parcel id,
+            land use, living area and land area fields and the modeled block group attributes
+        bg_id_field (str): block group key
+        parcels_id (str, default="FOLIO"): unique ID field in the parcels
+        parcel_lu (str, default="DOR_UC"): land use code field in the parcels
+        parcel_liv_area (str, default="TOT_LVG_AREA"): building square footage field in the parcels
+        parcel_land_area (str, default="Shape_Area"): land area field in the parcels
+
+    Returns:
+        pd.DataFrame: parcel-level allocation of jobs (`CNS##_PAR`), population (`{race}_PAR`),
+            and commutes (`{mode}_PAR`) with totals
+    """
+    lodes_attrs = [f"CNS{i:02d}" for i in range(1, 21)]
+    demog_attrs = [
+        "Total_Hispanic",
+        "White_Hispanic",
+        "Black_Hispanic",
+        "Asian_Hispanic",
+        "Multi_Hispanic",
+        "Other_Hispanic",
+        "Total_Non_Hisp",
+        "White_Non_Hisp",
+        "Black_Non_Hisp",
+        "Asian_Non_Hisp",
+        "Multi_Non_Hisp",
+        "Other_Non_Hisp",
+    ]
+    commute_attrs = [
+        "Drove",
+        "Carpool",
+        "Transit",
+        "NonMotor",
+        "Work_From_Home",
+        "AllOther",
+    ]
+    activities = lodes_attrs + ["Population"]
+
+    # Format data for allocation
+    print("--- formatting block group for allocation data")
+    # set any value below 0 to 0 and set any land use from -1 to NA
+    out_df = intersect_df[[parcels_id, parcel_liv_area, parcel_lu, bg_id_field]].copy()
+    out_df[parcel_liv_area] = out_df[parcel_liv_area].clip(lower=0)
+    out_df.loc[out_df[parcel_lu] == -1, parcel_lu] = None
+    bg_values = {
+        var: intersect_df[var].clip(lower=0).to_numpy()
+        for var in lodes_attrs + demog_attrs + commute_attrs
+    }
+    liv_area = out_df[parcel_liv_area].to_numpy(dtype=np.float64)
+    land_area = intersect_df[parcel_land_area].clip(lower=0).to_numpy(dtype=np.float64)
+    land_uses = pd.to_numeric(out_df[parcel_lu], errors="coerce").to_numpy()
+
+    # Eligibility of each parcel at each fallback level (parcels x activities)
+    print("--- setting up activity-land use matches...")
+    lu_matrix = activity_lu_matrix(land_uses, activities + ["non_res", "all_dev"])
+    lu_mask, non_res, all_dev = lu_matrix[:, :-2], lu_matrix[:, -2], lu_matrix[:, -1]
+    n_par, n_act = lu_mask.shape
+    level_masks = [
+        lu_mask,
+        np.repeat(non_res[:, None], n_act, axis=1),
+        np.repeat(all_dev[:, None], n_act, axis=1),
+        np.ones((n_par, n_act), dtype=bool),
+        np.ones((n_par, n_act), dtype=bool),
+    ]
+    # population skips the non-res level
+    level_masks[1][:, activities.index("Population")] = False
+
+    # Block group denominators for all levels at once (levels x block groups x activities)
+    print("--- totaling living area by activity and fallback level")
+    codes = out_df.groupby(bg_id_field).ngroup().fillna(-1).to_numpy().astype(np.int64)
+    n_bg = codes.max() + 1 if len(codes) else 0
+    groups = _group_matrix_(codes, n_bg)
+    liv_sum = np.nan_to_num(liv_area)
+    area_sum = np.nan_to_num(land_area)
+    denoms = np.stack(
+        [groups @ np.where(mask, liv_sum[:, None], 0.0) for mask in level_masks[:-1]]
+        + [np.repeat((groups @ area_sum)[:, None], n_act, axis=1)]
+    )
+    # first level with a nonzero denominator (land area is always used if reached)
+    usable = denoms > 0
+    usable[-1] = True
+    how = usable.argmax(axis=0)
+    bg_area = np.take_along_axis(denoms, how[None], axis=0)[0]
+
+    # Parcel proportions of the chosen block group denominators
+    print("--- allocating jobs and population")
+    located = codes >= 0
+    par_how = np.full((n_par, n_act), -1)
+    par_how[located] = how[codes[located]]
+    par_area = np.full((n_par, n_act), np.nan)
+    par_area[located] = bg_area[codes[located]]
+    use_mask = np.zeros((n_par, n_act), dtype=bool)
+    for lvl, mask in enumerate(level_masks):
+        use_mask |= (par_how == lvl) & mask
+    numerator = np.where(
+        par_how == _ALLOCATION_LEVELS_.index("land_area"),
+        land_area[:, None],
+        liv_area[:, None],
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        par_prop = np.where(use_mask, numerator / par_area, np.nan)
+    par_prop[np.isnan(par_prop)] = 0
+
+    # Allocate (note that for pop, we're using the population ratios for all racial subsets)
+    for k, var in enumerate(lodes_attrs):
+        out_df[f"{var}_PAR"] = par_prop[:, k] * bg_values[var]
+    pop_prop = par_prop[:, activities.index("Population")]
+    for var in demog_attrs:
+        out_df[f"{var}_PAR"] = pop_prop * bg_values[var]
+
+    # Now we can sum up totals
+    print("--- totaling allocated jobs and population")
+    total_emp = out_df["CNS01_PAR"]
+    for var in lodes_attrs[1:]:
+        total_emp = total_emp + out_df[f"{var}_PAR"]
+    out_df["Total_Employment"] = total_emp
+    out_df["Total_Population"] = (
+            out_df["Total_Non_Hisp_PAR"] + out_df["Total_Hispanic_PAR"]
+    )
+
+    # Commutes are allocated relative to total population, or to population area
+    # proportions in block groups with 0 population
+    print("--- allocating commutes")
+    total_pop = out_df["Total_Population"].to_numpy()
+    tp_agg = np.full(n_par, np.nan)
+    tp_agg[located] = (groups @ np.nan_to_num(total_pop))[codes[located]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tp_prop = total_pop / tp_agg
+    tp_prop = np.where(tp_agg == 0, pop_prop, tp_prop)
+    for var in commute_attrs:
+        out_df[f"{var}_PAR"] = tp_prop * bg_values[var]
+    total_com = out_df["Drove_PAR"]
+    for var in commute_attrs[1:]:
+        total_com = total_com + out_df[f"{var}_PAR"]
+    out_df["Total_Commutes"] = total_com
+
+    print("--- selecting columns of interest")
+    to_keep = (
+            [parcels_id, parcel_liv_area, parcel_lu, bg_id_field, "Total_Employment"]
+            + [f"{var}_PAR" for var in lodes_attrs]
+            + ["Total_Population"]
+            + [f"{var}_PAR" for var in demog_attrs]
+            + ["Total_Commutes"]
+            + [f"{var}_PAR" for var in commute_attrs]
+    )
+    return out_df[to_keep]
+
+
+def allocate_bg_to_parcels(
+        bg_modeled_df,
+        bg_geom,
+        bg_id_field,
+        parcel_fc,
+        parcels_id="FOLIO",
+        parcel_wc="",
+        parcel_lu="DOR_UC",
+        parcel_liv_area="TOT_LVG_AREA",
+):
+    """
+    Allocate block group data to parcels using relative abundances (proportions of total among all parcels)
+    of parcel building square footage
+
+    Args:
+        bg_modeled_df (pd.DataFrame): pandas DataFrame of modeled block group job, population, and commute
+            data for allocation
+        bg_geom (str): Path; path to feature class of block group polygons
+        bg_id_field (str): block group key
+        parcel_fc (str): Path to shape of parcel polygons, containing at a minimum a unique ID
+            field, land use field, and total living area field (Florida DOR)
+        parcels_id (str, default="FOLIO"): unique ID field in the parcels shape
+        parcel_wc (str, default=""): where clause to select out parcels and limit allocation to only the
+            selected parcels (as when allocating NearTerm permitted parcels)
+        parcel_lu (str, default="DOR_UC"): land use code field in the parcels shape
+        parcel_liv_area (str, default="TOT_LVG_AREA"): building square footage field in the parcels shape
+
+    Returns:
+        intersect_df (pd.DataFrame): dataframe of the resultant allocation based on model
+
+    """
+    if parcels_id is None:
+        parcels_id = "FOLIO"
+    if parcel_lu is None:
+        parcel_lu = "DOR_UC"
+    if parcel_liv_area is None:
+        parcel_liv_area = "TOT_LVG_AREA"
+
+    # Organize constants for allocation
+    lodes_attrs = [
+        "CNS01",
+        "CNS02",
+        "CNS03",
+        "CNS04",
+        "CNS05",
         "CNS06",
         "CNS07",
         "CNS08",
@@ -2390,467 +3399,116 @@ def allocate_bg_to_parcels(
         in_fc=intersect_fc, keep_fields=intersect_fields
     )
 
-    # Format data for allocation
-    print("--- formatting block group for allocation data")
-    # set any value below 0 to 0 and set any land use from -1 to NA
-    to_clip = (
-            lodes_attrs + demog_attrs + commute_attrs + [parcel_liv_area, "Shape_Area"]
-    )
-    for var in to_clip:
-        intersect_df[f"{var}"] = intersect_df[f"{var}"].clip(lower=0)
-    # 2. replace -1 in DOR_UC with NA
-    pluf = parcel_lu
-    elu = intersect_df[pluf] == -1
-    intersect_df.loc[elu, pluf] = None
-
-    # Step 1 in allocation is totaling the living area by activity in each block group.
-    # To do this, we define in advance which activities can go to which land uses
-    # First, we set up this process by matching activities to land uses
-    print("--- setting up activity-land use matches...")
-    lu_mask = {
-        "CNS01": ((intersect_df[pluf] >= 50) & (intersect_df[pluf] <= 69)),
-        "CNS02": (intersect_df[pluf] == 92),
-        "CNS03": (intersect_df[pluf] == 91),
-        "CNS04": ((intersect_df[pluf] == 17) | (intersect_df[pluf] == 19)),
-        "CNS05": ((intersect_df[pluf] == 41) | (intersect_df[pluf] == 42)),
-        "CNS06": (intersect_df[pluf] == 29),
-        "CNS07": ((intersect_df[pluf] >= 11) & (intersect_df[pluf] <= 16)),
-        "CNS08": (
-                (intersect_df[pluf] == 48)
-                | (intersect_df[pluf] == 49)
-                | (intersect_df[pluf] == 20)
-        ),
-        "CNS09": (
-                (intersect_df[pluf] == 17)
-                | (intersect_df[pluf] == 18)
-                | (intersect_df[pluf] == 19)
-        ),
-        "CNS10": ((intersect_df[pluf] == 23) | (intersect_df[pluf] == 24)),
-        "CNS11": (
-                (intersect_df[pluf] == 17)
-                | (intersect_df[pluf] == 18)
-                | (intersect_df[pluf] == 19)
-        ),
-        "CNS12": (
-                (intersect_df[pluf] == 17)
-                | (intersect_df[pluf] == 18)
-                | (intersect_df[pluf] == 19)
-        ),
-        "CNS13": (
-                (intersect_df[pluf] == 17)
-                | (intersect_df[pluf] == 18)
-                | (intersect_df[pluf] == 19)
-        ),
-        "CNS14": (intersect_df[pluf] == 89),
-        "CNS15": (
-                (intersect_df[pluf] == 72)
-                | (intersect_df[pluf] == 83)
-                | (intersect_df[pluf] == 84)
-        ),
-        "CNS16": ((intersect_df[pluf] == 73) | (intersect_df[pluf] == 85)),
-        "CNS17": (
-                ((intersect_df[pluf] >= 30) & (intersect_df[pluf] <= 38))
-                | (intersect_df[pluf] == 82)
-        ),
-        "CNS18": (
-                (intersect_df[pluf] == 21)
-                | (intersect_df[pluf] == 22)
-                | (intersect_df[pluf] == 33)
-                | (intersect_df[pluf] == 39)
-        ),
-        "CNS19": ((intersect_df[pluf] == 27) | (intersect_df[pluf] == 28)),
-        "CNS20": ((intersect_df[pluf] >= 86) & (intersect_df[pluf] <= 89)),
-        "Population": (
-                ((intersect_df[pluf] >= 1) & (intersect_df[pluf] <= 9))
-                | ((intersect_df[pluf] >= 100) & (intersect_df[pluf] <= 102))
-        ),
-    }
-
-    # Note that our activity-land use matches aren't guaranteed because they are subjectively defined.
-    # To that end, we need backups in case a block group is entirely missing all possible land uses
-    # for an activity.
-    #   - we set up masks for 'all non-res' (all land uses relevant to any non-NAICS-1-or-2 job type)
-    #   - and 'all developed' ('all non-res' + any residential land uses).
-    #  ['all non-res' will be used if a land use isn't present for a given activity;
-    #  [ the 'all developed' will be used if 'all non-res' fails]
-    non_res_lu_codes = [
-        11,
-        12,
-        13,
-        14,
-        15,
-        16,
-        17,
-        18,
-        19,
-        20,
-        21,
-        22,
-        23,
-        24,
-        27,
-        28,
-        29,
-        30,
-        31,
-        32,
-        33,
-        34,
-        35,
-        36,
-        37,
-        38,
-        39,
-        41,
-        42,
-        48,
-        49,
-        72,
-        73,
-        82,
-        84,
-        85,
-        86,
-        87,
-        88,
-        89,
-    ]
-    all_dev_lu_codes = non_res_lu_codes + [1, 2, 3, 4, 5, 6, 7, 8, 9, 100, 101, 102]
-    all_non_res = {"NR": (intersect_df[pluf].isin(non_res_lu_codes))}
-    all_developed = {"AD": (intersect_df[pluf].isin(all_dev_lu_codes))}
-
-    # If all else fails, A fourth level we'll use (if we need to) is simply all total living area in the block group,
-    #   but we don't need a mask for that. If this fails (which it rarely should), we revert to land area,
-    #   which we know will work (all parcels have area right?)
-
-    # Next, we'll total parcels by block group (this is just a simple operation
-    # to give our living area totals something to join to)
-    print("--- initializing living area sums")
-    count_parcels_bg = intersect_df.groupby([bg_id_field])[bg_id_field].agg(["count"])
-    count_parcels_bg.rename(columns={"count": "NumParBG"}, inplace=True)
-    count_parcels_bg = count_parcels_bg.reset_index()
-
-    # Now we can begin totaling living area. We'll start with jobs
-    print("--- totaling living area by job type")
-    # 1. get count of total living area (w.r.t. land use mask) for each
-    # job type
-    pldaf = "Shape_Area"
-    for var in lodes_attrs:
-        # mask by LU, group on bg_id_field
-        area = (
-            intersect_df[lu_mask[var]]
-                .groupby([bg_id_field])[parcel_liv_area]
-                .agg(["sum"])
-        )
-        area.rename(columns={"sum": f"{var}_Area"}, inplace=True)
-        area = area[area[f"{var}_Area"] > 0]
-        area = area.reset_index()
-        area[f"{var}_How"] = "lu_mask"
-        missing = list(set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field]))
-        if len(missing) > 0:
-            lev1 = intersect_df[all_non_res["NR"]]
-            lev1 = lev1[lev1[bg_id_field].isin(missing)]
-            area1 = lev1.groupby([bg_id_field])[parcel_liv_area].agg(["sum"])
-            area1.rename(columns={"sum": f"{var}_Area"}, inplace=True)
-            area1 = area1[area1[f"{var}_Area"] > 0]
-            area1 = area1.reset_index()
-            area1[f"{var}_How"] = "non_res"
-            area = pd.concat([area, area1])
-            missing1 = list(set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field]))
-            if len(missing1) > 0:
-                lev2 = intersect_df[all_developed["AD"]]
-                lev2 = lev2[lev2[bg_id_field].isin(missing1)]
-                area2 = lev2.groupby([bg_id_field])[parcel_liv_area].agg(["sum"])
-                area2.rename(columns={"sum": f"{var}_Area"}, inplace=True)
-                area2 = area2[area2[f"{var}_Area"] > 0]
-                area2 = area2.reset_index()
-                area2[f"{var}_How"] = "all_dev"
-                area = pd.concat([area, area2])
-                missing2 = list(
-                    set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field])
-                )
-                if len(missing2) > 0:
-                    lev3 = intersect_df[intersect_df[bg_id_field].isin(missing2)]
-                    area3 = lev3.groupby([bg_id_field])[parcel_liv_area].agg(["sum"])
-                    area3.rename(columns={"sum": f"{var}_Area"}, inplace=True)
-                    area3 = area3[area3[f"{var}_Area"] > 0]
-                    area3 = area3.reset_index()
-                    area3[f"{var}_How"] = "living_area"
-                    area = pd.concat([area, area3])
-                    missing3 = list(
-                        set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field])
-                    )
-                    if len(missing3) > 0:
-                        lev4 = intersect_df[intersect_df[bg_id_field].isin(missing3)]
-                        area4 = lev4.groupby([bg_id_field])[pldaf].agg(["sum"])
-                        area4.rename(columns={"sum": f"{var}_Area"}, inplace=True)
-                        area4 = area4.reset_index()
-                        area4[f"{var}_How"] = "land_area"
-                        area = pd.concat([area, area4])
-        area = area.reset_index(drop=True)
-        count_parcels_bg = pd.merge(count_parcels_bg, area, how="left", on=bg_id_field)
-
-    # Repeat the above with population
-    print("--- totaling living area for population")
-    area = (
-        intersect_df[lu_mask["Population"]]
-            .groupby([bg_id_field])[parcel_liv_area]
-            .agg(["sum"])
-    )
-    area.rename(columns={"sum": "Population_Area"}, inplace=True)
-    area = area[area["Population_Area"] > 0]
-    area = area.reset_index()
-    area["Population_How"] = "lu_mask"
-    missing1 = list(set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field]))
-    if len(missing1) > 0:
-        lev2 = intersect_df[all_developed["AD"]]
-        lev2 = lev2[lev2[bg_id_field].isin(missing1)]
-        area2 = lev2.groupby([bg_id_field])[parcel_liv_area].agg(["sum"])
-        area2.rename(columns={"sum": "Population_Area"}, inplace=True)
-        area2 = area2[area2["Population_Area"] > 0]
-        area2 = area2.reset_index()
-        area2["Population_How"] = "all_dev"
-        area = pd.concat([area, area2])
-        missing2 = list(set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field]))
-        if len(missing2) > 0:
-            lev3 = intersect_df[intersect_df[bg_id_field].isin(missing2)]
-            area3 = lev3.groupby([bg_id_field])[parcel_liv_area].agg(["sum"])
-            area3.rename(columns={"sum": "Population_Area"}, inplace=True)
-            area3 = area3[area3["Population_Area"] > 0]
-            area3 = area3.reset_index()
-            area3["Population_How"] = "living_area"
-            area = pd.concat([area, area3])
-            missing3 = list(set(count_parcels_bg[bg_id_field]) - set(area[bg_id_field]))
-            if len(missing3) > 0:
-                lev4 = intersect_df[intersect_df[bg_id_field].isin(missing3)]
-                area4 = lev4.groupby([bg_id_field])[pldaf].agg(["sum"])
-                area4.rename(columns={"sum": "Population_Area"}, inplace=True)
-                area4 = area4.reset_index()
-                area4["Population_How"] = "land_area"
-                area = pd.concat([area, area4])
-    area = area.reset_index(drop=True)
-    count_parcels_bg = pd.merge(count_parcels_bg, area, how="left", on=bg_id_field)
-
-    # Now, we format and re-merge with our original parcel data
-    print("--- merging living area totals with parcel-level data")
-    # 1. fill table with NAs -- no longer needed because NAs are eliminated
-    # by nesting structure
-    # tot_bg = tot_bg.fillna(0)
-    # 2. merge back to original data
-    intersect_df = pd.merge(intersect_df, count_parcels_bg, how="left", on=bg_id_field)
-
-    # Step 2 in allocation is taking parcel-level proportions of living area
-    # relative to the block group total, and calculating parcel-level
-    # estimates of activities by multiplying the block group activity total
-    # by the parcel-level proportions
-
-    # For allocation, we need a two step process, depending on how the area
-    # was calculated for the activity. If "{var}_How" is land_area, then
-    # allocation needs to be relative to land area; otherwise, it needs to be
-    # relative to living area. To do this, we'll set up mask dictionaries
-    # similar to the land use mask
-    print("setting up allocation logic --- ")
-    lu = {}
-    nr = {}
-    ad = {}
-    lvg_area = {}
-    lnd_area = {}
-    for v in lu_mask.keys():
-        lu[v] = intersect_df[f"{v}_How"] == "lu_mask"
-        nr[v] = intersect_df[f"{v}_How"] == "non_res"
-        ad[v] = intersect_df[f"{v}_How"] == "all_dev"
-        lvg_area[v] = intersect_df[f"{v}_How"] == "living_area"
-        lnd_area[v] = intersect_df[f"{v}_How"] == "land_area"
-
-    # First up, we'll allocate jobs
-    print("--- allocating jobs and population")
-    # 1. for each job variable, calculate the proportion, then allocate
-    for var in lu_mask.keys():
-        # First for lu mask
-        intersect_df.loc[lu[var] & lu_mask[var], f"{var}_Par_Prop"] = (
-                intersect_df[parcel_liv_area][lu[var] & lu_mask[var]]
-                / intersect_df[f"{var}_Area"][lu[var] & lu_mask[var]]
-        )
-        # Then for non res
-        intersect_df.loc[nr[var] & all_non_res["NR"], f"{var}_Par_Prop"] = (
-                intersect_df[parcel_liv_area][nr[var] & all_non_res["NR"]]
-                / intersect_df[f"{var}_Area"][nr[var] & all_non_res["NR"]]
-        )
-        # Then for all dev
-        intersect_df.loc[ad[var] & all_developed["AD"], f"{var}_Par_Prop"] = (
-                intersect_df[parcel_liv_area][ad[var] & all_developed["AD"]]
-                / intersect_df[f"{var}_Area"][ad[var] & all_developed["AD"]]
-        )
-        # Then for living area
-        intersect_df.loc[lvg_area[var], f"{var}_Par_Prop"] = (
-                intersect_df[parcel_liv_area][lvg_area[var]]
-                / intersect_df[f"{var}_Area"][lvg_area[var]]
-        )
-        # Then for land area
-        intersect_df.loc[lnd_area[var], f"{var}_Par_Prop"] = (
-                intersect_df[pldaf][lnd_area[var]]
-                / intersect_df[f"{var}_Area"][lnd_area[var]]
-        )
-        # Now fill NAs with 0 for proportions
-        intersect_df[f"{var}_Par_Prop"] = intersect_df[f"{var}_Par_Prop"].fillna(0)
-
-        # Now allocate (note that for pop, we're using the population ratios
-        # for all racial subsets)
-        if var != "Population":
-            intersect_df[f"{var}_PAR"] = (
-                    intersect_df[f"{var}_Par_Prop"] * intersect_df[var]
-            )
-        else:
-            race_vars = [
-                "Total_Hispanic",
-                "White_Hispanic",
-                "Black_Hispanic",
-                "Asian_Hispanic",
-                "Multi_Hispanic",
-                "Other_Hispanic",
-                "Total_Non_Hisp",
-                "White_Non_Hisp",
-                "Black_Non_Hisp",
-                "Asian_Non_Hisp",
-                "Multi_Non_Hisp",
-                "Other_Non_Hisp",
-            ]
-            for rv in race_vars:
-                intersect_df[f"{rv}_PAR"] = (
-                        intersect_df["Population_Par_Prop"] * intersect_df[rv]
-                )
+    # Allocate jobs, population, and commutes
+    return allocate_activities(
+        intersect_df=intersect_df,
+        bg_id_field=bg_id_field,
+        parcels_id=parcels_id,
+        parcel_lu=parcel_lu,
+        parcel_liv_area=parcel_liv_area,
+        parcel_land_area="Shape_Area",
+    )
 
-    # If what we did worked, all the proportions should sum to 1. This will
-    # help us identify if there are any errors
-    # v = [f'{var}_Par_Prop' for var in lodes_attrs + ["Population"]]
-    # x = intersect_df.groupby([bg_id_field])[v].apply(lambda x: x.sum())
-    # x[v].apply(lambda x: [min(x), max(x)])
 
-    # Now we can sum up totals
-    print("--- totaling allocated jobs and population")
-    intersect_df["Total_Employment"] = (
-            intersect_df["CNS01_PAR"]
-            + intersect_df["CNS02_PAR"]
-            + intersect_df["CNS03_PAR"]
-            + intersect_df["CNS04_PAR"]
-            + intersect_df["CNS05_PAR"]
-            + intersect_df["CNS06_PAR"]
-            + intersect_df["CNS07_PAR"]
-            + intersect_df["CNS08_PAR"]
-            + intersect_df["CNS09_PAR"]
-            + intersect_df["CNS10_PAR"]
-            + intersect_df["CNS11_PAR"]
-            + intersect_df["CNS12_PAR"]
-            + intersect_df["CNS13_PAR"]
-            + intersect_df["CNS14_PAR"]
-            + intersect_df["CNS15_PAR"]
-            + intersect_df["CNS16_PAR"]
-            + intersect_df["CNS17_PAR"]
-            + intersect_df["CNS18_PAR"]
-            + intersect_df["CNS19_PAR"]
-            + intersect_df["CNS20_PAR"]
-    )
-    intersect_df["Total_Population"] = (
-            intersect_df["Total_Non_Hisp_PAR"] + intersect_df["Total_Hispanic_PAR"]
-    )
-
-    # Finally, we'll allocate transportation usage
-    print("--- allocating commutes")
-    # Commutes will be allocated relative to total population, so total by
-    # the block group and calculate the parcel share
-    tp_props = intersect_df.groupby(bg_id_field)["Total_Population"].sum().reset_index()
-    tp_props.columns = [bg_id_field, "TP_Agg"]
-    geoid_edit = tp_props[tp_props.TP_Agg == 0][bg_id_field]
-    intersect_df = pd.merge(intersect_df, tp_props, how="left", on=bg_id_field)
-    intersect_df["TP_Par_Prop"] = (
-            intersect_df["Total_Population"] / intersect_df["TP_Agg"]
-    )
-    # If there are any 0s (block groups with 0 population) replace with
-    # the population area population, in case commutes are predicted where
-    # population isn't
-    intersect_df.loc[
-        intersect_df[bg_id_field].isin(geoid_edit), "TP_Par_Prop"
-    ] = intersect_df["Population_Par_Prop"][intersect_df[bg_id_field].isin(geoid_edit)]
-    # Now we can allocate commutes
-    transit_vars = [
-        "Drove",
-        "Carpool",
-        "Transit",
-        "NonMotor",
-        "Work_From_Home",
-        "AllOther",
-    ]
-    for var in transit_vars:
-        intersect_df[f"{var}_PAR"] = intersect_df["TP_Par_Prop"] * intersect_df[var]
-
-    # And, now we can sum up totals
-    print("--- totaling allocated commutes")
-    intersect_df["Total_Commutes"] = (
-            intersect_df["Drove_PAR"]
-            + intersect_df["Carpool_PAR"]
-            + intersect_df["Transit_PAR"]
-            + intersect_df["NonMotor_PAR"]
-            + intersect_df["Work_From_Home_PAR"]
-            + intersect_df["AllOther_PAR"]
-    )
-
-    # Now we're ready to write
-
-    # We don't need all the columns we have, so first we define the columns
-    # we want and select them from our data. Note that we don't need to
-    # maintain the parcels_id_field here, because our save file has been
-    # initialized with this already!
-    print("--- selecting columns of interest")
-    to_keep = [
-        parcels_id,
-        parcel_liv_area,
-        parcel_lu,
+def allocate_bg_to_parcels_by_year(
+        bg_modeled_dfs,
+        bg_geoms,
         bg_id_field,
-        "Total_Employment",
-        "CNS01_PAR",
-        "CNS02_PAR",
-        "CNS03_PAR",
-        "CNS04_PAR",
-        "CNS05_PAR",
-        "CNS06_PAR",
-        "CNS07_PAR",
-        "CNS08_PAR",
-        "CNS09_PAR",
-        "CNS10_PAR",
-        "CNS11_PAR",
-        "CNS12_PAR",
-        "CNS13_PAR",
-        "CNS14_PAR",
-        "CNS15_PAR",
-        "CNS16_PAR",
-        "CNS17_PAR",
-        "CNS18_PAR",
-        "CNS19_PAR",
-        "CNS20_PAR",
-        "Total_Population",
-        "Total_Hispanic_PAR",
-        "White_Hispanic_PAR",
-        "Black_Hispanic_PAR",
-        "Asian_Hispanic_PAR",
-        "Multi_Hispanic_PAR",
-        "Other_Hispanic_PAR",
-        "Total_Non_Hisp_PAR",
-        "White_Non_Hisp_PAR",
-        "Black_Non_Hisp_PAR",
-        "Asian_Non_Hisp_PAR",
-        "Multi_Non_Hisp_PAR",
-        "Other_Non_Hisp_PAR",
-        "Total_Commutes",
-        "Drove_PAR",
-        "Carpool_PAR",
-        "Transit_PAR",
-        "NonMotor_PAR",
-        "Work_From_Home_PAR",
-        "AllOther_PAR",
-    ]
-    intersect_df = intersect_df[to_keep]
+        parcel_fcs,
+        parcels_id="FOLIO",
+        parcel_wcs=None,
+        parcel_lu="DOR_UC",
+        parcel_liv_area="TOT_LVG_AREA",
+):
+    """
+    Allocate block group data to parcels for several years, yielding each year's allocation as it
+    completes. The intersection of block groups and parcel centroids is computed once per distinct
+    parcel and block group geometry vintage (keyed by a hash of the geometries and their ids) and
+    reused for all years sharing it; only parcel attributes and modeled block group data are read
+    for each year.
 
-    return intersect_df
+    Each year is still allocated by its own `allocate_activities` call rather than as stacked
+    column blocks of one call: allocation shares depend on each year's parcel land uses and living
+    area (and where clause), so they cannot be shared among years, and stacking all years' parcel
+    rows would multiply the (parcels x activities) working arrays by the number of years. Allocating
+    year by year also lets each result be written before the next is computed.
+
+    Args:
+        bg_modeled_dfs (dict): `{year: bg_modeled_df}`; DataFrames of modeled block group job,
+            population, and commute data for allocation (see `allocate_bg_to_parcels`)
+        bg_geoms (dict): `{year: path}`; paths to feature classes of block group polygons
+        bg_id_field (str): block group key
+        parcel_fcs (dict): `{year: path}`; paths to parcel polygons, containing at a minimum a
+            unique ID field, land use field, and total living area field (Florida DOR)
+        parcels_id (str, default="FOLIO"): unique ID field in the parcels shape
+        parcel_wcs (dict, default=None): `{year: where clause}`; where clauses to limit allocation
+            to selected parcels in a given year (as when allocating NearTerm permitted parcels)
+        parcel_lu (str, default="DOR_UC"): land use code field in the parcels shape
+        parcel_liv_area (str, default="TOT_LVG_AREA"): building square footage field in the parcels shape
+
+    Yields:
+        year, alloc_df (tuple): the year and a dataframe of the resultant allocation based on model
+            (see `allocate_bg_to_parcels`)
+
+    See Also:
+        allocate_bg_to_parcels
+        allocate_activities
+    """
+    if parcel_wcs is None:
+        parcel_wcs = {}
+    intersections = {}
+    geom_hashes = {}
+    for year, bg_modeled_df in bg_modeled_dfs.items():
+        print(f"--- allocating {year}")
+        parcel_fc = parcel_fcs[year]
+        bg_geom = bg_geoms[year]
+
+        # Relate parcels to block groups once per geometry vintage
+        #   (each distinct layer is hashed once, so block groups shared by all years are read once)
+        for fc, id_field in [(parcel_fc, parcels_id), (bg_geom, bg_id_field)]:
+            if (fc, id_field) not in geom_hashes:
+                geom_hashes[(fc, id_field)] = _geometry_hash_(fc, id_field)
+        vintage = (geom_hashes[(parcel_fc, parcels_id)], geom_hashes[(bg_geom, bg_id_field)])
+        if vintage in intersections:
+            print("--- reusing block group and parcel intersection")
+        else:
+            print("--- intersecting blocks and parcels")
+            int_df = PMT.intersect_features(
+                summary_fc=bg_geom,
+                disag_fc=parcel_fc,
+                disag_fields=[parcels_id, "Shape_Area"],
+                as_df=True,
+            )
+            intersections[vintage] = int_df[[parcels_id, "Shape_Area", bg_id_field]]
+
+        # Attach this year's parcel attributes and modeled block group data
+        parcel_fl = arcpy.MakeFeatureLayer_management(
+            in_features=parcel_fc,
+            out_layer="parcel_fl",
+            where_clause=parcel_wcs.get(year, ""),
+        )
+        try:
+            par_df = PMT.featureclass_to_df(
+                in_fc=parcel_fl, keep_fields=[parcels_id, parcel_lu, parcel_liv_area]
+            )
+        finally:
+            arcpy.Delete_management(parcel_fl)
+        intersect_df = intersections[vintage].merge(par_df, how="inner", on=parcels_id)
+        bg_attrs = [c for c in bg_modeled_df.columns if c not in intersect_df.columns]
+        intersect_df = intersect_df.merge(
+            bg_modeled_df[[bg_id_field] + bg_attrs], how="left", on=bg_id_field
+        )
+        intersect_df[bg_attrs] = intersect_df[bg_attrs].fillna(0)
+
+        # Allocate jobs, population, and commutes
+        yield year, allocate_activities(
+            intersect_df=intersect_df,
+            bg_id_field=bg_id_field,
+            parcels_id=parcels_id,
+            parcel_lu=parcel_lu,
+            parcel_liv_area=parcel_liv_area,
+            parcel_land_area="Shape_Area",
+        )
 
 
 # MAZ/TAZ data prep helpers
@@ -3041,6 +3699,16 @@ def lines_to_centrality(line_features, impedance_attribute):
     df[names] = df["Name"].str.split(" - ", n=1, expand=True)
     # Summarize
     sum_df = df.groupby("Node").agg({"N": "size", imp_field: sum}).reset_index()
+    return _centrality_stats_(sum_df, imp_field)
+
+
+def _centrality_stats_(sum_df, imp_field):
+    """
+    Internal helper to add centrality, average length, and centrality index columns to a
+    data frame of reachable node counts (`N`) and total impedances (`imp_field`)
+
+    See Also: lines_to_centrality, network_centrality_csr
+    """
     # Calculate centrality
     sum_df["centrality"] = (sum_df.N - 1) / sum_df[imp_field]
     # Add average length
@@ -3186,6 +3854,36 @@ def parcel_walk_time_bin(in_table, bin_field, time_field, code_block):
     )
 
 
+def walk_time_bins(times, breaks, labels, null_label=""):
+    """
+    Assigns travel time categories to walk times in bulk. This is a vectorized alternative to
+        `parcel_walk_time_bin` for use on data frames before they are written to tables.
+    
+    Args:
+        times (array-like): Walk times
+        breaks (list): Increasing bin break points; a time is assigned to the first bin whose
+            break point it does not exceed
+        labels (list): Bin labels, one more than the number of `breaks` (the last label applies
+            to times over the last break point)
+        null_label (str, default=""): Label for missing times
+    
+    Returns:
+        bins (np.array): Bin labels for each time
+    
+    See Also:
+        parcel_walk_time_bin
+    """
+    if len(labels) != len(breaks) + 1:
+        raise ValueError(
+            f"Expected {len(breaks) + 1} labels for {len(breaks)} breaks - got {len(labels)}"
+        )
+    times = np.asarray(times, dtype=np.float64)
+    bin_idx = np.searchsorted(np.asarray(breaks, dtype=np.float64), times, side="left")
+    bins = np.asarray(labels, dtype=object)[np.minimum(bin_idx, len(breaks))]
+    bins[np.isnan(times)] = null_label
+    return bins
+
+
 def parcel_walk_times(
         parcel_fc,
         parcel_id_field,
@@ -3286,6 +3984,147 @@ def parcel_walk_times(
     return walk_time_df
 
 
+def parcel_network_walk_times(
+        parcel_fc,
+        parcel_id_field,
+        facilities,
+        in_edges,
+        mode="walk",
+        imped_attr="Minutes",
+        cutoff=30,
+        restrictions=None,
+        search_tolerance=None,
+        graph_cache=None,
+):
+    """
+    For features in a parcel feature class, estimate network walk times from facilities (stations,
+        parks, e.g.) directly over an OSM network graph (see `osm_to_csr`), without generating
+        service area lines. Facilities and parcels (by centroid) are snapped to their nearest
+        network nodes. A multi-source shortest path search is run from the nodes of each facility
+        (facilities sharing a name are solved together), and parcels are assigned the results at
+        their nodes. Generates the same fields as `parcel_walk_times`. Where restrictions scale
+        edge costs, paths are chosen by scaled costs and times are `imped_attr` totals along them.
+
+        Parcels are read and snapped once and the graph is built once for all sets of facilities.
+    
+    Args:
+        parcel_fc (str, gpd.GeoDataFrame): Path to the parcel features (shapefile or geodatabase
+            feature class) or a GeoDataFrame; must be in a projected coordinate system
+        parcel_id_field (str): The field in `parcel_fc` that uniquely identifies each feature.
+        facilities (dict): {target_name: (facility features, facility name field)}; facility
+            features are given as `parcel_fc` and the name field identifies key features (which
+            station, e.g.). Target names are used as suffixes in output field names.
+        in_edges (str, gpd.GeoDataFrame): OSM edge features (see `osm_to_csr`)
+        mode (str, default="walk"): "walk" or "bike"
+        imped_attr (str, default="Minutes"): The impedance attribute, "Minutes" or "Length"
+        cutoff (numeric, default=30): Only facilities within this impedance of a parcel are recorded
+        restrictions (str, list, default=None): Restriction attributes to honor (see `osm_to_csr`)
+        search_tolerance (str, default=None): A "linear unit" string ("1500 meters", e.g.) setting the
+            maximum snapping distance for parcels and facilities. If None, all features are snapped.
+        graph_cache (dict, default=None): graphs built by earlier calls, keyed by edges path, mode,
+            impedance, restrictions and crs. Pass the same dict for all years to build the graph
+            of each network vintage once.
+    
+    Returns:
+        walk_time_dfs: dict
+            {target_name: DataFrame}, data frames with columns storing walk time data:
+            `nearest_{target_name}`, `min_time_{target_name}`,
+            `n_{target_name}`
+    
+    See Also:
+        parcel_walk_times
+        osm_od_table
+    """
+    print("--- building network graph")
+    parcels = _read_features_(parcel_fc)
+    crs = parcels.crs
+    graph_key = None
+    if graph_cache is not None and not isinstance(in_edges, gpd.GeoDataFrame):
+        if isinstance(restrictions, list):
+            restrictions = ";".join(restrictions)
+        graph_key = (str(in_edges), mode, imped_attr, restrictions, str(crs))
+    if graph_key in (graph_cache or {}):
+        print("--- --- reusing graph built for an earlier year")
+        graph, imped, node_xy = graph_cache[graph_key]
+    else:
+        graph, imped, node_xy = osm_to_csr(
+            in_edges, mode, imped_attr=imped_attr, restrictions=restrictions, crs=crs
+        )
+        if graph_key is not None:
+            graph_cache[graph_key] = (graph, imped, node_xy)
+    if search_tolerance is None:
+        tolerance = np.inf
+    else:
+        tolerance = _distance_to_crs_units_(search_tolerance, crs)
+    print("--- locating parcels")
+    par_ids, par_pos = _snap_features_(parcels, parcel_id_field, node_xy, tolerance)
+    # Search beyond the cutoff when restrictions scale costs up
+    if np.array_equal(graph.data, imped.data):
+        limit = None
+    else:
+        scaled = imped.data > 0
+        limit = cutoff * max(1.0, np.max(graph.data[scaled] / imped.data[scaled], initial=1.0))
+
+    walk_time_dfs = {}
+    for target_name, (fac_features, facility_name_field) in facilities.items():
+        print(f"--- {target_name}: locating facilities")
+        fac_features = _read_features_(fac_features)
+        if fac_features.crs != crs:
+            fac_features = fac_features.to_crs(crs)
+        fac_names, fac_pos = _snap_features_(fac_features, facility_name_field, node_xy, tolerance)
+        walk_time_dfs[target_name] = _facility_walk_times_(
+            graph, imped, limit, cutoff, fac_names, fac_pos, par_ids, par_pos,
+            parcel_id_field, target_name,
+        )
+    return walk_time_dfs
+
+
+def _facility_walk_times_(
+        graph, imped, limit, cutoff, fac_names, fac_pos, par_ids, par_pos, parcel_id_field, target_name
+):
+    """
+    Internal helper to solve walk times from one set of snapped facilities to snapped parcels
+
+    See Also: parcel_network_walk_times
+    """
+    # Solve each facility, keeping the nearest facility, minimum time, and count at each node
+    names = pd.unique(fac_names)
+    print(f"--- {target_name}: solving walk times from {len(names)} facilities")
+    min_time = np.full(graph.shape[0], np.inf)
+    nearest = np.full(graph.shape[0], -1, dtype=np.int64)
+    number = np.zeros(graph.shape[0], dtype=np.int64)
+    for i, name in enumerate(names):
+        sources = np.unique(fac_pos[fac_names == name])
+        if limit is None:
+            times = dijkstra(graph, directed=True, indices=sources, limit=cutoff, min_only=True)
+        else:
+            # paths are chosen by scaled costs, so solve each source and keep the least impedance
+            dist, pred = dijkstra(
+                graph, directed=True, indices=sources, limit=limit, return_predecessors=True
+            )
+            acc = _path_impedances_(imped, pred)
+            times = np.where(np.isfinite(dist), acc, np.inf).min(axis=0)
+        reached = np.flatnonzero(times <= cutoff)
+        number[reached] += 1
+        closer = reached[times[reached] < min_time[reached]]
+        min_time[closer] = times[closer]
+        nearest[closer] = i
+
+    # Assign node results to parcels
+    print(f"--- {target_name}: summarizing times")
+    found = number[par_pos] > 0
+    par_pos = par_pos[found]
+    walk_time_df = pd.DataFrame(
+        {
+            parcel_id_field: par_ids[found],
+            f"nearest_{target_name}": names[nearest[par_pos]],
+            f"min_time_{target_name}": min_time[par_pos],
+            f"n_{target_name}": number[par_pos],
+        }
+    )
+    return walk_time_df.sort_values(parcel_id_field, kind="mergesort").reset_index(drop=True)
+
+
 def parcel_ideal_walk_time(
         parcels_fc,
         parcel_id_field,
@@ -3296,6 +4135,7 @@ def parcel_ideal_walk_time(
         overlap_type="HAVE_THEIR_CENTER_IN",
         sr=None,
         assumed_mph=3,
+        engine="arcpy",
 ):
     """
     Estimate walk time between parcels and target features (stations, parks,
@@ -3314,6 +4154,11 @@ def parcel_ideal_walk_time(
             target features are projected consistently. If `None`, the spatial
             reference from `parcels_fc` is used.
         assumed_mph (int/float): default=3; The assumed average walk speed expressed in miles per hour.
+        engine (str, default="arcpy"): "arcpy" selects parcels by location for each target feature;
+            "kdtree" reads parcel and target centroids once and finds parcels within `radius` of
+            each target centroid using a KD-tree (see `ideal_walk_times`). The "kdtree" engine only
+            supports the "HAVE_THEIR_CENTER_IN" overlap type and measures the radius from target
+            centroids, so it matches the "arcpy" engine for point targets.
     
     Returns:
         walk_time_fc: DataFrame
@@ -3321,16 +4166,38 @@ def parcel_ideal_walk_time(
             `nearest_{target_name}`, `min_time_{target_name}`,
             `n_{target_name}`
     """
-    # output_fields
-    nearest_field = f"nearest_{target_name}"
-    min_time_field = f"min_time_{target_name}"
-    n_field = f"n_{target_name}"
     # Set spatial reference
     if sr is None:
         sr = arcpy.Describe(parcels_fc).spatialReference
     else:
         sr = arcpy.SpatialReference(sr)
     mpu = float(sr.metersPerUnit)
+    if engine == "kdtree":
+        if overlap_type != "HAVE_THEIR_CENTER_IN":
+            raise ValueError(
+                f"engine='kdtree' only supports overlap_type='HAVE_THEIR_CENTER_IN' - got {overlap_type}"
+            )
+        print("--- reading parcel and target centroids")
+        par_arr = arcpy.da.FeatureClassToNumPyArray(
+            parcels_fc, [parcel_id_field, "SHAPE@X", "SHAPE@Y"], spatial_reference=sr
+        )
+        tgt_arr = arcpy.da.FeatureClassToNumPyArray(
+            target_fc, [target_name_field, "SHAPE@X", "SHAPE@Y"], spatial_reference=sr
+        )
+        return ideal_walk_times(
+            parcel_ids=par_arr[parcel_id_field],
+            parcel_xy=np.column_stack([par_arr["SHAPE@X"], par_arr["SHAPE@Y"]]),
+            target_names=tgt_arr[target_name_field],
+            target_xy=np.column_stack([tgt_arr["SHAPE@X"], tgt_arr["SHAPE@Y"]]),
+            radius=_linear_unit_to_meters_(radius) / mpu,
+            target_name=target_name,
+            parcel_id_field=parcel_id_field,
+            target_name_field=target_name_field,
+            meters_per_unit=mpu,
+            assumed_mph=assumed_mph,
+        )
+    elif engine != "arcpy":
+        raise ValueError(f"Expected engine to be one of ['arcpy', 'kdtree'] - got {engine}")
     # Make feature layers
     par_lyr = arcpy.MakeFeatureLayer_management(parcels_fc, "parcels")
     tgt_lyr = arcpy.MakeFeatureLayer_management(target_fc, "target")
@@ -3369,17 +4236,10 @@ def parcel_ideal_walk_time(
                 tgt_results.append(par_df[out_fields].copy())
         # Bind up results
         print("--- binding results")
-        bind_df = pd.concat(tgt_results).set_index(target_name_field)
-        # Group by/summarize
-        print("--- summarizing times")
-        gb = bind_df.groupby(parcel_id_field)
-        par_min = gb.min()
-        par_count = gb.size()
-        par_nearest = gb["minutes"].idxmin()
-        walk_time_df = pd.concat([par_nearest, par_min, par_count], axis=1)
-        walk_time_df.columns = [nearest_field, min_time_field, n_field]
-        walk_time_df.reset_index(inplace=True)
-        return walk_time_df
+        bind_df = pd.concat(tgt_results)
+        return _summarize_ideal_walk_times_(
+            bind_df, parcel_id_field, target_name_field, target_name
+        )
     except:
         raise
     finally:
@@ -3387,6 +4247,269 @@ def parcel_ideal_walk_time(
         arcpy.Delete_management(tgt_lyr)
 
 
+def _summarize_ideal_walk_times_(bind_df, parcel_id_field, target_name_field, target_name):
+    """
+    Internal helper to summarize parcel-target walk times (one row per pair, with columns
+    `parcel_id_field`, `target_name_field`, and "minutes") to the nearest target, minimum time,
+    and number of targets for each parcel
+
+    See Also: parcel_ideal_walk_time, ideal_walk_times
+    """
+    print("--- summarizing times")
+    bind_df = bind_df.set_index(target_name_field)[[parcel_id_field, "minutes"]]
+    gb = bind_df.groupby(parcel_id_field)
+    par_min = gb.min()
+    par_count = gb.size()
+    par_nearest = gb["minutes"].idxmin()
+    walk_time_df = pd.concat([par_nearest, par_min, par_count], axis=1)
+    walk_time_df.columns = [
+        f"nearest_{target_name}",
+        f"min_time_{target_name}",
+        f"n_{target_name}",
+    ]
+    walk_time_df.reset_index(inplace=True)
+    return walk_time_df
+
+
+def ideal_walk_times(
+        parcel_ids,
+        parcel_xy,
+        target_names,
+        target_xy,
+        radius,
+        target_name,
+        parcel_id_field="FOLIO",
+        target_name_field="Name",
+        meters_per_unit=1.0,
+        assumed_mph=3,
+):
+    """
+    Estimate walk time between parcels and target features from centroid coordinate arrays. Parcels
+    within `radius` of each target are found with a KD-tree and straight-line walk times, nearest
+    targets, and target counts are computed for all parcel-target pairs at once.
+
+    Args:
+        parcel_ids (array-like): Parcel id's
+        parcel_xy (np.array): (n x 2) parcel centroid coordinates; parcels with missing coordinates
+            are ignored
+        target_names (array-like): Target feature names
+        target_xy (np.array): (m x 2) target centroid coordinates in the same coordinate system
+            as `parcel_xy`
+        radius (float): Search radius from each target, in coordinate units
+        target_name (str): A string suffix included in output field names.
+        parcel_id_field (str, default="FOLIO"): Output parcel id field name
+        target_name_field (str, default="Name"): Target name field name (used internally)
+        meters_per_unit (float, default=1.0): Meters per coordinate unit
+        assumed_mph (int/float): default=3; The assumed average walk speed expressed in miles per hour.
+
+    Returns:
+        walk_time_df: DataFrame
+            A data frame with columns storing ideal walk time data:
+            `nearest_{target_name}`, `min_time_{target_name}`,
+            `n_{target_name}`
+    
+    See Also:
+        parcel_ideal_walk_time
+    """
+    print("--- estimating ideal times")
+    parcel_xy = np.asarray(parcel_xy, dtype=np.float64).reshape(-1, 2)
+    target_xy = np.asarray(target_xy, dtype=np.float64).reshape(-1, 2)
+    valid = np.flatnonzero(np.isfinite(parcel_xy).all(axis=1))
+    tree = cKDTree(parcel_xy[valid])
+    # parcels within the radius of each target, in target order
+    in_radius = tree.query_ball_point(target_xy, r=radius)
+    n_in = np.array([len(par_pos) for par_pos in in_radius], dtype=np.int64)
+    tgt_pos = np.repeat(np.arange(len(target_xy)), n_in)
+    par_pos = valid[
+        np.fromiter(chain.from_iterable(in_radius), dtype=np.int64, count=n_in.sum())
+    ]
+    # estimate distances
+    dx = parcel_xy[par_pos, 0] - target_xy[tgt_pos, 0]
+    dy = parcel_xy[par_pos, 1] - target_xy[tgt_pos, 1]
+    meters = np.sqrt(dx ** 2 + dy ** 2) * meters_per_unit
+    bind_df = pd.DataFrame(
+        {
+            parcel_id_field: np.asarray(parcel_ids)[par_pos],
+            target_name_field: np.asarray(target_names)[tgt_pos],
+            "minutes": (meters * 60) / (assumed_mph * 1609.344),
+        }
+    )
+    return _summarize_ideal_walk_times_(
+        bind_df, parcel_id_field, target_name_field, target_name
+    )
+
+
+def access_bin_sums(
+        skim_chunks, o_field, d_field, imped_field, imped_breaks, zone_ids, act_arrays, join_bys
+):
+    """
+    A vectorized kernel to accumulate activities by zone and impedance bin from a long OD skim.
+    Zone id's are mapped to dense indices once, impedances are binned to integer codes with
+    `np.digitize`, and activities are accumulated into preallocated arrays with `np.bincount`.
+    Several activity arrays (and join directions) can be accumulated in a single pass over the skim.
+
+    Impedance bins follow `summarize_access`: bin `i` holds impedances in
+    [`imped_breaks[i-1]`, `imped_breaks[i]`), the first bin has no lower bound, and the last bin
+    holds impedances at or above the last break (and missing impedances).
+
+    Args:
+        skim_chunks (iterable): pd.DataFrames of long OD data (see `iter_skim_chunks`)
+        o_field (str): Origin field
+        d_field (str): Destination field
+        imped_field (str): Impedance field
+        imped_breaks (list): Increasing impedance break points
+        zone_ids (array-like): Unique zone id's of the activity data; rows of each array in
+            `act_arrays` correspond to these zones.
+        act_arrays (list): [np.array, ...]; (n_zones x k) activity arrays aligned to `zone_ids`
+        join_bys (list): [str, ...]; for each array in `act_arrays`, "D" joins activities to
+            destinations and sums them by origin; "O" joins activities to origins and sums them
+            by destination.
+
+    Returns:
+        zones (np.array): Group zone id's: `zone_ids` followed by any skim zones not in `zone_ids`.
+        results (list): For each array in `act_arrays`, a tuple of arrays (counts, act_sums, wtd_sums)
+            with shapes (n_groups x n_bins), (n_groups x n_bins x k), and (n_groups x n_bins x k).
+            `counts` records the number of joined OD pairs, `act_sums` the sum of activities, and
+            `wtd_sums` the sum of impedance-weighted activities (nan values are skipped).
+    """
+    act_index = pd.Index(zone_ids)
+    if not act_index.is_unique:
+        raise ValueError("Expected unique zone id's")
+    zone_index = act_index
+    n_bins = len(imped_breaks) + 1
+    act_arrays = [np.asarray(a, dtype=np.float64).reshape(len(act_index), -1) for a in act_arrays]
+    results = [
+        [
+            np.zeros(len(zone_index) * n_bins),
+            np.zeros((len(zone_index) * n_bins, a.shape[1])),
+            np.zeros((len(zone_index) * n_bins, a.shape[1])),
+        ]
+        for a in act_arrays
+    ]
+    for chunk in skim_chunks:
+        imped = chunk[imped_field].to_numpy(dtype=np.float64)
+        bins = np.digitize(imped, imped_breaks)
+        for acts, join_by, result in zip(act_arrays, join_bys, results):
+            if join_by == "D":
+                act_field, gb_field = d_field, o_field
+            elif join_by == "O":
+                act_field, gb_field = o_field, d_field
+            else:
+                raise ValueError(f"Expected 'D' or 'O' as `join_by` value - got {join_by}")
+            # Join activities (inner)
+            act_idx = act_index.get_indexer(chunk[act_field].values)
+            keep = act_idx >= 0
+            act_idx = act_idx[keep]
+            gb_vals = chunk[gb_field].values[keep]
+            gb_idx = zone_index.get_indexer(gb_vals)
+            # Extend the zone index for group zones without activity data
+            if (gb_idx < 0).any():
+                new_zones = pd.unique(gb_vals[gb_idx < 0])
+                zone_index = zone_index.append(pd.Index(new_zones))
+                pad = len(new_zones) * n_bins
+                for res in results:
+                    res[0] = np.concatenate([res[0], np.zeros(pad)])
+                    res[1] = np.concatenate([res[1], np.zeros((pad, res[1].shape[1]))])
+                    res[2] = np.concatenate([res[2], np.zeros((pad, res[2].shape[1]))])
+                gb_idx = zone_index.get_indexer(gb_vals)
+            # Accumulate by zone and bin
+            flat = gb_idx * n_bins + bins[keep]
+            size = len(zone_index) * n_bins
+            result[0] += np.bincount(flat, minlength=size)
+            k_imped = imped[keep]
+            for j in range(acts.shape[1]):
+                a = acts[act_idx, j]
+                with np.errstate(invalid="ignore"):
+                    w = k_imped * a
+                result[1][:, j] += np.bincount(
+                    flat, weights=np.where(np.isnan(a), 0, a), minlength=size
+                )
+                result[2][:, j] += np.bincount(
+                    flat, weights=np.where(np.isnan(w), 0, w), minlength=size
+                )
+    n_zones = len(zone_index)
+    results = [
+        (
+            counts.reshape(n_zones, n_bins),
+            act_sums.reshape(n_zones, n_bins, -1),
+            wtd_sums.reshape(n_zones, n_bins, -1),
+        )
+        for counts, act_sums, wtd_sums in results
+    ]
+    return zone_index.values, results
+
+
+def _access_bins_to_df_(
+        zones, counts, act_sums, wtd_sums, gb_field, bin_field, act_fields, act_dtypes,
+        imped_breaks, units
+):
+    """
+    Internal helper to convert `access_bin_sums` outputs into the long table of activity sums
+    by zone and impedance bin that `summarize_access` summarizes.
+
+    See Also: access_bin_sums, summarize_access
+    """
+    labels = np.array(
+        [f"{i_break}{units}" for i_break in imped_breaks] + [f"{imped_breaks[-1]}{units}p"]
+    )
+    z_idx, b_idx = np.nonzero(counts)
+    out_df = pd.DataFrame({gb_field: zones[z_idx], bin_field: labels[b_idx]})
+    for j, act_field in enumerate(act_fields):
+        out_df[act_field] = act_sums[z_idx, b_idx, j]
+        if np.issubdtype(act_dtypes[act_field], np.integer):
+            out_df[act_field] = out_df[act_field].round().astype(act_dtypes[act_field])
+        out_df[f"Wtd{units}{act_field}"] = wtd_sums[z_idx, b_idx, j]
+    return out_df
+
+
+def _summarize_access_bins_(out_df, gb_field, bin_field, act_fields, units):
+    """
+    Internal helper to pivot activity sums by zone and impedance bin into columns and add
+    average impedance by activity.
+
+    See Also: summarize_access
+    """
+    sum_fields = [gb_field]
+    prod_fields = []
+    for act_field in act_fields:
+        new_field = f"Wtd{units}{act_field}"
+        sum_fields += [act_field, new_field]
+        prod_fields.append(new_field)
+    # Pivot, summarize, and join
+    # - Pivot
+    print("--- --- --- bin columns")
+    pivot_fields = [gb_field, bin_field] + act_fields
+    pivot = pd.pivot_table(
+        out_df[pivot_fields], index=gb_field, columns=bin_field, aggfunc="sum"
+    )
+    pivot.columns = PMT.col_multi_index_to_names(pivot.columns, separator="")
+    # - Summarize
+    print("--- --- --- average time by activitiy")
+    sum_df = out_df[sum_fields].groupby(gb_field).sum()
+    avg_fields = []
+    for act_field, prod_field in zip(act_fields, prod_fields):
+        avg_field = f"Avg{units}{act_field}"
+        avg_fields.append(avg_field)
+        sum_df[avg_field] = sum_df[prod_field] / sum_df[act_field]
+    # - Join
+    final_df = pivot.merge(
+        sum_df[avg_fields], how="outer", left_index=True, right_index=True
+    )
+
+    return final_df.reset_index()
+
+
+def _read_activity_data_(se_data, fields):
+    """
+    Internal helper to read activity fields from a socioeconomic data table (or data frame)
+
+    See Also: summarize_access, summarize_access_by_year
+    """
+    if isinstance(se_data, pd.DataFrame):
+        return se_data[fields].copy()
+    return pd.DataFrame(arcpy.da.TableToNumPyArray(se_data, fields))
+
+
 def summarize_access(
         skim_table,
         o_field,
@@ -3399,6 +4522,7 @@ def summarize_access(
         units="minutes",
         join_by="D",
         chunk_size=100000,
+        vectorized=False,
         **kwargs,
 ):
     """
@@ -3406,11 +4530,11 @@ def summarize_access(
         and summarizes activities by impedance bins.
 
     Args:
-        skim_table (str): Path to SKIM table
+        skim_table (str): Path to SKIM table (csv or skim store)
         o_field (str): Origin field
         d_field (str): Destination field
         imped_field (str): Impedance field
-        se_data (str): Path to socioeconomic data table
+        se_data (str or pd.DataFrame): Path to socioeconomic data table (or a data frame of it)
         id_field (str): `se_data`'s id field
         act_fields (list): activity type fields (job types, e.g.)
         imped_breaks (int/float): list of break points by time
@@ -3418,6 +4542,9 @@ def summarize_access(
         join_by (str, default="D"): join `se_data` based on o_field ("O") or d ("D")
         chunk_size (int, default=100000): number of rows to process simultaneously
             (larger values will finish faster by require more memory)
+        vectorized (bool, default=False): if True, activities are accumulated by zone and bin
+            with the `access_bin_sums` kernel instead of per-chunk merges and group-bys. Results
+            are the same (floating point sums may differ in the last digits).
         kwargs: Keyword arguments for reading the skim table
     
     Returns:
@@ -3436,16 +4563,42 @@ def summarize_access(
         raise ValueError(f"Expected 'D' or 'O' as `join_by` value - got {join_by}")
     bin_field = f"BIN_{units}"
     # Read the activity data
-    _a_fields_ = [id_field] + act_fields
-    act_df = pd.DataFrame(arcpy.da.TableToNumPyArray(se_data, _a_fields_))
+    act_df = _read_activity_data_(se_data, [id_field] + act_fields)
 
     # Read the skim table
-    out_dfs = []
     use_cols = [o_field, d_field, imped_field]
     print("--- --- --- binning skims")
-    for chunk in pd.read_csv(
-            skim_table, usecols=use_cols, chunksize=chunk_size, **kwargs
-    ):
+    chunks = iter_skim_chunks(
+        skim_table, usecols=use_cols, chunksize=chunk_size, **kwargs
+    )
+    if vectorized:
+        act_df = act_df.groupby(id_field).sum()
+        zones, [(counts, act_sums, wtd_sums)] = access_bin_sums(
+            chunks,
+            o_field,
+            d_field,
+            imped_field,
+            imped_breaks,
+            zone_ids=act_df.index.values,
+            act_arrays=[act_df[act_fields].values],
+            join_bys=[join_by],
+        )
+        out_df = _access_bins_to_df_(
+            zones,
+            counts,
+            act_sums,
+            wtd_sums,
+            gb_field,
+            bin_field,
+            act_fields,
+            act_df.dtypes,
+            imped_breaks,
+            units,
+        )
+        return _summarize_access_bins_(out_df, gb_field, bin_field, act_fields, units)
+
+    out_dfs = []
+    for chunk in chunks:
         # Define impedance bins
         low = -np.inf
         criteria = []
@@ -3463,39 +4616,123 @@ def summarize_access(
         # Join the activity data
         join_df = chunk.merge(act_df, how="inner", left_on=left_on, right_on=id_field)
         # Summarize
-        sum_fields = [gb_field]
-        prod_fields = []
         for act_field in act_fields:
             new_field = f"Wtd{units}{act_field}"
             join_df[new_field] = join_df[imped_field] * join_df[act_field]
-            sum_fields += [act_field, new_field]
-            prod_fields.append(new_field)
         sum_df = join_df.groupby([gb_field, bin_field]).sum().reset_index()
         out_dfs.append(sum_df)
     # Concatenate all
     out_df = pd.concat(out_dfs)
-    # Pivot, summarize, and join
-    # - Pivot
-    print("--- --- --- bin columns")
-    pivot_fields = [gb_field, bin_field] + act_fields
-    pivot = pd.pivot_table(
-        out_df[pivot_fields], index=gb_field, columns=bin_field, aggfunc=np.sum
+    return _summarize_access_bins_(out_df, gb_field, bin_field, act_fields, units)
+
+
+def summarize_access_by_year(
+        skim_table,
+        o_field,
+        d_field,
+        imped_field,
+        se_data,
+        id_field,
+        d_act_fields,
+        o_act_fields,
+        imped_breaks,
+        units="minutes",
+        chunk_size=100000,
+        **kwargs,
+):
+    """
+    Reads an origin-destination skim table once and summarizes activities by impedance bins
+    for several years of activity data, both to destinations (`join_by="D"`) and from
+    origins (`join_by="O"`). Activity data for all years are stacked into matrices and
+    accumulated in a single pass with `access_bin_sums`. For each year, results match
+    two `summarize_access` calls (floating point sums may differ in the last digits).
+
+    Args:
+        skim_table (str): Path to SKIM table (csv or skim store)
+        o_field (str): Origin field
+        d_field (str): Destination field
+        imped_field (str): Impedance field
+        se_data (dict): {year: path to socioeconomic data table (or a data frame of it)}
+        id_field (str): `se_data`'s id field
+        d_act_fields (list): activity type fields summarized by origin for activities at
+            destinations (jobs, e.g.)
+        o_act_fields (list): activity type fields summarized by destination for activities at
+            origins (households, e.g.)
+        imped_breaks (int/float): list of break points by time
+        units (str, default="minutes"): cost units of `imped_field`
+        chunk_size (int, default=100000): number of rows to process simultaneously
+        kwargs: Keyword arguments for reading the skim table
+
+    Returns:
+        dict: {year: (to_dest_df, from_orig_df)}, where `to_dest_df` is keyed by `o_field` and
+            `from_orig_df` by `d_field` as in `summarize_access`
+    """
+    if isinstance(d_act_fields, string_types):
+        d_act_fields = [d_act_fields]
+    if isinstance(o_act_fields, string_types):
+        o_act_fields = [o_act_fields]
+    bin_field = f"BIN_{units}"
+    specs = [("D", o_field, d_act_fields), ("O", d_field, o_act_fields)]
+    years = list(se_data.keys())
+    # Read activity data for all years
+    _a_fields_ = [id_field] + list(dict.fromkeys(d_act_fields + o_act_fields))
+    act_dfs = {
+        year: _read_activity_data_(se_data[year], _a_fields_).groupby(id_field).sum()
+        for year in years
+    }
+    zone_ids = reduce(np.union1d, [act_df.index.values for act_df in act_dfs.values()])
+    # Stack activities by year; a presence column per year tracks which zones are in each
+    #   year's data so OD pairs are joined (counted) exactly as with an inner merge
+    act_arrays = []
+    for join_by, gb_field, act_fields in specs:
+        blocks = []
+        for year in years:
+            act_df = act_dfs[year]
+            blocks.append(act_df[act_fields].reindex(zone_ids).to_numpy(dtype=np.float64))
+            blocks.append(np.isin(zone_ids, act_df.index.values)[:, None].astype(np.float64))
+        act_arrays.append(np.hstack(blocks))
+
+    print("--- --- --- binning skims")
+    chunks = iter_skim_chunks(
+        skim_table,
+        usecols=[o_field, d_field, imped_field],
+        chunksize=chunk_size,
+        **kwargs,
     )
-    pivot.columns = PMT.col_multi_index_to_names(pivot.columns, separator="")
-    # - Summarize
-    print("--- --- --- average time by activitiy")
-    sum_df = out_df[sum_fields].groupby(gb_field).sum()
-    avg_fields = []
-    for act_field, prod_field in zip(act_fields, prod_fields):
-        avg_field = f"Avg{units}{act_field}"
-        avg_fields.append(avg_field)
-        sum_df[avg_field] = sum_df[prod_field] / sum_df[act_field]
-    # - Join
-    final_df = pivot.merge(
-        sum_df[avg_fields], how="outer", left_index=True, right_index=True
+    zones, results = access_bin_sums(
+        chunks,
+        o_field,
+        d_field,
+        imped_field,
+        imped_breaks,
+        zone_ids=zone_ids,
+        act_arrays=act_arrays,
+        join_bys=[spec[0] for spec in specs],
     )
-
-    return final_df.reset_index()
+    # Summarize each year
+    out = {}
+    for i, year in enumerate(years):
+        year_dfs = []
+        for (join_by, gb_field, act_fields), (_, act_sums, wtd_sums) in zip(specs, results):
+            start = i * (len(act_fields) + 1)
+            cols = slice(start, start + len(act_fields))
+            out_df = _access_bins_to_df_(
+                zones,
+                act_sums[:, :, start + len(act_fields)],
+                act_sums[:, :, cols],
+                wtd_sums[:, :, cols],
+                gb_field,
+                bin_field,
+                act_fields,
+                act_dfs[year].dtypes,
+                imped_breaks,
+                units,
+            )
+            year_dfs.append(
+                _summarize_access_bins_(out_df, gb_field, bin_field, act_fields, units)
+            )
+        out[year] = tuple(year_dfs)
+    return out
 
 
 def generate_od_table(
@@ -3529,7 +4766,7 @@ def generate_od_table(
         imped_attr (str): String; impedance attribute
         cutoff (int): numeric
         net_loader (class): NetLoader object defininig how our network is loaded/configured
-        out_table (str): Path to output table
+        out_table (str): Path to output table (csv or skim store, see `is_skim_store`)
         restrictions (list): [String, ...], default=None
             List of restriction attributes to apply during the analysis.
         use_hierarchy (bool): Boolean, default=False
@@ -3578,7 +4815,6 @@ def generate_od_table(
         if o_chunk_size is None:
             o_chunk_size = int(arcpy.GetCount_management(origin_pts)[0])
         write_mode = "w"
-        header = True
         for o_pts in PMT.iter_rows_as_chunks(origin_pts, chunksize=o_chunk_size):
             # TODO: update printing: too many messages when iterating
             PMT._loadLocations(
@@ -3612,11 +4848,10 @@ def generate_od_table(
                 df[names] = df["Name"].str.split(" - ", n=1, expand=True)
 
                 # Save
-                df.to_csv(out_table, index=False, mode=write_mode, header=header)
+                write_skim_chunk(df, out_table, mode=write_mode, index=False)
 
                 # Update writing params
                 write_mode = "a"
-                header = False
     except:
         raise
     finally:
@@ -3624,6 +4859,34 @@ def generate_od_table(
         arcpy.Delete_management(net_layer)
 
 
+def _skim_matrix_travel_sums_(
+        skim, o_field, d_field, veh_trips_field, auto_time_field, dist_field
+):
+    """
+    Internal helper to sum trips, time, distance, VMT and VHT by origin and by destination
+    zone from a `PMT.SkimMatrix`
+
+    See Also: taz_travel_stats
+    """
+    trips, auto_time, dist = [
+        np.where(np.isinf(skim.layers[f]), 0, skim.layers[f]).astype(np.float64)
+        for f in [veh_trips_field, auto_time_field, dist_field]
+    ]
+    arrays = {
+        veh_trips_field: trips,
+        auto_time_field: auto_time,
+        dist_field: dist,
+        "VMT": trips * dist,
+        "VHT": trips * auto_time,
+    }
+    dfs = []
+    for axis, key_field in zip([1, 0], [o_field, d_field]):
+        present = skim.mask.any(axis=axis)
+        sums = {f: np.nansum(arr, axis=axis)[present] for f, arr in arrays.items()}
+        dfs.append(pd.DataFrame(sums, index=pd.Index(skim.zones[present], name=key_field)))
+    return dfs
+
+
 def taz_travel_stats(
         od_table,
         o_field,
@@ -3643,9 +4906,11 @@ def taz_travel_stats(
         average trip length.
 
     Args:
-        od_table (str): Path to a csv table containing origin-destination information, including
-            number of vehicle trips, travel time by car, travel distance by car,
-            and travel time by transit
+        od_table (str or PMT.SkimMatrix): Path to a csv table or skim store containing origin-destination
+            information, including number of vehicle trips, travel time by car, travel distance by car,
+            and travel time by transit. If a `SkimMatrix` is given, its layers are named for the
+            `veh_trips_field`, `auto_time_field`, and `dist_field` and OD sums are computed as
+            row and column sums of the matrix.
         o_field (str): Field identifying origins in `od_tables`
         d_field (str): Field identifying destinations in `od_tables`
         veh_trips_field (str): Field recording number of vehicle trips in `od_tables`
@@ -3671,17 +4936,22 @@ def taz_travel_stats(
     renames = {hh_field: "HH", jobs_field: "JOB"}
     weight_fields = ["HH", "JOB"]
     suffixes = ("_FROM", "_TO")
-    for chunk in pd.read_csv(od_table, chunksize=chunksize, **kwargs):
-        chunk.replace(np.inf, 0, inplace=True)
-        chunk["VMT"] = chunk[veh_trips_field] * chunk[dist_field]
-        chunk["VHT"] = chunk[veh_trips_field] * chunk[auto_time_field]
-        for df_list, key_field in zip([o_sums, d_sums], key_fields):
-            df_list.append(chunk.groupby(key_field).sum()[sum_fields].reset_index())
-    # Assemble summaries and re-summarize
-    o_df = pd.concat(o_sums)
-    d_df = pd.concat(d_sums)
-    o_df = o_df.groupby(o_field).sum()
-    d_df = d_df.groupby(d_field).sum()
+    if isinstance(od_table, PMT.SkimMatrix):
+        o_df, d_df = _skim_matrix_travel_sums_(
+            od_table, o_field, d_field, veh_trips_field, auto_time_field, dist_field
+        )
+    else:
+        for chunk in iter_skim_chunks(od_table, chunksize=chunksize, **kwargs):
+            chunk.replace(np.inf, 0, inplace=True)
+            chunk["VMT"] = chunk[veh_trips_field] * chunk[dist_field]
+            chunk["VHT"] = chunk[veh_trips_field] * chunk[auto_time_field]
+            for df_list, key_field in zip([o_sums, d_sums], key_fields):
+                df_list.append(chunk.groupby(key_field).sum()[sum_fields].reset_index())
+        # Assemble summaries and re-summarize
+        o_df = pd.concat(o_sums)
+        d_df = pd.concat(d_sums)
+        o_df = o_df.groupby(o_field).sum()
+        d_df = d_df.groupby(d_field).sum()
 
     # Calculate rates
     dfs = [o_df, d_df]
@@ -3941,8 +5211,543 @@ def validate_weights(weights):
         )
 
 
+# (row, column) offsets of the 9 neighbors in contiguity weights (see `validate_weights`)
+_NEIGHBOR_OFFSETS_ = {
+    "top_left": (-1, -1),
+    "middle_left": (0, -1),
+    "bottom_left": (1, -1),
+    "top_center": (-1, 0),
+    "self": (0, 0),
+    "bottom_center": (1, 0),
+    "top_right": (-1, 1),
+    "middle_right": (0, 1),
+    "bottom_right": (1, 1),
+}
+
+
+def contiguity_kernel(ras_array, weights, nodata=-1):
+    """
+    Calculates the contiguity index of each polygon in a raster of polygon ID's. Each cell's
+        weight is the sum of the weights of its neighbors (and itself) in the same polygon, found
+        by comparing the raster to copies of itself shifted one cell in each direction. Polygon
+        contiguity is the mean cell weight, rescaled by the total weight, with polygon means
+        accumulated by `np.bincount`. Memory use is a small multiple of the raster size.
+
+    Args:
+        ras_array (np.array): 2d array of polygon ID's
+        weights (dict): weights for each of the 9 possible neighbors (see `validate_weights`)
+        nodata (int, default=-1): value of cells not covered by any polygon
+
+    Returns:
+        poly_ids (np.array): sorted polygon ID's
+        contiguity (np.array): contiguity index of each polygon in `poly_ids`
+    
+    See Also:
+        calculate_contiguity_index
+    """
+    nrow, ncol = ras_array.shape
+    valid = ras_array != nodata
+    # Pad with nodata so shifted comparisons never match beyond the raster edges
+    padded = np.full((nrow + 2, ncol + 2), nodata, dtype=ras_array.dtype)
+    padded[1:-1, 1:-1] = ras_array
+    # Sum weights by cell (accumulated in the neighbor order of the original neighbor table)
+    weight_dtype = np.result_type(*[np.asarray(w) for w in weights.values()])
+    cell_weights = np.zeros((nrow, ncol), dtype=weight_dtype)
+    for key, (dr, dc) in _NEIGHBOR_OFFSETS_.items():
+        match = valid & (padded[1 + dr: nrow + 1 + dr, 1 + dc: ncol + 1 + dc] == ras_array)
+        cell_weights[match] += weights[key]
+    # Average cell weights by polygon
+    poly_ids, poly_idx, n_cells = np.unique(
+        ras_array[valid], return_inverse=True, return_counts=True
+    )
+    weight_sums = np.bincount(poly_idx, weights=cell_weights[valid], minlength=len(poly_ids))
+    weight_max = sum(weights.values())
+    contiguity = (weight_sums / n_cells - 1) / (weight_max - 1)
+    return poly_ids, contiguity
+
+
+def contiguity_tile_counts(ras_array, halo=1, nodata=-1):
+    """
+    Counts the cells of each polygon in the core of a tile raster and, for each of the 9
+        neighbor positions, the number of those cells whose neighbor belongs to the same polygon.
+        The outer `halo` rows and columns of `ras_array` are only used as neighbors, so counts
+        from tiles that partition a raster (each with a halo) sum to the counts of the whole
+        raster. Counts are integers, so they can be reduced across tiles in any order.
+
+    Args:
+        ras_array (np.array): 2d array of polygon ID's, including the halo
+        halo (int, default=1): width of the halo around the tile core (in cells)
+        nodata (int, default=-1): value of cells not covered by any polygon
+
+    Returns:
+        poly_ids (np.array): sorted ID's of polygons in the tile core
+        n_cells (np.array): number of core cells in each polygon
+        neighbor_counts (np.array): (n_polys x 9) number of cells with a same-polygon neighbor
+            at each position (ordered as `_NEIGHBOR_OFFSETS_`)
+    
+    See Also:
+        contiguity_from_counts
+        contiguity_tiles
+    """
+    nrow, ncol = ras_array.shape
+    core = ras_array[halo: nrow - halo, halo: ncol - halo]
+    valid = core != nodata
+    poly_ids, poly_idx, n_cells = np.unique(core[valid], return_inverse=True, return_counts=True)
+    neighbor_counts = np.zeros((len(poly_ids), len(_NEIGHBOR_OFFSETS_)), dtype=np.int64)
+    for k, (dr, dc) in enumerate(_NEIGHBOR_OFFSETS_.values()):
+        shifted = ras_array[halo + dr: nrow - halo + dr, halo + dc: ncol - halo + dc]
+        match = (shifted == core)[valid]
+        neighbor_counts[:, k] = np.bincount(poly_idx[match], minlength=len(poly_ids))
+    return poly_ids, n_cells.astype(np.int64), neighbor_counts
+
+
+def contiguity_from_counts(n_cells, neighbor_counts, weights):
+    """
+    Calculates polygon contiguity indices from cell and neighbor counts (see
+        `contiguity_tile_counts`). With integer weights, results are identical to `contiguity_kernel`.
+
+    Args:
+        n_cells (np.array): number of cells in each polygon
+        neighbor_counts (np.array): (n_polys x 9) same-polygon neighbor counts
+        weights (dict): weights for each of the 9 possible neighbors (see `validate_weights`)
+
+    Returns:
+        contiguity (np.array): contiguity index of each polygon
+    """
+    weight_vector = np.array([weights[key] for key in _NEIGHBOR_OFFSETS_])
+    weight_sums = neighbor_counts @ weight_vector
+    weight_max = sum(weights.values())
+    return (weight_sums / n_cells - 1) / (weight_max - 1)
+
+
+def _contiguity_tile_(in_fc, id_field, tile_extent, cell_size):
+    """
+    Internal helper to rasterize the polygons in a tile extent (including its halo) and count
+        polygon cells and neighbors in the tile core. Run in worker processes by `contiguity_tiles`.
+
+    See Also: contiguity_tiles
+    """
+    xmin, ymin, xmax, ymax = tile_extent
+    ncols = int(round((xmax - xmin) / cell_size))
+    nrows = int(round((ymax - ymin) / cell_size))
+    extent_poly = arcpy.Polygon(
+        arcpy.Array(
+            [
+                arcpy.Point(xmin, ymin),
+                arcpy.Point(xmin, ymax),
+                arcpy.Point(xmax, ymax),
+                arcpy.Point(xmax, ymin),
+            ]
+        ),
+        arcpy.Describe(in_fc).spatialReference,
+    )
+    tile_lyr = arcpy.MakeFeatureLayer_management(in_features=in_fc, out_layer="_tile_lyr_")
+    rp = PMT.make_inmem_path()
+    try:
+        arcpy.SelectLayerByLocation_management(
+            in_layer=tile_lyr, overlap_type="INTERSECT", select_features=extent_poly
+        )
+        if int(arcpy.GetCount_management(tile_lyr)[0]) == 0:
+            return contiguity_tile_counts(np.full((nrows, ncols), -1), halo=1, nodata=-1)
+        with arcpy.EnvManager(extent=arcpy.Extent(xmin, ymin, xmax, ymax)):
+            arcpy.FeatureToRaster_conversion(
+                in_features=tile_lyr, field=id_field, out_raster=rp, cell_size=cell_size
+            )
+        ras_array = arcpy.RasterToNumPyArray(
+            in_raster=rp,
+            lower_left_corner=arcpy.Point(xmin, ymin),
+            ncols=ncols,
+            nrows=nrows,
+            nodata_to_value=-1,
+        )
+        return contiguity_tile_counts(ras_array, halo=1, nodata=-1)
+    finally:
+        if arcpy.Exists(rp):
+            arcpy.Delete_management(rp)
+        arcpy.Delete_management(tile_lyr)
+
+
+def _polygon_edges_(polygons):
+    """
+    Internal helper to list the ring edges (exterior and interior) of polygon or multipolygon
+        geometries as arrays of polygon positions and edge end point coordinates
+
+    See Also: rasterize_polygons
+    """
+    poly_pos, rings = [], []
+    for i, geom in enumerate(polygons):
+        if geom is None or geom.is_empty:
+            continue
+        parts = getattr(geom, "geoms", [geom])
+        for part in parts:
+            for ring in [part.exterior] + list(part.interiors):
+                coords = np.asarray(ring.coords, dtype=np.float64)[:, :2]
+                rings.append(np.column_stack([coords[:-1], coords[1:]]))
+                poly_pos.append(np.full(len(coords) - 1, i, dtype=np.int64))
+    if not rings:
+        return np.array([], dtype=np.int64), np.empty((0, 4))
+    return np.concatenate(poly_pos), np.concatenate(rings)
+
+
+def rasterize_polygons(polygons, values, extent, cell_size, nodata=-1, dtype=np.int32):
+    """
+    Burns polygon values into a raster array with a scanline algorithm. A cell is assigned a
+        polygon's value if the cell center falls within the polygon (the cell-center rule used
+        by `arcpy.FeatureToRaster_conversion`), so rasters of adjacent extents on a common grid
+        line up exactly. Where polygons overlap, later polygons overwrite earlier ones.
+
+    Args:
+        polygons (iterable): shapely Polygon or MultiPolygon geometries (a GeoSeries, e.g.), or a
+            tuple of (polygon positions, edges) coordinate arrays, where edges is an (n x 4)
+            array of ring segments (x0, y0, x1, y1) and polygon positions give the position in
+            `values` of each segment's polygon
+        values (array-like): value burned for each polygon
+        extent (tuple): (xmin, ymin, xmax, ymax) raster extent; should be a multiple of `cell_size`
+            in each dimension
+        cell_size (numeric): raster cell size (in the units of the polygon coordinates)
+        nodata (int, default=-1): value of cells not covered by any polygon
+        dtype (np.dtype, default=np.int32): output data type
+
+    Returns:
+        np.array: (nrows x ncols) raster array; the first row is the top (ymax) of `extent`, as in
+            `arcpy.RasterToNumPyArray`
+    """
+    xmin, ymin, xmax, ymax = extent
+    ncols = int(round((xmax - xmin) / cell_size))
+    nrows = int(round((ymax - ymin) / cell_size))
+    out = np.full((nrows, ncols), nodata, dtype=dtype)
+    if isinstance(polygons, tuple):
+        poly_pos, edges = polygons
+    else:
+        poly_pos, edges = _polygon_edges_(polygons)
+    values = np.asarray(values)
+    # Skip horizontal edges (they never cross a scanline)
+    x0, y0, x1, y1 = edges.T
+    keep = y0 != y1
+    poly_pos, x0, y0, x1, y1 = poly_pos[keep], x0[keep], y0[keep], x1[keep], y1[keep]
+    # Find the rows whose cell center scanline y crosses each edge (in [min(y0, y1), max(y0, y1)))
+    y_lo, y_hi = np.minimum(y0, y1), np.maximum(y0, y1)
+    row_start = np.maximum(np.floor((ymax - y_hi) / cell_size - 0.5).astype(np.int64) + 1, 0)
+    row_end = np.minimum(np.floor((ymax - y_lo) / cell_size - 0.5).astype(np.int64), nrows - 1) + 1
+    n_rows = np.maximum(row_end - row_start, 0)
+    edge_idx = np.repeat(np.arange(len(n_rows)), n_rows)
+    rows = np.arange(n_rows.sum()) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+    rows += row_start[edge_idx]
+    y_c = ymax - (rows + 0.5) * cell_size
+    x_c = x0[edge_idx] + (y_c - y0[edge_idx]) * (x1[edge_idx] - x0[edge_idx]) / (
+        y1[edge_idx] - y0[edge_idx]
+    )
+    # Pair crossings by polygon and row (even-odd rule) to form spans of interior cell centers
+    cross_poly = poly_pos[edge_idx]
+    order = np.lexsort((x_c, rows, cross_poly))
+    cross_poly, rows, x_c = cross_poly[order], rows[order], x_c[order]
+    span_poly, span_row = cross_poly[0::2], rows[0::2]
+    col_start = np.ceil((x_c[0::2] - xmin) / cell_size - 0.5).astype(np.int64)
+    col_end = np.ceil((x_c[1::2] - xmin) / cell_size - 0.5).astype(np.int64)
+    col_start, col_end = np.clip(col_start, 0, ncols), np.clip(col_end, 0, ncols)
+    # Burn spans in polygon order
+    n_cols = np.maximum(col_end - col_start, 0)
+    span_idx = np.repeat(np.arange(len(n_cols)), n_cols)
+    cols = np.arange(n_cols.sum()) - np.repeat(np.cumsum(n_cols) - n_cols, n_cols)
+    cols += col_start[span_idx]
+    out[span_row[span_idx], cols] = values[span_poly[span_idx]]
+    return out
+
+
+def _contiguity_tile_numpy_(polygons, poly_ids, tile_extent, cell_size):
+    """
+    Internal helper to rasterize polygons in a tile extent (including its halo) with
+        `rasterize_polygons` and count polygon cells and neighbors in the tile core. Run in worker
+        processes by `contiguity_tiles`.
+
+    See Also: contiguity_tiles
+    """
+    ras_array = rasterize_polygons(
+        polygons, poly_ids, tile_extent, cell_size, nodata=-1, dtype=np.int64
+    )
+    return contiguity_tile_counts(ras_array, halo=1, nodata=-1)
+
+
+def _tile_extents_(quad_ext, fc_ext, cell_size):
+    """
+    Internal helper to build tile extents (with a one-cell halo) on a common raster grid covering
+        quadrat extents and a feature extent. Quadrat edges are snapped to grid lines (shared
+        edges snap to the same line, so tiles partition the grid) and outer quadrats are extended
+        to the grid bounds.
+
+    See Also: contiguity_tiles
+    """
+    quad_ext = np.asarray(quad_ext, dtype=np.float64)
+    grid_xmin = min(quad_ext[:, 0].min(), fc_ext[0])
+    grid_ymax = max(quad_ext[:, 3].max(), fc_ext[3])
+    grid_ncols = int(np.ceil((max(quad_ext[:, 2].max(), fc_ext[2]) - grid_xmin) / cell_size))
+    grid_nrows = int(np.ceil((grid_ymax - min(quad_ext[:, 1].min(), fc_ext[1])) / cell_size))
+    cols = np.round((quad_ext[:, [0, 2]] - grid_xmin) / cell_size).astype(int)
+    rows = np.round((grid_ymax - quad_ext[:, [3, 1]]) / cell_size).astype(int)
+    cols[cols[:, 0] == cols[:, 0].min(), 0] = 0
+    cols[cols[:, 1] == cols[:, 1].max(), 1] = grid_ncols
+    rows[rows[:, 0] == rows[:, 0].min(), 0] = 0
+    rows[rows[:, 1] == rows[:, 1].max(), 1] = grid_nrows
+    return [
+        (
+            grid_xmin + (c0 - 1) * cell_size,
+            grid_ymax - (r1 + 1) * cell_size,
+            grid_xmin + (c1 + 1) * cell_size,
+            grid_ymax - (r0 - 1) * cell_size,
+        )
+        for (c0, c1), (r0, r1) in zip(cols, rows)
+        if c1 > c0 and r1 > r0
+    ]
+
+
+def _quadrat_extents_(quadrats_fc):
+    """
+    Internal helper to list quadrat extents as an (n x 4) array of (xmin, ymin, xmax, ymax)
+
+    See Also: contiguity_tiles
+    """
+    if isinstance(quadrats_fc, gpd.GeoDataFrame):
+        return quadrats_fc.geometry.bounds.values
+    quad_ext = []
+    with arcpy.da.SearchCursor(quadrats_fc, ["SHAPE@"]) as search:
+        for (geom,) in search:
+            ext = geom.extent
+            quad_ext.append([ext.XMin, ext.YMin, ext.XMax, ext.YMax])
+    return np.array(quad_ext, dtype=np.float64)
+
+
+def contiguity_tiles(
+        in_fc,
+        id_field,
+        quadrats_fc,
+        cell_size,
+        weights,
+        workers=1,
+        rasterizer="arcpy",
+        grid_extent=None,
+):
+    """
+    Rasterizes polygons and calculates their contiguity and developable area in tiles defined by
+        a fishnet of quadrats. All tiles share one raster grid, and each is rasterized with a
+        one-cell halo so neighbors at tile edges are found. Polygon cell and neighbor counts are
+        summed across tiles, so polygons straddling tile borders get exactly the same index as in
+        a single-tile run. Tiles may be processed on a pool of worker processes, so the number
+        of quadrats sets both the memory used per tile and the available parallelism.
+
+    Args:
+        in_fc (str, gpd.GeoDataFrame): path to polygon features (on disk, so worker processes can
+            read them) or, if `rasterizer` is "numpy", a GeoDataFrame
+        id_field (str): integer field uniquely identifying polygons in `in_fc`
+        quadrats_fc (str, gpd.GeoDataFrame): path to fishnet of quadrats (see
+            `generate_chunking_fishnet`) or a GeoDataFrame of quadrats
+        cell_size (int): raster cell size (in the units of the input data crs)
+        weights (dict): weights for each of the 9 possible neighbors (see `validate_weights`)
+        workers (int, default=1): number of processes used to score tiles; if 1, tiles are
+            processed sequentially in this process
+        rasterizer (str, default="arcpy"): "arcpy" rasterizes tiles with
+            `arcpy.FeatureToRaster_conversion`; "numpy" reads polygons once with geopandas and
+            rasterizes tiles with `rasterize_polygons`, so tiles can be scored without arcpy.
+        grid_extent (list, default=None): (xmin, ymin, xmax, ymax) extent the raster grid must
+            cover (in addition to the quadrats); if None, the extent of `in_fc` is used. Setting
+            a fixed extent keeps the grid (and results) the same for any subset of `in_fc`.
+
+    Returns:
+        pd.DataFrame: table of polygon ID's (as "PolyID"), contiguity, and developable area
+    
+    See Also:
+        contiguity_tile_counts
+        calculate_contiguity_index
+    """
+    if rasterizer not in ["arcpy", "numpy"]:
+        raise ValueError(f"Expected 'arcpy' or 'numpy' as `rasterizer` value - got {rasterizer}")
+    # Build a common grid covering the quadrats and features
+    quad_ext = _quadrat_extents_(quadrats_fc)
+    if rasterizer == "numpy":
+        polys = _read_features_(in_fc)
+        fc_ext = polys.total_bounds
+        poly_bounds = polys.geometry.bounds.values
+        poly_ids = polys[id_field].to_numpy()
+    else:
+        ext = arcpy.Describe(in_fc).extent
+        fc_ext = [ext.XMin, ext.YMin, ext.XMax, ext.YMax]
+    if grid_extent is not None:
+        fc_ext = grid_extent
+    tile_extents = _tile_extents_(quad_ext, fc_ext, cell_size)
+
+    def tile_args(tile_extent):
+        if rasterizer == "arcpy":
+            return _contiguity_tile_, (in_fc, id_field, tile_extent, cell_size)
+        # polygons with bounding boxes intersecting the tile
+        xmin, ymin, xmax, ymax = tile_extent
+        in_tile = (
+                (poly_bounds[:, 0] <= xmax)
+                & (poly_bounds[:, 2] >= xmin)
+                & (poly_bounds[:, 1] <= ymax)
+                & (poly_bounds[:, 3] >= ymin)
+        )
+        tile_polys = _polygon_edges_(polys.geometry.values[in_tile])
+        return _contiguity_tile_numpy_, (tile_polys, poly_ids[in_tile], tile_extent, cell_size)
+
+    print(f"--- --- scoring {len(tile_extents)} tiles")
+    if workers <= 1:
+        tile_counts = []
+        for i, tile_extent in enumerate(tile_extents):
+            print(f"--- --- --- tile {i + 1} of {len(tile_extents)}")
+            func, args = tile_args(tile_extent)
+            tile_counts.append(func(*args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(func, *args)
+                for func, args in map(tile_args, tile_extents)
+            ]
+            tile_counts = [f.result() for f in futures]
+
+    print("--- --- reducing tile counts by polygon")
+    poly_ids, poly_idx = np.unique(
+        np.concatenate([tc[0] for tc in tile_counts]), return_inverse=True
+    )
+    n_cells = np.zeros(len(poly_ids), dtype=np.int64)
+    np.add.at(n_cells, poly_idx, np.concatenate([tc[1] for tc in tile_counts]))
+    neighbor_counts = np.zeros((len(poly_ids), len(_NEIGHBOR_OFFSETS_)), dtype=np.int64)
+    np.add.at(neighbor_counts, poly_idx, np.concatenate([tc[2] for tc in tile_counts]))
+    contiguity = pd.DataFrame(
+        {
+            "PolyID": poly_ids,
+            "Contiguity": contiguity_from_counts(n_cells, neighbor_counts, weights),
+            "Developable_Area": n_cells * (cell_size ** 2) / 43560,
+        }
+    )
+    # ASSUMES FEET IS THE INPUT CRS, MIGHT WANT TO MAKE THIS AN
+    # ACTUAL CONVERSION IF WE USE THIS OUTSIDE OF PMT. SEE THE
+    # LINEAR UNITS CODE/NAME BOOKMARKS
+    # spatial_reference.linearUnitName and .linearUnitCode
+    return contiguity
+
+
+def _feature_hashes_(in_fc, id_field=None):
+    """
+    Internal helper to hash the WKB geometry of features and record their extents. If `id_field`
+        is given, hashes and extents are combined for features sharing an id.
+
+    See Also: calculate_contiguity_index
+    """
+    fields = ["SHAPE@"] if id_field is None else [id_field, "SHAPE@"]
+    records = []
+    with arcpy.da.SearchCursor(in_fc, fields) as search:
+        for row in search:
+            geom = row[-1]
+            if geom is None:
+                continue
+            ext = geom.extent
+            records.append(
+                row[:-1]
+                + (
+                    hashlib.sha1(bytes(geom.WKB)).hexdigest(),
+                    ext.XMin,
+                    ext.YMin,
+                    ext.XMax,
+                    ext.YMax,
+                )
+            )
+    columns = fields[:-1] + ["Hash", "XMin", "YMin", "XMax", "YMax"]
+    hash_df = pd.DataFrame.from_records(records, columns=columns)
+    if id_field is None:
+        return hash_df
+    return hash_df.sort_values("Hash").groupby(id_field).agg(
+        {
+            "Hash": lambda h: hashlib.sha1("".join(h).encode()).hexdigest(),
+            "XMin": "min",
+            "YMin": "min",
+            "XMax": "max",
+            "YMax": "max",
+        }
+    ).reset_index()
+
+
+def _geometry_hash_(in_fc, id_field=None):
+    """
+    Internal helper to hash all feature geometries in a feature class (in cursor order), as a key
+        for a geometry vintage. If `id_field` is given, each feature's id is hashed with its
+        geometry, so reassigned ids on identical geometry give a new key. Geometries are read as
+        WKB, without building geometry objects.
+
+    See Also: allocate_bg_to_parcels_by_year
+    """
+    fields = ["SHAPE@WKB"] if id_field is None else [id_field, "SHAPE@WKB"]
+    sha = hashlib.sha1()
+    with arcpy.da.SearchCursor(in_fc, fields) as search:
+        for row in search:
+            if row[-1] is None:
+                continue
+            if id_field is not None:
+                sha.update(f"{row[0]!r}|".encode())
+            sha.update(bytes(row[-1]))
+            sha.update(b";")
+    return sha.hexdigest()
+
+
+def _changed_extents_(prev_df, curr_df, key):
+    """
+    Internal helper to list the extents of records added, removed, or changed between two
+        tables of feature hashes (see `_feature_hashes_`), matched on `key` columns. Records
+        sharing a key are matched as a group; a change in their number marks the key as changed.
+
+    See Also: calculate_contiguity_index
+    """
+    ext_cols = ["XMin", "YMin", "XMax", "YMax"]
+    # collapse duplicate keys (stacked identical mask geometries, e.g.) to one record with a count,
+    #   so the merge is one-to-one
+    prev_df, curr_df = [
+        df.drop_duplicates(key).merge(
+            df.groupby(key).size().rename("Count").reset_index(), on=key
+        )
+        for df in (prev_df, curr_df)
+    ]
+    both = pd.merge(
+        prev_df, curr_df, on=key, how="outer", suffixes=("_prev", "_curr"), indicator=True
+    )
+    changed = (both["_merge"] != "both") | (both["Count_prev"] != both["Count_curr"])
+    if "Hash" not in key:
+        changed |= both["Hash_prev"] != both["Hash_curr"]
+    both = both[changed]
+    return np.concatenate(
+        [
+            both[[f"{c}_prev" for c in ext_cols]].dropna().values,
+            both[[f"{c}_curr" for c in ext_cols]].dropna().values,
+        ]
+    )
+
+
+def _intersects_any_(boxes, other_boxes):
+    """
+    Internal helper to flag (xmin, ymin, xmax, ymax) boxes intersecting any of `other_boxes`
+        (looping over `other_boxes`, so it should be the shorter list)
+
+    See Also: calculate_contiguity_index
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    hits = np.zeros(len(boxes), dtype=bool)
+    for xmin, ymin, xmax, ymax in np.asarray(other_boxes, dtype=np.float64).reshape(-1, 4):
+        hits |= (
+                (boxes[:, 0] <= xmax)
+                & (boxes[:, 2] >= xmin)
+                & (boxes[:, 1] <= ymax)
+                & (boxes[:, 3] >= ymin)
+        )
+    return hits
+
+
 def calculate_contiguity_index(
-        quadrats_fc, parcels_fc, mask_fc, parcels_id_field, cell_size=40, weights="nn"
+        quadrats_fc,
+        parcels_fc,
+        mask_fc,
+        parcels_id_field,
+        cell_size=40,
+        weights="nn",
+        workers=1,
+        rasterizer="arcpy",
+        state_path=None,
 ):
     """Calculate contiguity of developable area
 
@@ -3956,6 +5761,18 @@ def calculate_contiguity_index(
             (in the units of the input data crs)
         weights (str or dict, default="nn"): weights for neighbors in contiguity calculation
             (see notes for how to specify weights)
+        workers (int, default=1): number of processes used to score quadrats
+            (see `contiguity_tiles`)
+        rasterizer (str, default="arcpy"): "arcpy" or "numpy"; the method used to rasterize
+            polygons in each quadrat (see `contiguity_tiles`)
+        state_path (str, default=None): path to a file recording parcel and mask geometry hashes
+            and polygon results of the previous run. If given, contiguity is recalculated
+            incrementally: parcel geometries (hashed by `parcels_id_field`) and mask geometries
+            are compared to the previous run, only parcels in quadrats touched by changes are
+            differenced and rasterized, and previous results are carried forward for all other
+            parcels. The state is updated with the results of this run. Polygon contiguity only
+            depends on the polygon's own cells on the common grid (see `contiguity_tiles`), so
+            results match a full run (PolyID's are renumbered).
    
     Returns:
         pd.DataFrame: table of polygon-level (sub-parcel) contiguity indices
@@ -4006,288 +5823,129 @@ def calculate_contiguity_index(
         in_features=parcels_fc, out_path=p_path, out_name=p_name, field_mapping=fmap
     )
 
-    print("--- --- tagging parcels with a chunk ID")
-    arcpy.AddField_management(
-        in_table=parcels_copy, field_name="ChunkID", field_type="LONG"
-    )
-    p_layer = arcpy.MakeFeatureLayer_management(
-        in_features=parcels_copy, out_layer="_p_layer"
-    )
-    chunks = []
-    with arcpy.da.SearchCursor(quadrats_fc, ["OID@", "SHAPE@"]) as search:
-        for srow in search:
-            chunk_id, geom = srow
-            arcpy.SelectLayerByLocation_management(
-                in_layer=p_layer,
-                overlap_type="HAVE_THEIR_CENTER_IN",
-                select_features=geom,
+    # the raster grid covers all parcels, so it is the same for any subset of them
+    ext = arcpy.Describe(parcels_fc).extent
+    grid_extent = [ext.XMin, ext.YMin, ext.XMax, ext.YMax]
+    carried_df = None
+    if state_path is not None:
+        print("--- --- hashing parcel and mask geometries")
+        quad_ext = _quadrat_extents_(quadrats_fc)
+        params = {
+            "parcels_id_field": parcels_id_field,
+            "cell_size": cell_size,
+            "weights": weights,
+            "rasterizer": rasterizer,
+            "tiles": _tile_extents_(quad_ext, grid_extent, cell_size),
+        }
+        parcel_hashes = _feature_hashes_(parcels_fc, parcels_id_field)
+        mask_hashes = _feature_hashes_(mask_fc)
+        prev_state = None
+        if os.path.exists(state_path):
+            with open(state_path, "rb") as f:
+                prev_state = pickle.load(f)
+            if prev_state["params"] != params:
+                print("--- --- previous run used different settings, recalculating all parcels")
+                prev_state = None
+        if prev_state is not None:
+            print("--- --- comparing parcels and mask to the previous run")
+            changed_ext = np.concatenate(
+                [
+                    _changed_extents_(
+                        prev_state["parcels"], parcel_hashes, [parcels_id_field]
+                    ),
+                    _changed_extents_(prev_state["mask"], mask_hashes, ["Hash"]),
+                ]
             )
-            arcpy.CalculateField_management(
-                in_table=p_layer, field="ChunkID", expression=chunk_id
+            dirty_tiles = [
+                tile for tile in params["tiles"] if _intersects_any_(changed_ext, tile).any()
+            ]
+            affected = parcel_hashes.loc[
+                _intersects_any_(parcel_hashes[["XMin", "YMin", "XMax", "YMax"]].values, dirty_tiles),
+                parcels_id_field,
+            ]
+            print(
+                f"--- --- {len(dirty_tiles)} of {len(params['tiles'])} quadrats changed, "
+                f"recalculating {len(affected)} of {len(parcel_hashes)} parcels"
             )
-            chunks.append(chunk_id)
-    # difference parcels and buildings/water bodies/protected areas
-
-    print("--- --- differencing parcels and buildings")
-    difference_fc = symmetric_difference(
-        target_fc=parcels_copy, update_fc=mask_fc, out_fc_name="difference"
-    )
-
-    print("--- --- converting difference to singlepart polygons")
-    diff_fc = PMT.make_inmem_path(file_name="diff")
-    arcpy.MultipartToSinglepart_management(
-        in_features=difference_fc, out_feature_class=diff_fc
-    )
-
-    print("--- --- adding a unique ID field for individual polygons")
-    PMT.add_unique_id(feature_class=diff_fc, new_id_field="PolyID")
+            prev_df = prev_state["results"]
+            carried_df = prev_df[
+                prev_df[parcels_id_field].isin(parcel_hashes[parcels_id_field])
+                & ~prev_df[parcels_id_field].isin(affected)
+                ]
+            affected = set(affected)
+            with arcpy.da.UpdateCursor(parcels_copy, [parcels_id_field]) as uc:
+                for (parcel_id,) in uc:
+                    if parcel_id not in affected:
+                        uc.deleteRow()
+
+    if int(arcpy.GetCount_management(parcels_copy)[0]) == 0:
+        print("--- --- no changed parcels")
+        contiguity_df = pd.DataFrame(
+            columns=[parcels_id_field, "PolyID", "Contiguity", "Developable_Area"]
+        )
+    else:
+        # difference parcels and buildings/water bodies/protected areas
+        print("--- --- differencing parcels and buildings")
+        difference_fc = symmetric_difference(
+            target_fc=parcels_copy, update_fc=mask_fc, out_fc_name="difference"
+        )
 
-    print("--- --- extracting a polygon-parcel ID reference table")
-    ref_df = PMT.featureclass_to_df(
-        in_fc=diff_fc, keep_fields=[parcels_id_field, "PolyID"], null_val=-1.0
-    )
-    arcpy.Delete_management(difference_fc)
+        print("--- --- converting difference to singlepart polygons")
+        diff_fc = PMT.make_path(intmd_gdb, "diff")
+        arcpy.MultipartToSinglepart_management(
+            in_features=difference_fc, out_feature_class=diff_fc
+        )
 
-    # loop through the chunks to calculate contiguity:
-    print("--- chunk processing contiguity and developable area")
-    contiguity_stack = []
-    diff_lyr = arcpy.MakeFeatureLayer_management(
-        in_features=diff_fc, out_layer="_diff_lyr_"
-    )
-    for i in chunks:
-        print(f"--- --- chunk {str(i)} of {str(len(chunks))}")
+        print("--- --- adding a unique ID field for individual polygons")
+        PMT.add_unique_id(feature_class=diff_fc, new_id_field="PolyID")
 
-        print("--- --- --- selecting chunk")
-        selection = f'"ChunkID" = {str(i)}'
-        parcel_chunk = arcpy.SelectLayerByAttribute_management(
-            in_layer_or_view=diff_lyr,
-            selection_type="NEW_SELECTION",
-            where_clause=selection,
+        print("--- --- extracting a polygon-parcel ID reference table")
+        ref_df = PMT.featureclass_to_df(
+            in_fc=diff_fc, keep_fields=[parcels_id_field, "PolyID"], null_val=-1.0
         )
-
-        print("--- --- --- rasterizing chunk")
-        rp = PMT.make_inmem_path()
-        arcpy.FeatureToRaster_conversion(
-            in_features=parcel_chunk, field="PolyID", out_raster=rp, cell_size=cell_size
+        arcpy.Delete_management(difference_fc)
+
+        # score quadrats to calculate contiguity:
+        print("--- tile processing contiguity and developable area")
+        contiguity_df = contiguity_tiles(
+            in_fc=diff_fc,
+            id_field="PolyID",
+            quadrats_fc=quadrats_fc,
+            cell_size=cell_size,
+            weights=weights,
+            workers=workers,
+            rasterizer=rasterizer,
+            grid_extent=grid_extent,
         )
 
-        print("--- --- --- loading chunk raster")
-        ras_array = arcpy.RasterToNumPyArray(in_raster=rp, nodata_to_value=-1)
-        arcpy.Delete_management(rp)
-
-        # calculate total developable area
-        print("--- --- --- calculating developable area by polygon")
-        poly_ids, counts = np.unique(ras_array, return_counts=True)
-        area = pd.DataFrame.from_dict({"PolyID": poly_ids, "Count": counts})
-        area = area[area.PolyID != -1]
-        area["Developable_Area"] = area.Count * (cell_size ** 2) / 43560
-        # ASSUMES FEET IS THE INPUT CRS, MIGHT WANT TO MAKE THIS AN
-        # ACTUAL CONVERSION IF WE USE THIS OUTSIDE OF PMT. SEE THE
-        # LINEAR UNITS CODE/NAME BOOKMARKS
-        # spatial_reference.linearUnitName and .linearUnitCode
-        area = area.drop(columns="Count")
-
-        npolys = len(area.index)
-        if npolys == 0:
-            print("*** no polygons in this quadrat, proceeding to next chunk ***")
-        else:
-            print("--- --- --- initializing cell neighbor identification")
-            ras_dim = ras_array.shape
-            nrow = ras_dim[0]
-            ncol = ras_dim[1]
+        print("--- --- filling table with missing polygons")
+        contiguity_df = pd.merge(
+            ref_df, contiguity_df, left_on="PolyID", right_on="PolyID", how="left"
+        )
 
-            id_tab_self = pd.DataFrame(
-                {
-                    "Row": np.repeat(np.arange(nrow), ncol),
-                    "Col": np.tile(np.arange(ncol), nrow),
-                    "ID": ras_array.flatten(),
-                }
-            )
-            id_tab_neighbor = pd.DataFrame(
+        print("--- overwriting missing values with 0")
+        contiguity_df = contiguity_df.fillna(value={"Contiguity": 0, "Developable_Area": 0})
+        arcpy.Delete_management(diff_fc)
+
+    if state_path is not None:
+        if carried_df is not None:
+            print("--- carrying forward results for unchanged parcels")
+            contiguity_df = pd.concat([carried_df, contiguity_df], ignore_index=True)
+            contiguity_df["PolyID"] = np.arange(1, len(contiguity_df) + 1)
+        with open(state_path, "wb") as f:
+            pickle.dump(
                 {
-                    "NRow": np.repeat(np.arange(nrow), ncol),
-                    "NCol": np.tile(np.arange(ncol), nrow),
-                    "NID": ras_array.flatten(),
-                }
-            )
-
-            print("--- --- --- identifying non-empty cells")
-            row_oi = id_tab_self[id_tab_self.ID != -1].Row.to_list()
-            col_oi = id_tab_self[id_tab_self.ID != -1].Col.to_list()
-
-            print("--- --- --- identifying neighbors of non-empty cells")
-            row_basic = [np.arange(x - 1, x + 2) for x in row_oi]
-            col_basic = [np.arange(x - 1, x + 2) for x in col_oi]
-
-            meshed = [
-                np.array(np.meshgrid(x, y)).reshape(2, 9).T
-                for x, y in zip(row_basic, col_basic)
-            ]
-            meshed = np.concatenate(meshed, axis=0)
-            meshed = pd.DataFrame(meshed, columns=["NRow", "NCol"])
-
-            meshed.insert(1, "Col", np.repeat(col_oi, 9))
-            meshed.insert(0, "Row", np.repeat(row_oi, 9))
-
-            print("--- --- --- filtering to valid neighbors by index")
-            meshed = meshed[
-                (meshed.NRow >= 0)
-                & (meshed.NRow < nrow)
-                & (meshed.NCol >= 0)
-                & (meshed.NCol < ncol)
-                ]
-
-            print("--- --- --- tagging cells and their neighbors with polygon IDs")
-            meshed = pd.merge(
-                meshed,
-                id_tab_self,
-                left_on=["Row", "Col"],
-                right_on=["Row", "Col"],
-                how="left",
-            )
-            meshed = pd.merge(
-                meshed,
-                id_tab_neighbor,
-                left_on=["NRow", "NCol"],
-                right_on=["NRow", "NCol"],
-                how="left",
-            )
-
-            print("--- --- --- fitering to valid neighbors by ID")
-            meshed = meshed[meshed.ID == meshed.NID]
-            meshed = meshed.drop(columns="NID")
-
-            # With neighbors identified, we now need to define cell weights for contiguity calculations.
-            # These are based off the specifications in the 'weights' inputs to the function. So, we tag each
-            # cell-neighbor pair in 'valid_neighbors' with a weight.
-            print("--- --- --- tagging cells and neighbors with weights")
-            conditions = [
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] - 1,
-                        meshed["NCol"] == meshed["Col"] - 1,
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] - 1,
-                        meshed["NCol"] == meshed["Col"],
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] - 1,
-                        meshed["NCol"] == meshed["Col"] + 1,
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"],
-                        meshed["NCol"] == meshed["Col"] - 1,
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"], meshed["NCol"] == meshed["Col"]
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"],
-                        meshed["NCol"] == meshed["Col"] + 1,
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] + 1,
-                        meshed["NCol"] == meshed["Col"] - 1,
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] + 1,
-                        meshed["NCol"] == meshed["Col"],
-                    )
-                ),
-                (
-                    np.logical_and(
-                        meshed["NRow"] == meshed["Row"] + 1,
-                        meshed["NCol"] == meshed["Col"] + 1,
-                    )
-                ),
-            ]
-            choices = [
-                "top_left",
-                "top_center",
-                "top_right",
-                "middle_left",
-                "self",
-                "middle_right",
-                "bottom_left",
-                "bottom_center",
-                "bottom_right",
-            ]
-            meshed["Type"] = np.select(conditions, choices)
-            meshed["Weight"] = [weights[key] for key in meshed["Type"]]
-
-            # To initialize the contiguity calculation, we sum weights by cell.
-            # We lose the ID in the groupby though, which we need to get to contiguity,
-            # so we need to merge back to our cell-ID table
-            print("--- --- --- summing weight by cell")
-            weight_tbl = (
-                meshed.groupby(["Row", "Col"])[["Weight"]].agg("sum").reset_index()
-            )
-            weight_tbl = pd.merge(
-                weight_tbl,
-                id_tab_self,
-                left_on=["Row", "Col"],
-                right_on=["Row", "Col"],
-                how="left",
-            )
-
-            # We are now finally at the point of calculating contiguity! It's a pretty simple function,
-            # which we apply over our IDs. This is the final result of our chunk process, so we'll also rename our "ID"
-            # field to "PolyID", because this is the proper name for the ID over which we've calculated contiguity.
-            # This will make our life easier when chunk processing is complete, and we move into data formatting
-            # and writing
-            print("--- --- --- calculating contiguity by polygon")
-            weight_max = sum(weights.values())
-            contiguity = (
-                weight_tbl.groupby("ID")
-                    .apply(lambda x: (sum(x.Weight) / len(x.Weight) - 1) / (weight_max - 1))
-                    .reset_index(name="Contiguity")
-            )
-            contiguity.columns = ["PolyID", "Contiguity"]
-
-            # For reporting results, we'll merge the contiguity and developable
-            # area tables
-            print("--- --- --- merging contiguity and developable area information")
-            contiguity = pd.merge(
-                contiguity, area, left_on="PolyID", right_on="PolyID", how="left"
+                    "params": params,
+                    "parcels": parcel_hashes,
+                    "mask": mask_hashes,
+                    "results": contiguity_df,
+                },
+                f,
             )
 
-            # We're done chunk processing -- we'll put the resulting data frame
-            # in our chunk results list as a final step
-            print("--- --- --- appending chunk results to master list")
-            contiguity_stack.append(contiguity)
-
-    # Contiguity results formatting
-    print("--- formatting polygon-level results")
-    print("--- --- combining chunked results into table format")
-    contiguity_df = pd.concat(contiguity_stack, axis=0)
-
-    print("--- --- filling table with missing polygons")
-    contiguity_df = pd.merge(
-        ref_df, contiguity_df, left_on="PolyID", right_on="PolyID", how="left"
-    )
-
-    print("--- overwriting missing values with 0")
-    contiguity_df = contiguity_df.fillna(value={"Contiguity": 0, "Developable_Area": 0})
-
     # clean up in_memory space and temporary data
     arcpy.Delete_management(parcels_copy)
     arcpy.Delete_management(intmd_gdb)
-    arcpy.Delete_management(diff_fc)
     return contiguity_df
 
 
@@ -4384,6 +6042,94 @@ def calculate_contiguity_summary(
     return df
 
 
+def _group_codes_(in_df, group_col):
+    """
+    Internal helper to number the groups of `in_df` by `group_col` (in sorted group order, as
+        `groupby`), returning the group code of each row and the group index
+
+    See Also: diversity_indices
+    """
+    gb = in_df.groupby(group_col)
+    codes = gb.ngroup().fillna(-1).to_numpy().astype(np.int64)
+    return codes, gb.size().index
+
+
+def diversity_indices(
+        in_df,
+        group_col,
+        weight_col=None,
+        total_col=None,
+        pct_col=None,
+        count_lu=None,
+        indices=("Simpson", "Shannon", "BergerParker", "ENP"),
+):
+    """
+    Calculates land use diversity indices for all groups in one pass with vectorized column
+        arithmetic. Group sums are accumulated with `np.bincount` in row order, so results are
+        identical to summing each group's rows in turn.
+
+        This function is not intended to be run directly. Use `lu_diversity`.
+
+    Args:
+        in_df (pandas.DataFrame): land use weights by group (see `lu_diversity`)
+        group_col (str or list): group field(s)
+        weight_col (str): land use weight field
+        total_col (str): group total weight field
+        pct_col (str): land use share of group total weight field
+        count_lu (int): count of relevant land use classes
+        indices (list): diversity indices to calculate; any of "Simpson", "Shannon",
+            "BergerParker", and "ENP"
+
+    Returns:
+        pandas.DataFrame: diversity indices (columns named as `indices`) indexed by group
+    """
+    codes, group_index = _group_codes_(in_df, group_col)
+    valid = codes >= 0
+    codes = codes[valid]
+    n_groups = len(group_index)
+
+    def group_sum(values):
+        return np.bincount(codes, weights=values[valid], minlength=n_groups)
+
+    div_df = pd.DataFrame(index=group_index)
+    for index in indices:
+        if index == "Simpson":
+            weight = in_df[weight_col].to_numpy()
+            total = in_df[total_col].to_numpy()
+            sid = pd.Series((total * (total - 1))[valid]).groupby(codes).min().to_numpy()
+            # Adjust to 0-1 scale
+            div_df[index] = 1 - group_sum(weight * (weight - 1)) / sid
+        elif index == "Shannon":
+            pct = in_df[pct_col].to_numpy()
+            diversity_col = group_sum(pct * np.log(pct)) * -1
+            # Adjust to 0-1 scale
+            div_df[index] = diversity_col / -np.log(1 / count_lu)
+        elif index == "BergerParker":
+            diversity_col = (
+                in_df[pct_col][valid].groupby(codes).max().to_numpy()
+            )
+            # Adjust to 0-1 scale
+            best_possible = 1 / count_lu
+            worst_possible = 1
+            div_df[index] = 1 - (
+                    (diversity_col - best_possible) / (worst_possible - best_possible)
+            )
+        elif index == "ENP":
+            pct = in_df[pct_col].to_numpy()
+            diversity_col = 1 / group_sum(pct ** 2)
+            # Adjust to 0-1 scale
+            best_possible = count_lu
+            worst_possible = 1
+            div_df[index] = (diversity_col - worst_possible) / (
+                    best_possible - worst_possible
+            )
+        else:
+            raise ValueError(
+                f"Expected diversity indices in ['Simpson', 'Shannon', 'BergerParker', 'ENP'] - got {index}"
+            )
+    return div_df
+
+
 def simpson_diversity(
         in_df,
         group_col,
@@ -4403,16 +6149,9 @@ def simpson_diversity(
 
         This function is not intended to be run directly. Use `lu_diversity`.
     """
-
-    temp_df = in_df.assign(SIN=in_df[weight_col] * (in_df[weight_col] - 1))
-    temp_df["SID"] = temp_df[total_col] * (temp_df[total_col] - 1)
-    diversity_col = temp_df.groupby(group_col).apply(
-        lambda x: sum(x.SIN) / np.unique(x.SID)[0]
-    )
-    diversity_col.name = "Simpson"
-    # Adjust to 0-1 scale
-    diversity_col = 1 - diversity_col
-    return diversity_col
+    return diversity_indices(
+        in_df, group_col, weight_col, total_col, pct_col, count_lu, indices=["Simpson"]
+    )["Simpson"]
 
 
 def shannon_diversity(
@@ -4434,12 +6173,9 @@ def shannon_diversity(
 
        This function is not intended to be run directly. Use `lu_diversity`.
     """
-    temp_df = in_df.assign(PLP=in_df[pct_col] * np.log(in_df[pct_col]))
-    diversity_col = temp_df.groupby(group_col).apply(lambda x: sum(x.PLP) * -1)
-    diversity_col.name = "Shannon"
-    # Adjust to 0-1 scale
-    diversity_col /= -np.log(1 / count_lu)
-    return diversity_col
+    return diversity_indices(
+        in_df, group_col, weight_col, total_col, pct_col, count_lu, indices=["Shannon"]
+    )["Shannon"]
 
 
 def berger_parker_diversity(
@@ -4462,15 +6198,9 @@ def berger_parker_diversity(
 
        This function is not intended to be run directly. Use `lu_diversity`.
     """
-    diversity_col = in_df.groupby(group_col)[pct_col].max()
-    diversity_col.name = "BergerParker"
-    # Adjust to 0-1 scale
-    best_possible = 1 / count_lu
-    worst_possible = 1
-    diversity_col = 1 - (
-            (diversity_col - best_possible) / (worst_possible - best_possible)
-    )
-    return diversity_col
+    return diversity_indices(
+        in_df, group_col, weight_col, total_col, pct_col, count_lu, indices=["BergerParker"]
+    )["BergerParker"]
 
 
 def enp_diversity(
@@ -4493,14 +6223,33 @@ def enp_diversity(
 
        This function is not intended to be run directly. Use `lu_diversity`.
     """
-    temp_df = in_df.assign(P2=in_df[pct_col] ** 2)
-    diversity_col = temp_df.groupby(group_col).apply(lambda x: 1 / sum(x.P2))
-    diversity_col.name = "ENP"
-    # Adjust to 0-1 scale
-    best_possible = count_lu
-    worst_possible = 1
-    diversity_col = (diversity_col - worst_possible) / (best_possible - worst_possible)
-    return diversity_col
+    return diversity_indices(
+        in_df, group_col, weight_col, total_col, pct_col, count_lu, indices=["ENP"]
+    )["ENP"]
+
+
+# diversity index names of the diversity functions (see `lu_diversity`)
+_DIVERSITY_INDICES_ = {
+    simpson_diversity: "Simpson",
+    shannon_diversity: "Shannon",
+    berger_parker_diversity: "BergerParker",
+    enp_diversity: "ENP",
+}
+
+
+def _diversity_frame_(div_funcs, div_kwargs):
+    """
+    Internal helper to calculate diversity indices for `lu_diversity`, in one pass if all
+        `div_funcs` are known indices (functions or index names), otherwise function by function
+
+    See Also: lu_diversity
+    """
+    names = [
+        _DIVERSITY_INDICES_.get(f, f) if callable(f) else f for f in div_funcs
+    ]
+    if all(isinstance(name, string_types) for name in names):
+        return diversity_indices(indices=names, **div_kwargs)
+    return pd.concat([div_func(**div_kwargs) for div_func in div_funcs], axis=1)
 
 
 def assign_features_to_agg_area(
@@ -4536,6 +6285,7 @@ def assign_features_to_agg_area(
 
     See Also:
         PMT.intersectFeatures
+        floating_zone_diversity: floating zone land use diversity without buffering and intersecting
     """
     if agg_features is None:
         if buffer is None:
@@ -4567,7 +6317,9 @@ def lu_diversity(
         in_df (pandas.DataFrame): Dataframe containing the data to be analyzed
         groupby_field (str): The field in in_df used to group the data
         lu_field (str): The field in in_df containing the land use categorical values
-        div_funcs (list): List of the functions to generate diversity indices
+        div_funcs (list): List of the functions to generate diversity indices, or index names
+            ("Simpson", "Shannon", "BergerParker", "ENP"). Known indices are calculated in a single
+            pass over the grouped weights (see `diversity_indices`).
         weight_field (str): The field used to generate weights
         count_lu (int): Count of relevant land use classes
         regional_comp (bool, default=False): Boolean indicating whether to perform a region-wide comparison
@@ -4618,26 +6370,150 @@ def lu_diversity(
         "count_lu": count_lu,
     }
     # Calc simpson, shannon, etc.
-    div_df = pd.concat([div_func(**div_kwargs) for div_func in div_funcs], axis=1)
+    div_df = _diversity_frame_(div_funcs, div_kwargs)
+
+    # Regional comp
+    if regional_comp:
+        reg_by_lu = _in_df_.groupby(lu_field).agg(agg_dict).reset_index()
+        reg_by_lu[tot_weight_field] = _in_df_[weight_field].sum()
+        reg_by_lu[pct_weight_field] = (
+                reg_by_lu[weight_field] / reg_by_lu[tot_weight_field]
+        )
+        reg_by_lu["RegID"] = "Region"
+        div_kwargs["in_df"] = reg_by_lu
+        div_kwargs["group_col"] = "RegID"
+        reg_df = _diversity_frame_(div_funcs, div_kwargs)
+
+        # Comp to region results
+        for col in div_df.columns:
+            comp_col = f"{col}_Adj"
+            div_df[comp_col] = div_df[col] / reg_df[col][0]
+
+    return div_df.reset_index()
+
+
+def _neighborhood_matrix_(tree, xy, radius):
+    """
+    Internal helper to build a sparse (n x m) matrix flagging the points indexed by `tree` within
+        `radius` (a scalar, or an array aligned with `xy`) of each point in `xy`. Neighbor pairs
+        are found tree-to-tree into numpy arrays, without building Python lists per point.
+
+    See Also: floating_zone_diversity
+    """
+    radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), (len(xy),))
+    rows, cols = [], []
+    for r in np.unique(radius):
+        at_r = np.flatnonzero(radius == r)
+        pairs = cKDTree(xy[at_r]).sparse_distance_matrix(tree, r, output_type="ndarray")
+        rows.append(at_r[pairs["i"]])
+        cols.append(pairs["j"])
+    rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+    # conversion to csr sorts each row's neighbors, as in a sorted ball point query
+    return csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(xy), tree.n))
+
+
+def floating_zone_diversity(
+        parcel_ids,
+        parcel_xy,
+        land_uses,
+        weights,
+        radius,
+        div_funcs,
+        count_lu=None,
+        regional_comp=False,
+        parcel_id_field="FOLIO",
+        lu_field="LU",
+        meters_per_unit=1.0,
+        chunk_size=5000,
+):
+    """
+    Calculates land use diversity in a "floating zone" around each parcel from centroid coordinate
+    arrays. Rather than buffering and intersecting parcels (see `assign_features_to_agg_area`), a sparse
+    parcel-to-parcel neighborhood matrix is built from a KD-tree on parcel centroids and multiplied
+    by a weighted one-hot land use matrix to give the land use composition of each floating zone.
+    The composition feeds `lu_diversity` directly.
+
+    Args:
+        parcel_ids (array-like): Parcel id's
+        parcel_xy (np.array): (n x 2) parcel centroid coordinates; parcels with missing coordinates
+            are ignored
+        land_uses (array-like): Land use class of each parcel; parcels with null land uses contribute
+            nothing to floating zones (but are still scored)
+        weights (array-like): Land use weight (floor area, e.g.) of each parcel; parcels with
+            non-positive weights contribute nothing to floating zones
+        radius (float, array-like, or str): Floating zone radius, in coordinate units, for all parcels or
+            for each parcel, or a linear distance with units ("2640 Feet", e.g.)
+        div_funcs (list): Diversity functions or index names (see `lu_diversity`)
+        count_lu (int): Count of relevant land use classes
+        regional_comp (bool, default=False): Boolean indicating whether to perform a region-wide
+            comparison. Regional land use weights are summed over all floating zones, as when
+            `lu_diversity` is run on buffered and intersected parcels.
+        parcel_id_field (str, default="FOLIO"): Output parcel id field name
+        lu_field (str, default="LU"): Land use field name (used internally)
+        meters_per_unit (float, default=1.0): Meters per coordinate unit (used if `radius` is a
+            linear distance with units)
+        chunk_size (int, default=5000): Number of focal parcels whose neighborhoods are held in
+            memory at once
 
-    # Regional comp
-    if regional_comp:
-        reg_by_lu = _in_df_.groupby(lu_field).agg(agg_dict).reset_index()
-        reg_by_lu[tot_weight_field] = _in_df_[weight_field].sum()
-        reg_by_lu[pct_weight_field] = (
-                reg_by_lu[weight_field] / reg_by_lu[tot_weight_field]
-        )
-        reg_by_lu["RegID"] = "Region"
-        div_kwargs["in_df"] = reg_by_lu
-        div_kwargs["group_col"] = "RegID"
-        reg_df = pd.concat([div_func(**div_kwargs) for div_func in div_funcs], axis=1)
+    Returns:
+        pandas.DataFrame: diversity indices by parcel (see `lu_diversity`); parcels with no
+            weighted land use in their floating zone are omitted
 
-        # Comp to region results
-        for col in div_df.columns:
-            comp_col = f"{col}_Adj"
-            div_df[comp_col] = div_df[col] / reg_df[col][0]
+    Notes:
+        Floating zones are circles around parcel centroids, and parcels are assigned to zones by
+        centroid, so results approximate buffers of parcel polygons for large parcels.
+    """
+    parcel_ids = np.asarray(parcel_ids)
+    parcel_xy = np.asarray(parcel_xy, dtype=np.float64).reshape(-1, 2)
+    land_uses = pd.Series(land_uses).reset_index(drop=True)
+    weights = pd.to_numeric(pd.Series(weights), errors="coerce").to_numpy(dtype=np.float64)
+    if isinstance(radius, string_types):
+        radius = _linear_unit_to_meters_(radius) / meters_per_unit
+    radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), (len(parcel_ids),))
+    located = np.isfinite(parcel_xy).all(axis=1)
+
+    # Weighted one-hot land use matrix of contributing parcels
+    contributing = located & land_uses.notnull().to_numpy() & (weights > 0)
+    lu_codes, lu_names = pd.factorize(land_uses[contributing])
+    tree = cKDTree(parcel_xy[contributing])
+    lu_matrix = csr_matrix(
+        (weights[contributing], (np.arange(tree.n), lu_codes)),
+        shape=(tree.n, len(lu_names)),
+    )
 
-    return div_df.reset_index()
+    # Land use composition of each floating zone (neighborhood matrix x land use matrix)
+    print("--- --- summarizing land uses in floating zones")
+    focal = np.flatnonzero(located)
+    rows, cols, vals = [], [], []
+    for start in range(0, len(focal), chunk_size):
+        chunk = focal[start: start + chunk_size]
+        neighbors = _neighborhood_matrix_(tree, parcel_xy[chunk], radius[chunk])
+        composition = (neighbors @ lu_matrix).tocoo()
+        rows.append(chunk[composition.row])
+        cols.append(composition.col)
+        vals.append(composition.data)
+    rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+    vals = np.concatenate(vals) if vals else np.array([], dtype=np.float64)
+    weight_field = "Weight"
+    in_df = pd.DataFrame(
+        {
+            parcel_id_field: parcel_ids[rows],
+            lu_field: np.asarray(lu_names)[cols],
+            weight_field: vals,
+        }
+    )
+    print("--- --- calculating diversity indices")
+    return lu_diversity(
+        in_df=in_df,
+        groupby_field=parcel_id_field,
+        lu_field=lu_field,
+        div_funcs=div_funcs,
+        weight_field=weight_field,
+        count_lu=count_lu,
+        regional_comp=regional_comp,
+    )
 
 
 def match_units_fields(d):
@@ -5038,8 +6914,8 @@ def clean_skim_csv(
     (`node_fields` and `imp_field`)
 
     Args:
-        in_file (str): Path to a long OD table in csv format
-        out_file (str): Path to a new (shortened) OD table to store function outputs
+        in_file (str): Path to a long OD table in csv format (or a skim store, see `is_skim_store`)
+        out_file (str): Path to a new (shortened) OD table to store function outputs (csv or skim store)
         imp_field (str): The name of the field in `in_file` containing impedance (time, distance, cost)
             values between OD pairs. If this field is renamed using `renames`, the new name should be provided here.
         drop_val (int/float, default=0): Rows where `imp_field` is equal to `drop_val` are dropped from the skim
@@ -5060,17 +6936,15 @@ def clean_skim_csv(
     # TODO: support multiple imped_fields
     # TODO: support multiple drop values
     # TODO: support comparison drop values (>, <, !=, etc.)
-    header = True
     mode = "w"
-    for chunk in pd.read_csv(in_file, chunksize=chunksize, **kwargs):
+    for chunk in iter_skim_chunks(in_file, chunksize=chunksize, **kwargs):
         if renames:
             chunk.rename(columns=renames, inplace=True)
         fltr = chunk[imp_field] != drop_val
         chunk = chunk[fltr].copy()
         for nf in node_fields:
             chunk[nf] += node_offset
-        chunk.to_csv(out_file, mode=mode, header=header)
-        header = False
+        write_skim_chunk(chunk, out_file, mode=mode)
         mode = "a"
 
     return out_file
@@ -5107,7 +6981,7 @@ def skim_to_graph(
     OD row becomes an edge in the graph, with its origin and destination added as nodes.
 
     Args:
-        in_csv (str): Path to skim csv file
+        in_csv (str): Path to skim csv file (or skim store, see `is_skim_store`)
         source (str): The origin field. If fields are renamed used `renames`, give the new name.
         target (str): The destination field. If fields are renamed used `renames`, give the new name.
         attrs (list): [String,...]; Column names containing values to include as edge attributes
@@ -5121,13 +6995,13 @@ def skim_to_graph(
     """
     if "chunksize" in kwargs:
         graph_list = []
-        for chunk in pd.read_csv(in_csv, **kwargs):
+        for chunk in iter_skim_chunks(in_csv, **kwargs):
             graph_list.append(
                 _df_to_graph_(chunk, source, target, attrs, create_using, renames)
             )
         return reduce(nx.compose, graph_list)
     else:
-        df = pd.read_csv(in_csv, **kwargs)
+        df = read_skim(in_csv, **kwargs)
         return _df_to_graph_(df, source, target, attrs, create_using, renames)
 
 
@@ -5289,4 +7163,920 @@ def full_skim(
                     if j in all_tazs:
                         out_row = (i, j, time)
                         out_rows.append(out_row)
-                writer.writerows(out_rows)
\ No newline at end of file
+                writer.writerows(out_rows)
+
+
+def skims_to_csr(
+        tap_to_tap, taz_to_tap, source="OName", target="DName", impedance_attr="Minutes", **kwargs
+):
+    """
+    Loads TAP to TAP and TAZ to TAP skims into a single compressed sparse row (CSR) adjacency
+    matrix suitable for `scipy.sparse.csgraph` routines. Edges are resolved the same way as the
+    graphs built in `full_skim`: TAP to TAP records are directed, TAZ to TAP records are
+    undirected, the last record for any node pair is kept, and TAZ to TAP impedances replace
+    TAP to TAP impedances where both skims list the same pair.
+
+    Args:
+        tap_to_tap (str): Path to the TAP to TAP OD skim input (csv or skim store)
+        taz_to_tap (str): Path to the TAZ to TAP OD skim input (csv or skim store)
+        source (str, default="OName"): The origin field in both skims.
+        target (str, default="DName"): The destination field in both skims.
+        impedance_attr (str, default="Minutes"): The column in both skims that records OD
+            impedance estimates.
+        kwargs: Keywords to use when loading the skims with `read_skim`.
+
+    Returns:
+        graph (scipy.sparse.csr_matrix): square adjacency matrix of impedances (explicit zeros are
+            zero-impedance edges)
+        node_ids (np.array): sorted node id's; the position of each id is its row/column in `graph`
+    """
+    cols = [source, target, impedance_attr]
+    p2p = read_skim(tap_to_tap, usecols=cols, **kwargs)
+    z2p = read_skim(taz_to_tap, usecols=cols, **kwargs)
+    # TAZ to TAP edges are undirected, so A-B and B-A records describe the same edge
+    pair = pd.DataFrame(
+        {
+            "lo": np.minimum(z2p[source].values, z2p[target].values),
+            "hi": np.maximum(z2p[source].values, z2p[target].values),
+        }
+    )
+    z2p = z2p[~pair.duplicated(keep="last").values]
+    p2z = z2p.rename(columns={source: target, target: source})[cols]
+    edges = pd.concat([p2p, z2p, p2z], ignore_index=True)
+    edges.drop_duplicates(subset=[source, target], keep="last", inplace=True)
+
+    # Renumber nodes as dense int32 indices
+    n_edges = len(edges)
+    node_ids, node_idx = np.unique(
+        np.concatenate([edges[source].values, edges[target].values]),
+        return_inverse=True,
+    )
+    node_idx = node_idx.astype(np.int32)
+    # csgraph solves in float64, so weights are kept at full precision to avoid a copy and
+    #   to reproduce `networkx` path lengths exactly
+    graph = csr_matrix(
+        (
+            edges[impedance_attr].values.astype(np.float64),
+            (node_idx[:n_edges], node_idx[n_edges:]),
+        ),
+        shape=(len(node_ids), len(node_ids)),
+    )
+    return graph, node_ids
+
+
+def _iter_csr_skim_rows_(graph, node_ids, origins, destinations, cutoff, batch_size):
+    """
+    Internal helper to solve shortest path impedances from `origins` to `destinations` over a CSR
+    graph in batches of origins, yielding a list of (origin, destination, impedance) tuples for
+    each batch. Origins not found in `node_ids` are skipped.
+
+    See Also: full_skim_csr
+    """
+    if cutoff is None:
+        cutoff = np.inf
+    origins = np.asarray(origins)
+    o_pos = np.searchsorted(node_ids, origins).clip(0, len(node_ids) - 1)
+    o_fltr = node_ids[o_pos] == origins
+    origins, o_pos = origins[o_fltr], o_pos[o_fltr]
+    destinations = np.unique(destinations)
+    d_pos = np.searchsorted(node_ids, destinations).clip(0, len(node_ids) - 1)
+    d_fltr = node_ids[d_pos] == destinations
+    destinations, d_pos = destinations[d_fltr], d_pos[d_fltr]
+    for start in range(0, len(o_pos), batch_size):
+        dist = dijkstra(
+            graph, directed=True, indices=o_pos[start: start + batch_size], limit=cutoff
+        )[:, d_pos]
+        b_idx, d_idx = np.nonzero(np.isfinite(dist))
+        yield list(
+            zip(
+                origins[start + b_idx].tolist(),
+                destinations[d_idx].tolist(),
+                dist[b_idx, d_idx].tolist(),
+            )
+        )
+
+
+def _save_csr_(graph, node_ids, out_dir):
+    """
+    Internal helper to store a CSR graph and its node id's as .npy files in `out_dir` so they
+    can be memory-mapped by worker processes.
+
+    See Also: _load_csr_
+    """
+    np.save(os.path.join(out_dir, "data.npy"), graph.data)
+    np.save(os.path.join(out_dir, "indices.npy"), graph.indices)
+    np.save(os.path.join(out_dir, "indptr.npy"), graph.indptr)
+    np.save(os.path.join(out_dir, "node_ids.npy"), node_ids)
+    return out_dir
+
+
+_CSR_CACHE_ = {}
+
+
+def _load_csr_(in_dir):
+    """
+    Internal helper to load a CSR graph stored by `_save_csr_` as read-only memory-mapped arrays.
+    Graphs are cached per process so each worker maps the files once.
+
+    See Also: _save_csr_
+    """
+    if in_dir not in _CSR_CACHE_:
+        arrays = {
+            name: np.load(os.path.join(in_dir, f"{name}.npy"), mmap_mode="r")
+            for name in ["data", "indices", "indptr", "node_ids"]
+        }
+        n = len(arrays["node_ids"])
+        graph = csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]), shape=(n, n), copy=False
+        )
+        _CSR_CACHE_[in_dir] = (graph, arrays["node_ids"])
+    return _CSR_CACHE_[in_dir]
+
+
+def _csr_skim_shard_(csr_dir, origins, destinations, cutoff, batch_size, shard_csv):
+    """
+    Internal helper run by worker processes in `full_skim_csr` to solve a partition of origins
+    and write the results to a headerless csv shard.
+
+    See Also: full_skim_csr
+    """
+    graph, node_ids = _load_csr_(csr_dir)
+    with open(shard_csv, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        for out_rows in _iter_csr_skim_rows_(
+                graph, node_ids, origins, destinations, cutoff, batch_size
+        ):
+            writer.writerows(out_rows)
+    return shard_csv
+
+
+def full_skim_csr(
+        tap_to_tap, taz_to_tap, taz_to_taz, cutoff, taz_nodes, all_tazs,
+        impedance_attr="Minutes", batch_size=250, workers=1
+):
+    """
+    Creates a full skim from TAZ to TAZ by transit based on TAP to TAP skims and
+    TAZ to TAP access/egress skims. TAP = transit access point.
+
+    This is an alternative engine to `full_skim` that loads both skims into a single CSR matrix
+    (see `skims_to_csr`) and solves batches of origin TAZs at once with `scipy.sparse.csgraph.dijkstra`,
+    streaming results to the output csv. It returns the same OD records and impedances as `full_skim`,
+    though records for each origin are ordered by destination id rather than by impedance.
+
+    args:
+        tap_to_tap (str): Path to the TAP to TAP OD skim input
+        taz_to_tap (str): Path to the TAZ to TAP OD skim input
+        taz_to_taz (str): Path to the TAZ to TAZ OD skim output to be created
+        cutoff (int, float): A cutoff value (in units of `impedance_attr`) to apply
+            such that only TAZ to TAZ records within the cutoff are stored in `taz_to_taz`
+        taz_nodes (list): A list of TAZ's from which to analyze TAZ to TAZ impedances.
+        all_tazs (list): A list of all TAZ's.
+        impedance_attr (str, deafult="Minutes"): The column in `tap_to_tap` and `taz_to_tap`
+            that records OD impedance estimates.
+        batch_size (int, default=250): The number of origins solved at a time. Larger batches are
+            faster but hold a (batch_size x n_nodes) array of impedances in memory.
+        workers (int, default=1): If greater than 1, `taz_nodes` are partitioned across a pool of
+            this many processes. The graph is shared with workers as memory-mapped arrays, each
+            partition is written to its own csv shard, and shards are merged in partition order,
+            so the output is identical to a single-process run.
+
+    Returns:
+        None: results are stored in a new csv table at `taz_to_taz`
+    """
+    print(" - - building TAZ to TAZ CSR graph")
+    graph, node_ids = skims_to_csr(
+        tap_to_tap=tap_to_tap,
+        taz_to_tap=taz_to_tap,
+        source="OName",
+        target="DName",
+        impedance_attr=impedance_attr,
+    )
+    print(
+        f" - - solving TAZ to TAZ for {len(taz_nodes)} origins (of {len(all_tazs)} taz's)"
+    )
+    with open(taz_to_taz, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(
+            [p_conf.SKIM_O_FIELD, p_conf.SKIM_D_FIELD, p_conf.SKIM_IMP_FIELD]
+        )
+        if workers <= 1:
+            for out_rows in _iter_csr_skim_rows_(
+                    graph, node_ids, taz_nodes, all_tazs, cutoff, batch_size
+            ):
+                writer.writerows(out_rows)
+            return
+
+    # Partition origins into several contiguous blocks per worker to balance the load
+    temp_dir = tempfile.mkdtemp()
+    try:
+        csr_dir = _save_csr_(graph, node_ids, temp_dir)
+        del graph
+        n_parts = min(len(taz_nodes), workers * 4) or 1
+        partitions = np.array_split(np.asarray(taz_nodes), n_parts)
+        print(f" - - - {n_parts} partitions on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _csr_skim_shard_,
+                    csr_dir,
+                    part,
+                    all_tazs,
+                    cutoff,
+                    batch_size,
+                    os.path.join(temp_dir, f"shard_{i}.csv"),
+                )
+                for i, part in enumerate(partitions)
+            ]
+            shards = [f.result() for f in futures]
+        # Merge shards in partition order
+        with open(taz_to_taz, "a", newline="") as out_file:
+            for shard in shards:
+                with open(shard, "r", newline="") as in_file:
+                    shutil.copyfileobj(in_file, out_file)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _read_features_(in_features):
+    """
+    Internal helper to read features from a shapefile, a geodatabase feature class, or a
+    GeoDataFrame as a GeoDataFrame
+
+    See Also: osm_od_table
+    """
+    if isinstance(in_features, gpd.GeoDataFrame):
+        return in_features
+    in_features = str(in_features)
+    gdb_parts = re.split(r"(?<=\.gdb)[\\/]", in_features, maxsplit=1, flags=re.IGNORECASE)
+    if len(gdb_parts) == 2:
+        gdb, layer = gdb_parts[0], re.split(r"[\\/]", gdb_parts[1])[-1]
+        return gpd.read_file(gdb, layer=layer)
+    return gpd.read_file(in_features)
+
+
+def _read_osm_edges_(in_edges):
+    """
+    Internal helper to read OSM edge features as a GeoDataFrame from a shapefile, geodatabase
+    feature class, GeoDataFrame, or an osmnx graph pickle. Edges in a pickled graph without
+    geometry are drawn as straight lines between their nodes.
+
+    See Also: osm_to_csr
+    """
+    if not str(in_edges).lower().endswith((".p", ".pkl", ".pickle")):
+        return _read_features_(in_edges)
+    with open(in_edges, "rb") as f:
+        G = pickle.load(f)
+    rows = []
+    for u, v, data in G.edges(data=True):
+        geometry = data.get("geometry")
+        if geometry is None:
+            geometry = LineString(
+                [(G.nodes[u]["x"], G.nodes[u]["y"]), (G.nodes[v]["x"], G.nodes[v]["y"])]
+            )
+        rows.append(
+            {
+                "highway": str(data.get("highway", "")),
+                "oneway": data.get("oneway", False),
+                "length": data.get("length", geometry.length),
+                "geometry": geometry,
+            }
+        )
+    return gpd.GeoDataFrame(rows, geometry="geometry", crs=G.graph.get("crs"))
+
+
+def _line_end_points_(geometry):
+    """
+    Internal helper to get the (x, y) coordinates of the first and last vertex of each line
+    (or multi-line) in a GeoSeries as an (n x 4) array
+
+    See Also: osm_to_csr
+    """
+    ends = []
+    for geom in geometry:
+        if geom.geom_type == "MultiLineString":
+            first, last = geom.geoms[0].coords[0], geom.geoms[-1].coords[-1]
+        else:
+            first, last = geom.coords[0], geom.coords[-1]
+        ends.append(first[:2] + last[:2])
+    return np.array(ends, dtype=np.float64).reshape(-1, 4)
+
+
+def osm_to_csr(in_edges, mode, imped_attr="Minutes", restrictions=None, crs=None):
+    """
+    Builds a directed network graph from OSM edge features as a compressed sparse row (CSR)
+    adjacency matrix suitable for `scipy.sparse.csgraph` routines. The graph mirrors the walk and
+    bike network datasets (see `prepare_osm_networks` and ref//osm_{mode}_template.xml) so network
+    analyses can be run without Network Analyst:
+        - edges connect at their end points and can be traveled in both directions
+        - "Length" is the osm `length` field (meters)
+        - "Minutes" is length divided by the mode speed in `OSM_GRAPH_SPEEDS` (meters per
+          minute); bike speeds are scaled by `OSM_CYCLEWAY_FACTOR` on cycleways
+        - restrictions are applied with the usage values in `OSM_RESTRICTION_USAGE`: prohibited
+          edges (usage of -1) are dropped and other restricted edges have their costs scaled.
+          "Oneway" restricts travel against the digitized direction of oneway edges.
+    Global turn delays are not modeled. Bike level of traffic stress and cycleway tags are read
+    from `bikability` and `cycleway` fields if present (see `classify_bikability`), otherwise they
+    are classified from the `highway` field in the same way.
+
+    Args:
+        in_edges (str, gpd.GeoDataFrame): OSM edge features; a path to the edges shapefile saved by
+            `download_osm_networks`, an edges feature class in a network geodatabase, or the osmnx
+            graph pickle (.p) saved by `download_osm_networks`
+        mode (str): "walk" or "bike"
+        imped_attr (str, default="Minutes"): The impedance attribute, "Minutes" or "Length"
+        restrictions (str, list, default=None): Restriction attributes to honor, as a semi-colon-
+            separated string (`BIKE_RESTRICTIONS`, e.g.) or a list
+        crs (default=None): Coordinate reference system of the output node coordinates. If None,
+            the crs of `in_edges` is used. Must be a projected crs (the osmnx graph pickle is in
+            geographic coordinates, so `crs` is required for it).
+
+    Raises:
+        ValueError: if the edges are not in (or projected to) a projected coordinate system
+
+    Returns:
+        graph (scipy.sparse.csr_matrix): square adjacency matrix of solve costs (impedances scaled
+            by restriction usage values)
+        imped (scipy.sparse.csr_matrix): adjacency matrix of `imped_attr` impedances with the same
+            structure as `graph`
+        node_xy (np.array): (n_nodes x 2) node coordinates; the position of each node is its
+            row/column in `graph`
+    """
+    if mode not in p_conf.OSM_GRAPH_SPEEDS:
+        raise ValueError(f"Expected one of {list(p_conf.OSM_GRAPH_SPEEDS)} as `mode` - got {mode}")
+    if imped_attr not in ["Minutes", "Length"]:
+        raise ValueError(f"Expected 'Minutes' or 'Length' as `imped_attr` - got {imped_attr}")
+    if isinstance(restrictions, string_types):
+        restrictions = [r for r in restrictions.split(";") if r]
+    restrictions = restrictions or []
+    unknown = [r for r in restrictions if r not in p_conf.OSM_RESTRICTION_USAGE]
+    if unknown:
+        raise ValueError(f"Unknown restriction attribute(s): {unknown}")
+
+    edges = _read_osm_edges_(in_edges)
+    edges = edges[edges.geometry.notnull() & ~edges.geometry.is_empty]
+    if crs is not None and edges.crs is not None and edges.crs != crs:
+        edges = edges.to_crs(crs)
+    # end points are merged into nodes at a fixed precision in crs units, which is only
+    #   meaningful for linear units (0.001 degrees would merge intersections ~100 m apart)
+    if edges.crs is None or not edges.crs.is_projected:
+        raise ValueError("Edges must be in a projected coordinate system (see `crs`)")
+    n_edges = len(edges)
+
+    # Nodes are unique edge end points (coordinates rounded to 0.001 crs units)
+    ends = _line_end_points_(edges.geometry)
+    node_xy, node_idx = np.unique(
+        np.round(np.concatenate([ends[:, :2], ends[:, 2:]]), 3), axis=0, return_inverse=True
+    )
+    node_idx = node_idx.ravel()
+    fr_node, to_node = node_idx[:n_edges], node_idx[n_edges:]
+
+    # Edge attributes
+    length = edges["length"].to_numpy(dtype=np.float64)
+    highway = edges["highway"].astype(str) if "highway" in edges.columns else pd.Series([""] * n_edges)
+    if "bikability" in edges.columns:
+        lts = edges["bikability"].to_numpy()
+    else:
+        lts = np.full(n_edges, 3)
+        for pattern, val in [("runk|rimary", 1), ("econdary", 2), ("ycleway|iving|esidential|ath", 4)]:
+            lts[highway.str.contains(pattern).to_numpy()] = val
+    if "cycleway" in edges.columns:
+        cycleway = edges["cycleway"].to_numpy() == 1
+    else:
+        cycleway = highway.str.contains("ycleway").to_numpy()
+    if imped_attr == "Length":
+        imped = length
+    else:
+        speed = p_conf.OSM_GRAPH_SPEEDS[mode]
+        if mode == "bike":
+            speed = np.where(cycleway, speed * p_conf.OSM_CYCLEWAY_FACTOR, speed)
+        imped = length / speed
+
+    # Restriction usage (scale factors)
+    restricted = {"IsCycleway": cycleway}
+    restricted.update({f"LTS{i}": lts == i for i in range(1, 5)})
+    along = np.ones(n_edges)
+    for restriction in restrictions:
+        if restriction != "Oneway":
+            usage = p_conf.OSM_RESTRICTION_USAGE[restriction]
+            along[restricted[restriction]] *= np.inf if usage < 0 else usage
+    against = along.copy()
+    if "Oneway" in restrictions and "oneway" in edges.columns:
+        usage = p_conf.OSM_RESTRICTION_USAGE["Oneway"]
+        oneway = edges["oneway"].isin([1, True, "True", "T", "Y"]).to_numpy()
+        against[oneway] *= np.inf if usage < 0 else usage
+
+    # Directed edges (keep the lowest cost edge between any two nodes)
+    edge_df = pd.DataFrame(
+        {
+            "fr": np.concatenate([fr_node, to_node]),
+            "to": np.concatenate([to_node, fr_node]),
+            "cost": np.concatenate([imped * along, imped * against]),
+            "imped": np.concatenate([imped, imped]),
+        }
+    )
+    edge_df = edge_df[np.isfinite(edge_df["cost"]) & (edge_df["fr"] != edge_df["to"])]
+    edge_df = edge_df.sort_values(["fr", "to", "cost"]).drop_duplicates(["fr", "to"])
+    n_nodes = len(node_xy)
+    indices = edge_df["to"].to_numpy(dtype=np.int32)
+    indptr = np.concatenate(
+        [[0], np.cumsum(np.bincount(edge_df["fr"].to_numpy(), minlength=n_nodes))]
+    ).astype(np.int32)
+    graph = csr_matrix(
+        (edge_df["cost"].to_numpy(), indices, indptr), shape=(n_nodes, n_nodes)
+    )
+    imped = csr_matrix(
+        (edge_df["imped"].to_numpy(), indices, indptr), shape=(n_nodes, n_nodes)
+    )
+    return graph, imped, node_xy
+
+
+def snap_to_nodes(points_xy, node_xy, tolerance=np.inf):
+    """
+    Snaps points to their nearest network nodes using a KD-tree.
+
+    Args:
+        points_xy (np.array): (n_points x 2) point coordinates
+        node_xy (np.array): (n_nodes x 2) node coordinates in the same coordinate system
+        tolerance (float, default=np.inf): Maximum snapping distance (in coordinate units)
+
+    Returns:
+        node_pos (np.array): position of the nearest node to each point in `node_xy` (-1 for points
+            with no node within `tolerance`)
+        dist (np.array): distance from each point to its nearest node (inf for points with no node
+            within `tolerance`)
+    """
+    return nearest_feature_join(points_xy, node_xy, max_distance=tolerance)
+
+
+_NEAREST_INDEX_CACHE_ = {}
+
+
+def nearest_feature_join(target_xy, join_xy, join_ids=None, max_distance=np.inf, cache_key=None):
+    """
+    Finds the nearest join feature to each target feature using a KD-tree. This is a vectorized
+    alternative to closest-feature spatial joins (`arcpy.SpatialJoin_analysis` with
+    `match_option="CLOSEST"`) for point locations, such as parcel centroids and network nodes.
+
+    Args:
+        target_xy (np.array): (n x 2) target feature coordinates; targets with missing coordinates
+            are not matched
+        join_xy (np.array): (m x 2) join feature coordinates in the same coordinate system as
+            `target_xy`. Not used (may be None) if an index is cached under `cache_key`.
+        join_ids (array-like, default=None): Join feature id's (aligned with `join_xy`). If None,
+            positions in `join_xy` are returned.
+        max_distance (float, default=np.inf): Targets with no join feature within this distance
+            (in coordinate units) are not matched
+        cache_key (hashable, default=None): If given, the KD-tree built from `join_xy` (and `join_ids`)
+            is cached under this key - a network vintage, e.g. - and reused by later calls with the
+            same key.
+
+    Returns:
+        nearest (np.array): the id (or position) of the nearest join feature for each target; nan
+            (or -1 for positions) where no feature is matched
+        dist (np.array): the distance to the nearest join feature (inf where no feature is matched)
+    """
+    if cache_key is not None and cache_key in _NEAREST_INDEX_CACHE_:
+        tree, join_ids = _NEAREST_INDEX_CACHE_[cache_key]
+    else:
+        tree = cKDTree(np.asarray(join_xy, dtype=np.float64))
+        if cache_key is not None:
+            _NEAREST_INDEX_CACHE_[cache_key] = (tree, join_ids)
+    target_xy = np.asarray(target_xy, dtype=np.float64).reshape(-1, 2)
+    valid = np.isfinite(target_xy).all(axis=1)
+    dist = np.full(len(target_xy), np.inf)
+    nearest = np.full(len(target_xy), -1, dtype=np.int64)
+    dist[valid], nearest[valid] = tree.query(target_xy[valid], distance_upper_bound=max_distance)
+    nearest[~np.isfinite(dist)] = -1
+    if join_ids is None:
+        return nearest, dist
+    return pd.Series(np.asarray(join_ids)).reindex(nearest).to_numpy(), dist
+
+
+def _distance_to_crs_units_(distance, crs):
+    """
+    Internal helper to convert a linear distance string ("1500 meters", e.g.) to the linear units
+    of a projected coordinate reference system
+
+    See Also: osm_od_table
+    """
+    if crs is None or not crs.is_projected:
+        raise ValueError("Features must be in a projected coordinate system")
+    return _linear_unit_to_meters_(distance) / crs.axis_info[0].unit_conversion_factor
+
+
+def _linear_unit_to_meters_(distance):
+    """
+    Internal helper to convert a linear distance string ("1500 meters", "5280 Feet", e.g.) to meters
+
+    See Also: _distance_to_crs_units_, parcel_ideal_walk_time
+    """
+    to_meters = {
+        "meters": 1.0,
+        "kilometers": 1000.0,
+        "feet": 0.3048,
+        "miles": 1609.344,
+    }
+    value, units = str(distance).split()
+    units = units.lower()
+    if units not in to_meters:
+        raise ValueError(f"Expected distance units in {list(to_meters)} - got {units}")
+    return float(value) * to_meters[units]
+
+
+def _snap_features_(features, name_field, node_xy, tolerance):
+    """
+    Internal helper to snap features (by centroid) to network nodes, returning the names and node
+    positions of located features
+
+    See Also: osm_od_table
+    """
+    centroids = features.geometry.centroid
+    node_pos, _ = snap_to_nodes(
+        np.column_stack([centroids.x, centroids.y]), node_xy, tolerance
+    )
+    located = node_pos >= 0
+    if not located.all():
+        print(f"--- --- {(~located).sum()} of {len(located)} features could not be located")
+    names = features[name_field].astype(str).to_numpy()
+    return names[located], node_pos[located]
+
+
+def _path_impedances_(imped, pred):
+    """
+    Internal helper to accumulate impedances along the shortest path trees given by a
+    predecessor matrix from `scipy.sparse.csgraph.dijkstra`, using pointer jumping
+
+    See Also: osm_od_table
+    """
+    n_nodes = imped.shape[1]
+    rows = np.arange(pred.shape[0])[:, None]
+    nodes = np.arange(n_nodes)
+    # Impedance of the edge from each node's predecessor (edge keys are sorted in CSR order)
+    edge_keys = (
+            np.repeat(np.arange(n_nodes, dtype=np.int64), np.diff(imped.indptr)) * n_nodes
+            + imped.indices
+    )
+    has_pred = pred >= 0
+    acc = np.zeros(pred.shape)
+    acc[has_pred] = imped.data[
+        np.searchsorted(edge_keys, (pred.astype(np.int64) * n_nodes + nodes)[has_pred])
+    ]
+    ptr = np.where(has_pred, pred, nodes)
+    while True:
+        ptr_ptr = ptr[rows, ptr]
+        if np.array_equal(ptr_ptr, ptr):
+            return acc
+        acc = acc + acc[rows, ptr]
+        ptr = ptr_ptr
+
+
+def _iter_osm_od_rows_(graph, imped, o_names, o_pos, d_names, d_pos, cutoff, limit, batch_size):
+    """
+    Internal helper to solve OD impedances over a CSR network graph in batches of origins,
+    yielding (origin names, destination names, impedances) arrays for each batch. Records are
+    ordered by origin, then impedance. If `limit` is None, solve costs are taken as impedances;
+    otherwise shortest paths are searched up to `limit` and impedances accumulated along them.
+
+    See Also: osm_od_table
+    """
+    if cutoff is None:
+        cutoff = np.inf
+    for start in range(0, len(o_pos), batch_size):
+        b_pos = o_pos[start: start + batch_size]
+        if limit is None:
+            times = dijkstra(graph, directed=True, indices=b_pos, limit=cutoff)[:, d_pos]
+        else:
+            dist, pred = dijkstra(
+                graph, directed=True, indices=b_pos, limit=limit, return_predecessors=True
+            )
+            acc = _path_impedances_(imped, pred)
+            times = np.where(np.isfinite(dist[:, d_pos]), acc[:, d_pos], np.inf)
+        b_idx, d_idx = np.nonzero(times <= cutoff)
+        order = np.lexsort((times[b_idx, d_idx], b_idx))
+        b_idx, d_idx = b_idx[order], d_idx[order]
+        yield o_names[start + b_idx], d_names[d_idx], times[b_idx, d_idx]
+
+
+def _osm_od_df_(o_names, d_names, times, imped_attr):
+    """
+    Internal helper to format OD records like `generate_od_table` outputs
+
+    See Also: osm_od_table
+    """
+    o_names, d_names = pd.Series(o_names), pd.Series(d_names)
+    return pd.DataFrame(
+        {
+            "Name": o_names + " - " + d_names,
+            imped_attr: times,
+            "OName": o_names,
+            "DName": d_names,
+        }
+    )
+
+
+def _osm_od_shard_(
+        csr_dir, o_names, o_pos, d_names, d_pos, cutoff, limit, batch_size, imped_attr, shard_csv
+):
+    """
+    Internal helper run by worker processes in `osm_od_table` to solve a partition of origins
+    and write the results to a csv shard.
+
+    See Also: osm_od_table
+    """
+    graph, _ = _load_csr_(csr_dir)
+    imped = csr_matrix(
+        (np.load(os.path.join(csr_dir, "imped.npy"), mmap_mode="r"), graph.indices, graph.indptr),
+        shape=graph.shape,
+        copy=False,
+    )
+    write_mode = "w"
+    for o, d, t in _iter_osm_od_rows_(
+            graph, imped, o_names, o_pos, d_names, d_pos, cutoff, limit, batch_size
+    ):
+        if len(t) > 0:
+            df = _osm_od_df_(o, d, t, imped_attr)
+            df.to_csv(shard_csv, mode=write_mode, header=write_mode == "w", index=False)
+            write_mode = "a"
+    return shard_csv
+
+
+def osm_od_table(
+        origin_pts,
+        origin_name_field,
+        dest_pts,
+        dest_name_field,
+        in_edges,
+        mode,
+        imped_attr,
+        cutoff,
+        net_loader,
+        out_table,
+        restrictions=None,
+        batch_size=50,
+        workers=1,
+):
+    """
+    Creates and solves an OD Matrix problem for a collection of origin and destination points
+    over an OSM network graph (see `osm_to_csr`) with `scipy.sparse.csgraph.dijkstra`. This is
+    a pure-python alternative to `generate_od_table` that does not require Network Analyst, so
+    it can run on any platform. Results are exported with the same schema ("Name", `imped_attr`,
+    "OName", "DName"), ordered by origin and impedance. Global turn delays are not modeled (see
+    `osm_to_csr`), so impedances can be lower than Network Analyst's where paths turn.
+
+    Points (or polygon centroids) are snapped to their nearest network node with a KD-tree;
+    features with no node within `net_loader.search_tolerance` are not located (and skipped).
+    Where restrictions scale edge costs, shortest paths are chosen by scaled costs and the
+    reported impedance is the `imped_attr` total along the chosen path.
+
+    Args:
+        origin_pts (str, gpd.GeoDataFrame): Path to origin features (shapefile or geodatabase
+            feature class) or a GeoDataFrame; must be in a projected coordinate system
+        origin_name_field (str): Unique ID field of origin features
+        dest_pts (str, gpd.GeoDataFrame): Destination features, as `origin_pts`
+        dest_name_field (str): Unique ID field of destination features
+        in_edges (str, gpd.GeoDataFrame): OSM edge features (see `osm_to_csr`)
+        mode (str): "walk" or "bike"
+        imped_attr (str): The impedance attribute, "Minutes" or "Length"
+        cutoff (numeric): Only OD pairs within this impedance are recorded
+        net_loader (NetLoader): NetLoader object; its `search_tolerance` ("1500 meters", e.g.) sets
+            the maximum snapping distance. If None, all features are snapped.
+        out_table (str): Path to output table (csv or skim store, see `is_skim_store`)
+        restrictions (str, list, default=None): Restriction attributes to honor (see `osm_to_csr`)
+        batch_size (int, default=50): The number of origins solved at a time. Larger batches are
+            faster but hold several (batch_size x n_nodes) arrays in memory.
+        workers (int, default=1): If greater than 1, origins are partitioned across a pool of this
+            many processes. The graph is shared with workers as memory-mapped arrays and results
+            are merged in partition order, so the output is identical to a single-process run.
+
+    Returns:
+        None: results are stored in `out_table`
+    """
+    print("--- ---OD MATRIX: building network graph")
+    origins = _read_features_(origin_pts)
+    crs = origins.crs
+    dests = _read_features_(dest_pts)
+    if dests.crs != crs:
+        dests = dests.to_crs(crs)
+    graph, imped, node_xy = osm_to_csr(
+        in_edges, mode, imped_attr=imped_attr, restrictions=restrictions, crs=crs
+    )
+    if net_loader is None:
+        tolerance = np.inf
+    else:
+        tolerance = _distance_to_crs_units_(net_loader.search_tolerance, crs)
+    print("--- ---OD MATRIX: locating origins and destinations")
+    o_names, o_pos = _snap_features_(origins, origin_name_field, node_xy, tolerance)
+    d_names, d_pos = _snap_features_(dests, dest_name_field, node_xy, tolerance)
+    # Search beyond the cutoff when restrictions scale costs up
+    if np.array_equal(graph.data, imped.data):
+        limit = None
+    else:
+        scaled = imped.data > 0
+        limit = cutoff * max(1.0, np.max(graph.data[scaled] / imped.data[scaled], initial=1.0))
+
+    print(f"--- ---OD MATRIX: solving {len(o_pos)} origins")
+    if workers <= 1:
+        write_mode = "w"
+        for o, d, t in _iter_osm_od_rows_(
+                graph, imped, o_names, o_pos, d_names, d_pos, cutoff, limit, batch_size
+        ):
+            if len(t) > 0:
+                write_skim_chunk(_osm_od_df_(o, d, t, imped_attr), out_table, mode=write_mode, index=False)
+                write_mode = "a"
+        return
+
+    # Partition origins into several contiguous blocks per worker to balance the load
+    temp_dir = tempfile.mkdtemp()
+    try:
+        csr_dir = _save_csr_(graph, np.arange(graph.shape[0]), temp_dir)
+        np.save(os.path.join(csr_dir, "imped.npy"), imped.data)
+        del graph, imped
+        n_parts = min(len(o_pos), workers * 4) or 1
+        partitions = np.array_split(np.arange(len(o_pos)), n_parts)
+        print(f"--- --- {n_parts} partitions on {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _osm_od_shard_,
+                    csr_dir,
+                    o_names[part],
+                    o_pos[part],
+                    d_names,
+                    d_pos,
+                    cutoff,
+                    limit,
+                    batch_size,
+                    imped_attr,
+                    os.path.join(temp_dir, f"shard_{i}.csv"),
+                )
+                for i, part in enumerate(partitions)
+            ]
+            shards = [f.result() for f in futures]
+        # Merge shards in partition order
+        write_mode = "w"
+        str_cols = {"Name": str, "OName": str, "DName": str}
+        for shard in shards:
+            if not os.path.exists(shard):
+                continue
+            for chunk in pd.read_csv(
+                    shard, dtype=str_cols, chunksize=100000, float_precision="round_trip"
+            ):
+                write_skim_chunk(chunk, out_table, mode=write_mode, index=False)
+                write_mode = "a"
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _iter_centrality_sums_(graph, imped, d_pos, o_cols, o_weights, cutoff, limit, batch_size):
+    """
+    Internal helper to count origins reaching each destination node within `cutoff` and sum
+    their impedances, in batches of destinations. `graph` and `imped` are transposed network
+    graphs, so paths are solved from destinations back to origins. `o_cols` are origin node
+    positions and `o_weights` the number of origin features at each.
+
+    See Also: network_centrality_csr
+    """
+    for start in range(0, len(d_pos), batch_size):
+        b_pos = d_pos[start: start + batch_size]
+        if limit is None:
+            times = dijkstra(graph, directed=True, indices=b_pos, limit=cutoff)[:, o_cols]
+        else:
+            dist, pred = dijkstra(
+                graph, directed=True, indices=b_pos, limit=limit, return_predecessors=True
+            )
+            acc = _path_impedances_(imped, pred)
+            times = np.where(np.isfinite(dist[:, o_cols]), acc[:, o_cols], np.inf)
+        reached = times <= cutoff
+        yield (
+            (reached * o_weights).sum(axis=1),
+            (np.where(reached, times, 0.0) * o_weights).sum(axis=1),
+        )
+
+
+def _centrality_shard_(csr_dir, d_pos, o_cols, o_weights, cutoff, limit, batch_size):
+    """
+    Internal helper run by worker processes in `network_centrality_csr` to solve a partition
+    of destination nodes.
+
+    See Also: network_centrality_csr
+    """
+    graph, _ = _load_csr_(csr_dir)
+    imped = csr_matrix(
+        (np.load(os.path.join(csr_dir, "imped.npy"), mmap_mode="r"), graph.indices, graph.indptr),
+        shape=graph.shape,
+        copy=False,
+    )
+    sums = list(
+        _iter_centrality_sums_(graph, imped, d_pos, o_cols, o_weights, cutoff, limit, batch_size)
+    )
+    if not sums:
+        return np.zeros(0), np.zeros(0)
+    return tuple(np.concatenate(arrays) for arrays in zip(*sums))
+
+
+def network_centrality_csr(
+        in_edges,
+        in_features,
+        net_loader,
+        name_field="OBJECTID",
+        impedance_attribute="Length",
+        cutoff=1609,
+        restrictions="",
+        mode="bike",
+        batch_size=50,
+        workers=1,
+):
+    """
+    Assesses connectivity among point features over an OSM network graph (see `osm_to_csr`),
+    as a native alternative to `network_centrality` that does not require Network Analyst.
+    A truncated shortest path search is run from every feature's node over the transposed
+    graph, so - as in `network_centrality` - results are reported for traveling TO each feature.
+    Reachable feature counts and impedances are accumulated directly, without creating OD lines.
+    Global turn delays are not modeled (see `osm_to_csr`), so results can differ slightly from
+    `network_centrality` where paths turn.
+
+    Features are snapped to their nearest network node with a KD-tree (within
+    `net_loader.search_tolerance`); features that cannot be located are not reported.
+
+    Args:
+        in_edges (str, gpd.GeoDataFrame): OSM edge features (see `osm_to_csr`)
+        in_features (str, gpd.GeoDataFrame): Path to point features (shapefile or geodatabase feature
+            class) or a GeoDataFrame; features serve as origins and destinations
+        net_loader (object): NetLoader; its `search_tolerance` sets the maximum snapping distance.
+            If None, all features are snapped.
+        name_field (str, default="OBJECTID"): A field in `in_features` that identifies each feature.
+        impedance_attribute (str, default="Length"): "Length" or "Minutes"
+        cutoff (numeric, default=1609): The search radius for evaluating node centrality, in units
+            implied by `impedance_attribute`.
+        restrictions (str, default=""): A semi-colon-separated string listing which restrictions to
+            honor (see `osm_to_csr`).
+        mode (str, default="bike"): The network mode ("walk" or "bike")
+        batch_size (int, default=50): The number of features solved at a time. Larger batches are
+            faster but hold several (batch_size x n_nodes) arrays in memory.
+        workers (int, default=1): If greater than 1, features are partitioned across a pool of this
+            many processes. The graph is shared with workers as memory-mapped arrays.
+
+    Returns:
+        centrality_df (pd.DataFrame): columns "Node", "N", "Total_{impedance_attribute}", "centrality",
+            "AvgLength", and "CentIdx", as returned by `network_centrality`
+    """
+    imp_field = f"Total_{impedance_attribute}"
+    cutoff = float(cutoff)
+    print("Build network graph")
+    features = _read_features_(in_features)
+    graph, imped, node_xy = osm_to_csr(
+        in_edges, mode, imped_attr=impedance_attribute, restrictions=restrictions, crs=features.crs
+    )
+    # Solve paths to features from all others
+    graph, imped = graph.T.tocsr(), imped.T.tocsr()
+    if net_loader is None:
+        tolerance = np.inf
+    else:
+        tolerance = _distance_to_crs_units_(net_loader.search_tolerance, features.crs)
+    names, d_pos = _snap_features_(features, name_field, node_xy, tolerance)
+    o_cols, o_weights = np.unique(d_pos, return_counts=True)
+    o_weights = o_weights.astype(np.float64)
+    # Search beyond the cutoff when restrictions scale costs up
+    if np.array_equal(graph.data, imped.data):
+        limit = None
+    else:
+        scaled = imped.data > 0
+        limit = cutoff * max(1.0, np.max(graph.data[scaled] / imped.data[scaled], initial=1.0))
+
+    print(f"Solve centrality for {len(d_pos)} features")
+    if workers <= 1:
+        sums = list(
+            _iter_centrality_sums_(graph, imped, d_pos, o_cols, o_weights, cutoff, limit, batch_size)
+        )
+    else:
+        # Partition features into several contiguous blocks per worker to balance the load
+        temp_dir = tempfile.mkdtemp()
+        try:
+            csr_dir = _save_csr_(graph, np.arange(graph.shape[0]), temp_dir)
+            np.save(os.path.join(csr_dir, "imped.npy"), imped.data)
+            del graph, imped
+            n_parts = min(len(d_pos), workers * 4) or 1
+            print(f"- {n_parts} partitions on {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _centrality_shard_,
+                        csr_dir,
+                        part,
+                        o_cols,
+                        o_weights,
+                        cutoff,
+                        limit,
+                        batch_size,
+                    )
+                    for part in np.array_split(d_pos, n_parts)
+                ]
+                sums = [f.result() for f in futures]
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    if sums:
+        n, total = (np.concatenate(arrays) for arrays in zip(*sums))
+    else:
+        n, total = np.zeros(0), np.zeros(0)
+    sum_df = pd.DataFrame({"Node": names, "N": n.astype(np.int64), imp_field: total})
+    return _centrality_stats_(sum_df, imp_field)
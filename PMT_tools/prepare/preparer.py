@@ -43,7 +43,7 @@ import datetime
 import os
 import sys
 import warnings
-from functools import reduce
+from functools import partial, reduce
 
 import networkx as nx
 
@@ -536,11 +536,17 @@ def process_permits(overwrite=True):
         raise
 
 
-def enrich_block_groups(overwrite=True):
+def enrich_block_groups(overwrite=True, engine="bulk"):
     """
     YEAR by YEAR, enrich block group with parcel data and race/commute/jobs data as table
         - if Year == "NearTerm", process as normal (parcel data have been updated to include permit updates)
 
+    Args:
+        overwrite (bool): if True, overwrite existing enrichment tables
+        engine (str, default="bulk"): parcel to block group relation engine passed to
+            `prepare_helpers.enrich_bg_with_parcels` ("arcpy" selects parcels block group by
+            block group; "bulk" relates all parcels at once)
+
     Inputs:
         - CLEANED//PMT_{year}.gdb//Polygons//Parcels
         - CLEANED//PMT_{year}.gdb//Polygons//Census_BlockGroups
@@ -580,6 +586,7 @@ def enrich_block_groups(overwrite=True):
             par_bld_area=prep_conf.PARCEL_BLD_AREA_COL,
             sum_crit=prep_conf.LODES_CRITERIA,
             par_sum_fields=prep_conf.BG_PAR_SUM_FIELDS,
+            engine=engine,
         )
         # Save enriched data
         print("--- saving enriched blockgroup table")
@@ -824,13 +831,19 @@ def process_osm_networks():
             )
 
 
-def process_bg_apply_activity_models(overwrite=True):
+def process_bg_apply_activity_models(overwrite=True, panel_cache=True):
     """
     Using existing LODES and Census demographic data, a linear model is fitted to the data at the block
     group level. Modeled results are used in all years, even in those with observed data, so that there are
     clearer relationships and trends over time (mixing observed and modeled results can yield unexpected
     patterns at the temporal boundary between observed and estimated data).
 
+    Args:
+        overwrite (bool): if True, overwrite existing modeled block group tables
+        panel_cache (bool): if True, the stacked multi-year block group table used for model fitting is
+            cached in CLEANED//blockgroup_panel and only years whose enriched data changed are re-read
+            (see `prepare_helpers.load_blockgroup_panel`)
+
     Inputs:
         - enriched Block group data (LODES, demographics) with parcel summarizations
     
@@ -845,13 +858,18 @@ def process_bg_apply_activity_models(overwrite=True):
         fields="*",
         acs_years=prep_conf.ACS_YEARS,
         lodes_years=prep_conf.LODES_YEARS,
+        cache_dir=make_path(CLEANED, "blockgroup_panel") if panel_cache else None,
     )
+    bg_enrich_paths = {}
+    bg_geometry_paths = {}
+    model_years = {}
+    shares_from = {}
     for year in YEARS:
-        print(f"{year}: ")
         # Set the inputs based on the year
         gdb = YEAR_GDB_FORMAT.replace("YEAR", str(year))
         bg_enrich = make_path(gdb, "Enrichment_census_blockgroups")
-        bg_geometry = make_path(gdb, "Polygons", "Census_BlockGroups")
+        bg_enrich_paths[year] = bg_enrich
+        bg_geometry_paths[year] = make_path(gdb, "Polygons", "Census_BlockGroups")
 
         shares = {}
         shr_year = year
@@ -871,19 +889,23 @@ def process_bg_apply_activity_models(overwrite=True):
             shares["ACS"] = bg_enrich.replace(str(year), str(prep_conf.ACS_YEARS[wa]))
         if len(shares.keys()) == 0:
             shares = None
+        model_years[year] = shr_year
+        shares_from[year] = shares
 
-        # Apply the models
         check_overwrite_output(
             output=make_path(gdb, "Modeled_blockgroups"), overwrite=overwrite
         )
-        modeled_df = p_help.apply_blockgroup_model(
-            year=shr_year,
-            bg_enrich_path=bg_enrich,
-            bg_geometry_path=bg_geometry,
+
+    # Apply the models for all years (shares files are read once), saving each year as it completes
+    for year, modeled_df in p_help.apply_blockgroup_models(
+            bg_enrich_paths=bg_enrich_paths,
+            bg_geometry_paths=bg_geometry_paths,
             bg_id_field=prep_conf.BG_COMMON_KEY,
             model_coefficients=model_coefficients,
-            shares_from=shares,
-        )
+            model_years=model_years,
+            shares_from=shares_from,
+    ):
+        gdb = YEAR_GDB_FORMAT.replace("YEAR", str(year))
         save_path = make_path(gdb, "Modeled_blockgroups")
         PMT.df_to_table(df=modeled_df, out_table=save_path)
 
@@ -905,42 +927,48 @@ def process_allocate_bg_to_parcels(overwrite=True):
     """
     print("\nProcessing modeled data to generate allocation to parcels...")
     snap_gdb = make_path(CLEANED, f"PMT_{SNAPSHOT_YEAR}.gdb")
+    bg_modeled_dfs = {}
+    bg_geoms = {}
+    parcel_fcs = {}
+    parcel_wcs = {}
     for year in YEARS:
         # Set the inputs based on the year
-        print(f"{year} allocation begun")
         out_gdb = make_path(CLEANED, f"PMT_{year}.gdb")
-        parcel_fc = make_path(out_gdb, "Polygons", "Parcels")
-        bg_geom = make_path(out_gdb, "Polygons", "Census_BlockGroups")
-        bg_modeled = make_path(
-            out_gdb, "Modeled_blockgroups"
-        )  # TODO: read in as DF for the function
+        parcel_fcs[year] = make_path(out_gdb, "Polygons", "Parcels")
+        bg_geoms[year] = make_path(out_gdb, "Polygons", "Census_BlockGroups")
+        bg_modeled = make_path(out_gdb, "Modeled_blockgroups")
 
         # if nearterm, filter parcels to permitted then process bg_modeled as difference between NT and Snapshot
         if year == "NearTerm":
             # set where clause to limit parecel data to only PERMITTED changes
-            wc = arcpy.AddFieldDelimiters(datasource=parcel_fc, field="PERMIT") + " = 1"
+            parcel_wcs[year] = (
+                    arcpy.AddFieldDelimiters(datasource=parcel_fcs[year], field="PERMIT")
+                    + " = 1"
+            )
             # take the difference between NT and Snap modeled data prior to allocation
             bg_modeled_snap = make_path(snap_gdb, "Modeled_blockgroups")
-            bg_modeled = table_difference(
+            bg_modeled_dfs[year] = table_difference(
                 this_table=bg_modeled,
                 base_table=bg_modeled_snap,
                 idx_cols=prep_conf.BG_COMMON_KEY,
             )
         else:
-            wc = ""
-            bg_modeled = PMT.table_to_df(in_tbl=bg_modeled)
-        # Allocate
-        alloc_df = p_help.allocate_bg_to_parcels(
-            bg_modeled_df=bg_modeled,
-            bg_geom=bg_geom,
+            bg_modeled_dfs[year] = PMT.table_to_df(in_tbl=bg_modeled)
+
+    # Allocate, sharing the block group/parcel intersection among years with the same geometry,
+    # and write each year as it completes
+    for year, alloc_df in p_help.allocate_bg_to_parcels_by_year(
+            bg_modeled_dfs=bg_modeled_dfs,
+            bg_geoms=bg_geoms,
             bg_id_field=prep_conf.BG_COMMON_KEY,
-            parcel_fc=parcel_fc,
+            parcel_fcs=parcel_fcs,
             parcels_id=prep_conf.PARCEL_COMMON_KEY,
-            parcel_wc=wc,
+            parcel_wcs=parcel_wcs,
             parcel_lu=prep_conf.LAND_USE_COMMON_KEY,
             parcel_liv_area=prep_conf.PARCEL_BLD_AREA_COL,
-        )
-
+    ):
+        print(f"{year} allocation complete")
+        out_gdb = make_path(CLEANED, f"PMT_{year}.gdb")
         if year == "NearTerm":
             # make a data frame of parcels with no change
             snap_data = make_path(snap_gdb, "EconDemog_parcels")
@@ -976,29 +1004,44 @@ def process_allocate_bg_to_parcels(overwrite=True):
         PMT.df_to_table(df=alloc_df, out_table=out_path)
 
 
-def process_osm_skims():
+def process_osm_skims(engine="network_analyst", workers=1):
     """
     Estimated travel time by walking and biking between all MAZ origin-destination
     pairs and store in a long csv table.
 
+    Args:
+        engine (str, default="network_analyst"): The OD solver. "network_analyst" solves OD cost
+            matrices on the network datasets (`prepare_helpers.generate_od_table`); "graph" solves
+            them over a graph of the network edges with scipy (`prepare_helpers.osm_od_table`) and
+            does not require Network Analyst. Both write the same output schema, but the graph does
+            not model the network datasets' global turn delays, so its times can be slightly
+            shorter where paths turn at intersections.
+        workers (int, default=1): Number of processes used to solve origins in parallel. Only
+            applies to the "graph" engine.
+
     Inputs
         - CLEANED//osm_networks//{mode}_{vintage}.gdb
         - CLEANED//PMT_{year}.gdb//Polygons\MAZ
 
     Outputs
-        - CLEANED//osm_networks//{mode}_Skim_{vintage}.csv
+        - CLEANED//osm_networks//{mode}_Skim_{vintage}.csv (or .skim store, see `prep_conf.SKIM_EXT`)
     """
-    if arcpy.CheckExtension("network") == "Available":
-        arcpy.CheckOutExtension("network")
-    else:
-        raise arcpy.ExecuteError("Network Analyst Extension license is not available.")
+    if engine not in ["network_analyst", "graph"]:
+        raise ValueError(f"Expected 'network_analyst' or 'graph' as `engine` value - got {engine}")
+    if engine == "network_analyst":
+        if arcpy.CheckExtension("network") == "Available":
+            arcpy.CheckOutExtension("network")
+        else:
+            raise arcpy.ExecuteError("Network Analyst Extension license is not available.")
+    net_cache = PMT.NetResultCache(
+        make_path(CLEANED, prep_conf.NET_CACHE_DIR), max_size=prep_conf.NET_CACHE_MAX_SIZE
+    )
     # Create and solve OD Matrix at MAZ scale
     solved = []
     for year in YEARS:
         # Get MAZ features, create temp centroids for network loading
         maz_path = make_path(CLEANED, f"PMT_{year}.gdb", "Polygons", "MAZ")
-        maz_fc = make_inmem_path()
-        maz_pts = polygons_to_points(maz_path, maz_fc, prep_conf.MAZ_COMMON_KEY)
+        maz_pts = None
         net_suffix = prep_conf.NET_BY_YEAR[year][0]
         if net_suffix not in solved:
             # TODO: confirm whether separate walk/bike layers are needed
@@ -1006,19 +1049,49 @@ def process_osm_skims():
             #  these entail selections or anything that would potentially
             #  disrupt a smooth iteration using a single layer of maz points
             modes = ["walk", "bike"]
-            walk_lyr = arcpy.MakeFeatureLayer_management(maz_pts, "__walk__")
-            bike_lyr = arcpy.MakeFeatureLayer_management(maz_pts, "__bike__")
-            layers = [walk_lyr, bike_lyr]
             # Run each mode
-            for mode, layer in zip(modes, layers):
+            for mode in modes:
                 print(mode)
                 # - Skim input/output
                 nd = make_path(NETS_DIR, f"{mode}{net_suffix}.gdb", "osm", "osm_ND")
-                skim = make_path(NETS_DIR, f"{mode}_Skim{net_suffix}.csv")
+                skim = make_path(NETS_DIR, f"{mode}_Skim{net_suffix}{prep_conf.SKIM_EXT}")
                 if mode == "bike":
                     restrictions = prep_conf.BIKE_RESTRICTIONS
                 else:
                     restrictions = None
+                # - Skip the solve if these inputs have been solved before
+                cache_key = net_cache.key(
+                    [nd, maz_path],
+                    name_field=prep_conf.MAZ_COMMON_KEY,
+                    imped_attr=prep_conf.OSM_IMPED,
+                    cutoff=prep_conf.BIKE_PED_CUTOFF,
+                    net_loader=prep_conf.NET_LOADER,
+                    restrictions=restrictions,
+                    engine=engine,
+                )
+                if net_cache.fetch(cache_key, skim):
+                    continue
+                if engine == "graph":
+                    p_help.osm_od_table(
+                        origin_pts=maz_path,
+                        origin_name_field=prep_conf.MAZ_COMMON_KEY,
+                        dest_pts=maz_path,
+                        dest_name_field=prep_conf.MAZ_COMMON_KEY,
+                        in_edges=make_path(NETS_DIR, f"{mode}{net_suffix}.gdb", "osm", "edges"),
+                        mode=mode,
+                        imped_attr=prep_conf.OSM_IMPED,
+                        cutoff=prep_conf.BIKE_PED_CUTOFF,
+                        net_loader=prep_conf.NET_LOADER,
+                        out_table=skim,
+                        restrictions=restrictions,
+                        workers=workers,
+                    )
+                    net_cache.store(cache_key, skim)
+                    continue
+                if maz_pts is None:
+                    maz_fc = make_inmem_path()
+                    maz_pts = polygons_to_points(maz_path, maz_fc, prep_conf.MAZ_COMMON_KEY)
+                layer = arcpy.MakeFeatureLayer_management(maz_pts, f"__{mode}__")
                 # - Create and load problem
                 # Confirm "Year" column is included in output table
                 p_help.generate_od_table(
@@ -1038,6 +1111,7 @@ def process_osm_skims():
                     d_location_fields=None,
                     o_chunk_size=1000,
                 )
+                net_cache.store(cache_key, skim)
                 # Clean up workspace
                 arcpy.Delete_management(layer)
             # Mark as solved
@@ -1137,7 +1211,7 @@ def process_model_skims():
         - CLEANED//SERPM//TAZ_to_TAZ_prem_{model_year}.csv
 
     Outputs:
-        - CLEANED//SERPM/SERPM_OD_{model_year}.csv
+        - CLEANED//SERPM/SERPM_OD_{model_year}.csv (or .skim store, see `prep_conf.SKIM_EXT`)
     """
     # Get field definitions
     o_field = prep_conf.SKIM_O_FIELD
@@ -1153,9 +1227,9 @@ def process_model_skims():
         local_csv = PMT.make_path(CLEANED, "SERPM", f"TAZ_to_TAZ_local_{year}.csv")
         prem_csv = PMT.make_path(CLEANED, "SERPM", f"TAZ_to_TAZ_prem_{year}.csv")
         trips_csv = PMT.make_path(RAW, "SERPM", f"DLY_VEH_TRIPS_{year}.csv")
-        skim_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_SKIM_TEMP.csv")
-        temp_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_OD_TEMP.csv")
-        serpm_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_OD_{year}.csv")
+        skim_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_SKIM_TEMP{prep_conf.SKIM_EXT}")
+        temp_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_OD_TEMP{prep_conf.SKIM_EXT}")
+        serpm_out = PMT.make_path(CLEANED, "SERPM", f"SERPM_OD_{year}{prep_conf.SKIM_EXT}")
 
         # Combine all skims tables
         print(" - Combining all skims")
@@ -1236,82 +1310,88 @@ def process_osm_service_areas():
     parks_name = "NAME"
 
     # For each analysis year, analyze networks (avoid redundant solves)
-    solved = []
-    solved_years = []
+    net_cache = PMT.NetResultCache(
+        make_path(CLEANED, prep_conf.NET_CACHE_DIR), max_size=prep_conf.NET_CACHE_MAX_SIZE
+    )
     modes = ["walk"]  # ["walk", "bike"]
     dest_grp = ["stn", "parks"]
     runs = ["MERGE", "NO_MERGE", "OVERLAP", "NON_OVERLAP"]
-    expected_fcs = [
-        f"{mode}_to_{dg}_{run}" for mode in modes for dg in dest_grp for run in runs
-    ]
     for year in YEARS:  # TODO: add appropriate print/logging statements within loop
         out_fds_path = make_path(CLEANED, f"PMT_{year}.gdb", "Networks")
         out_fds = validate_feature_dataset(out_fds_path, SR_FL_SPF, overwrite=False)
         # Network setup
         net_suffix = prep_conf.NET_BY_YEAR[year][0]
-        if net_suffix in solved:
-            # Copy from other year if already solved
-            # Set a source to copy network analysis results from based on net_by_year
-            # TODO: write function for source year setting
-            target_net = prep_conf.NET_BY_YEAR[year][0]
-            source_year = None
-            for solved_year in solved_years:
-                solved_net = prep_conf.NET_BY_YEAR[solved_year][0]
-                if solved_net == target_net:
-                    source_year = solved_year
-                    break
-            source_fds = make_path(CLEANED, f"PMT_{source_year}.gdb", "Networks")
-            target_fds = make_path(CLEANED, f"PMT_{year}.gdb", "Networks")
-            p_help.copy_net_result(
-                source_fds=source_fds, target_fds=target_fds, fc_names=expected_fcs
-            )  # TODO: embellish this function with print/logging
-        else:
+        print(f"\n{year}: {net_suffix}")
+        for mode in modes:
+            nd = make_path(NETS_DIR, f"{mode}{net_suffix}.gdb", "osm", "osm_ND")
+            # Set restrictions if needed
+            if mode == "bike":
+                restrictions = prep_conf.BIKE_RESTRICTIONS
+            else:
+                restrictions = ""
+            # Copy from cache if already solved
+            expected_fcs = [
+                make_path(out_fds, f"{mode}_to_{dg}_{run}")
+                for dg in dest_grp
+                for run in runs
+            ]
+            cache_key = net_cache.key(
+                [nd, stations, parks],
+                name_fields=[station_name, parks_name],
+                imped_attr=prep_conf.OSM_IMPED,
+                cutoff=prep_conf.OSM_CUTOFF,
+                net_loader=prep_conf.NET_LOADER,
+                restrictions=restrictions,
+            )
+            if net_cache.fetch(cache_key, expected_fcs):
+                continue
             # Solve this network
-            print(f"\n{net_suffix}")
-            for mode in modes:
-                # Create separate service area problems for stations and parks
-                nd = make_path(NETS_DIR, f"{mode}{net_suffix}.gdb", "osm", "osm_ND")
-                stations = ServiceAreaAnalysis(
-                    name=f"{mode}_to_stn",
-                    network_dataset=nd,
-                    facilities=stations,
-                    name_field=station_name,
-                    net_loader=prep_conf.NET_LOADER,
-                )
-                parks = ServiceAreaAnalysis(
-                    name=f"{mode}_to_parks",
-                    network_dataset=nd,
-                    facilities=parks,
-                    name_field=parks_name,
-                    net_loader=prep_conf.NET_LOADER,
+            # - Create separate service area problems for stations and parks
+            stn_sa = ServiceAreaAnalysis(
+                name=f"{mode}_to_stn",
+                network_dataset=nd,
+                facilities=stations,
+                name_field=station_name,
+                net_loader=prep_conf.NET_LOADER,
+            )
+            parks_sa = ServiceAreaAnalysis(
+                name=f"{mode}_to_parks",
+                network_dataset=nd,
+                facilities=parks,
+                name_field=parks_name,
+                net_loader=prep_conf.NET_LOADER,
+            )
+            # - Solve service area problems
+            for sa_prob in [stn_sa, parks_sa]:
+                print(f"\n - {sa_prob.name}")
+                # Solve (exports output to the out_fds)
+                sa_prob.solve(
+                    imped_attr=prep_conf.OSM_IMPED,
+                    cutoff=prep_conf.OSM_CUTOFF,
+                    out_ws=out_fds,
+                    restrictions=restrictions,
+                    use_hierarchy=False,
+                    net_location_fields="",
                 )
-                # Solve service area problems
-                for sa_prob in [stations, parks]:
-                    print(f"\n - {sa_prob.name}")
-                    # Set restrictions if needed
-                    if "bike" in sa_prob.name:
-                        restrictions = prep_conf.BIKE_RESTRICTIONS
-                    else:
-                        restrictions = ""
-                    # Solve (exports output to the out_fds)
-                    sa_prob.solve(
-                        imped_attr=prep_conf.OSM_IMPED,
-                        cutoff=prep_conf.OSM_CUTOFF,
-                        out_ws=out_fds,
-                        restrictions=restrictions,
-                        use_hierarchy=False,
-                        net_location_fields="",
-                    )
-            # Keep track of what's already been solved
-            solved.append(net_suffix)
-        solved_years.append(year)
+            # Cache results for other years and later runs
+            net_cache.store(cache_key, expected_fcs)
 
 
-def process_centrality():
+def process_centrality(engine="network_analyst", workers=1):
     """
     For each analysis year, analyze network centrality for all nodes in the bike
     network. Assigns a centrality score to parcels based on nearby network nodes.
 
+    Args:
+        engine (str, default="network_analyst"): The centrality solver. "network_analyst" iterates
+            OD matrix solves on the network dataset (`prepare_helpers.network_centrality`); "graph"
+            runs truncated shortest path searches over a graph of the network edges with scipy
+            (`prepare_helpers.network_centrality_csr`). Both return the same centrality fields, but
+            the graph does not model the network dataset's global turn delays, so scores can differ
+            slightly where paths turn at intersections.
+        workers (int, default=1): Number of processes used to solve nodes in parallel. Only
+            applies to the "graph" engine.
+
     Inputs:
         - CLEANED//osm_networks//bike_{vintage}.gdb
         - CLEANED//PMT_{year}.gdb//Polygons//parcels
@@ -1320,8 +1400,11 @@ def process_centrality():
         - CLEANED//PMT_{year}.gdb//Networks//nodes_bike
         - CLEANED//PMT_{year}.gdb//Centrality_parcels
     """
-    solved = []
-    solved_years = []
+    net_cache = PMT.NetResultCache(
+        make_path(CLEANED, prep_conf.NET_CACHE_DIR), max_size=prep_conf.NET_CACHE_MAX_SIZE
+    )
+    if engine not in ["network_analyst", "graph"]:
+        raise ValueError(f"Expected 'network_analyst' or 'graph' as `engine` value - got {engine}")
     node_id = "NODE_ID"
     for year in YEARS:
         if year == "NearTerm":
@@ -1338,26 +1421,23 @@ def process_centrality():
         out_fc = make_path(out_fds, out_fc_name)
         parcel_fc = make_path(out_gdb, "Polygons", "Parcels")
         check_overwrite_output(out_fc, overwrite=True)
-        if net_suffix in solved:
-            # Copy from other year if already solved
-            # TODO: make source year setting a function
-            target_net = prep_conf.NET_BY_YEAR[year][0]
-            source_year = None
-            for solved_year in solved_years:
-                solved_net = prep_conf.NET_BY_YEAR[solved_year][0]
-                if solved_net == target_net:
-                    source_year = solved_year
-                    break
-            source_fds = make_path(CLEANED, f"PMT_{source_year}.gdb", "Networks")
-            target_fds = make_path(CLEANED, f"PMT_{year}.gdb", "Networks")
-            p_help.copy_net_result(source_fds, target_fds, fc_names=out_fc_name)
-        else:
+        in_fds = make_path(NETS_DIR, f"bike{net_suffix}.gdb", "osm")
+        in_nd = make_path(in_fds, "osm_ND")
+        in_edges = make_path(in_fds, "edges")
+        in_nodes = make_path(in_fds, "osm_ND_Junctions")
+        # Copy from cache if already solved
+        cache_key = net_cache.key(
+            [in_fds],
+            name_field=node_id,
+            imped_attr=prep_conf.CENTRALITY_IMPED,
+            cutoff=prep_conf.CENTRALITY_CUTOFF,
+            net_loader=prep_conf.CENTRALITY_NET_LOADER,
+            restrictions=prep_conf.BIKE_RESTRICTIONS,
+            engine=engine,
+        )
+        if not net_cache.fetch(cache_key, out_fc):
             # Get node and edge features as layers
             print(f"\n{net_suffix}")
-            in_fds = make_path(NETS_DIR, f"bike{net_suffix}.gdb", "osm")
-            in_nd = make_path(in_fds, "osm_ND")
-            in_edges = make_path(in_fds, "edges")
-            in_nodes = make_path(in_fds, "osm_ND_Junctions")
             edges = arcpy.MakeFeatureLayer_management(in_edges, "EDGES")
             nodes = arcpy.MakeFeatureLayer_management(in_nodes, "NODES")
             # Select edges by attribute - service roads
@@ -1390,17 +1470,32 @@ def process_centrality():
                 expression=f"!{oid_field}!",
                 expression_type="PYTHON",
             )
-            # Calculate centrality (iterative OD solves)
-            centrality_df = p_help.network_centrality(
-                in_nd=in_nd,
-                in_features=out_fc,
-                net_loader=prep_conf.CENTRALITY_NET_LOADER,
-                name_field=node_id,
-                impedance_attribute=prep_conf.CENTRALITY_IMPED,
-                cutoff=prep_conf.CENTRALITY_CUTOFF,
-                restrictions=prep_conf.BIKE_RESTRICTIONS,
-                chunk_size=1000,
-            )
+            # Calculate centrality
+            if engine == "graph":
+                # - truncated shortest path searches over the edges graph
+                centrality_df = p_help.network_centrality_csr(
+                    in_edges=in_edges,
+                    in_features=out_fc,
+                    net_loader=prep_conf.CENTRALITY_NET_LOADER,
+                    name_field=node_id,
+                    impedance_attribute=prep_conf.CENTRALITY_IMPED,
+                    cutoff=prep_conf.CENTRALITY_CUTOFF,
+                    restrictions=prep_conf.BIKE_RESTRICTIONS,
+                    mode="bike",
+                    workers=workers,
+                )
+            else:
+                # - iterative OD solves
+                centrality_df = p_help.network_centrality(
+                    in_nd=in_nd,
+                    in_features=out_fc,
+                    net_loader=prep_conf.CENTRALITY_NET_LOADER,
+                    name_field=node_id,
+                    impedance_attribute=prep_conf.CENTRALITY_IMPED,
+                    cutoff=prep_conf.CENTRALITY_CUTOFF,
+                    restrictions=prep_conf.BIKE_RESTRICTIONS,
+                    chunk_size=1000,
+                )
             # Extend out_fc
             extend_table_df(
                 in_table=out_fc,
@@ -1411,55 +1506,70 @@ def process_centrality():
             # Delete layers to avoid name collisions
             arcpy.Delete_management(edges)
             arcpy.Delete_management(nodes)
-            # Keep track of solved networks
-            solved.append(net_suffix)
+            # Cache results for other years and later runs
+            net_cache.store(cache_key, out_fc)
 
         # set year for nodes
         arcpy.CalculateField_management(
             out_fc, "Year", str(calc_year), field_type="LONG"
         )
 
-        # generate CentIDX for parcels table through spatial join of closest point to parcel
-        sj_temp = make_inmem_path()
-        par_cent_fields = ["FOLIO", "Year", "CentIdx"]
-        fmapper = arcpy.FieldMappings()
-        fmapper.addTable(parcel_fc)
-        fmapper.addTable(out_fc)
-        for f in fmapper.fields:
-            if f.name not in par_cent_fields:
-                idx = fmapper.findFieldMapIndex(f.name)
-                fmapper.removeFieldMap(idx)
-        arcpy.SpatialJoin_analysis(
-            target_features=parcel_fc,
-            join_features=out_fc,
-            out_feature_class=sj_temp,
-            field_mapping=fmapper,
-            match_option="CLOSEST",
+        # generate CentIDX for parcels table from the closest node to each parcel (by centroid)
+        nodes_df = pd.DataFrame(
+            arcpy.da.FeatureClassToNumPyArray(
+                out_fc, ["SHAPE@X", "SHAPE@Y", "CentIdx"], null_value=np.nan
+            )
+        )
+        par_df = pd.DataFrame(
+            arcpy.da.FeatureClassToNumPyArray(
+                parcel_fc, ["FOLIO", "SHAPE@X", "SHAPE@Y"]
+            )
         )
-        arcpy.TableToTable_conversion(
-            in_rows=sj_temp,
-            out_path=out_gdb,
-            out_name="Centrality_parcels",
-            field_mapping=fmapper,
+        par_df["CentIdx"], _ = p_help.nearest_feature_join(
+            target_xy=par_df[["SHAPE@X", "SHAPE@Y"]].values,
+            join_xy=nodes_df[["SHAPE@X", "SHAPE@Y"]].values,
+            join_ids=nodes_df["CentIdx"].values,
+            cache_key=(cache_key, "CentIdx"),
+        )
+        par_df["Year"] = calc_year
+        df_to_table(
+            par_df[["FOLIO", "Year", "CentIdx"]],
+            make_path(out_gdb, "Centrality_parcels"),
+            overwrite=True,
         )
-        solved_years.append(year)
 
 
-def process_walk_times():
+def process_walk_times(engine="service_area"):
     """
     Estimates walk times from parcels to stations and parcels to parks based on
     spatial relationships among parcel features and service area lines.
 
+    Args:
+        engine (str, default="service_area"): "service_area" summarizes the service area lines
+            generated by `process_osm_service_areas` near each parcel
+            (`prepare_helpers.parcel_walk_times`); "graph" solves walk times from stations and parks
+            to parcels directly over a graph of the walk network edges with scipy
+            (`prepare_helpers.parcel_network_walk_times`), so no service area lines are needed.
+
     Inputs
         - CLEANED//PMT_{year}.gdb//Polygons//parcels
         - CLEANED//PMT_{year}.gdb//Networks//walk_to_stn_MERGE
         - CLEANED//PMT_{year}.gdb//Networks//walk_to_parks_MERGE
+        - BASIC_FEATURES//SMARTplanStations ("graph" engine)
+        - CLEANED//Park_Points.shp ("graph" engine)
+        - CLEANED//osm_networks//walk_{vintage}.gdb ("graph" engine)
 
     Outputs
         - CLEANED//PMT_{year}.gdb//WalkTime_parcels
     """
+    if engine not in ["service_area", "graph"]:
+        raise ValueError(f"Expected 'service_area' or 'graph' as `engine` value - got {engine}")
     print("\nProcessing Walk Times:")
     target_names = ["stn_walk", "park_walk"]  # , "stn_bike", "park_bike"]
+    facilities = [
+        (make_path(BASIC_FEATURES, "SMARTplanStations"), "Name"),
+        (make_path(CLEANED, "Park_Points.shp"), "NAME"),
+    ]
     ref_fcs = [
         "walk_to_stn_NON_OVERLAP",
         "walk_to_parks_NON_OVERLAP",
@@ -1468,56 +1578,75 @@ def process_walk_times():
     # "bike_to_stn_NON_OVERLAP", "bike_to_parks_NON_OVERLAP"]
     ref_name_field = "Name"
     ref_time_field = f"ToCumul_{prep_conf.OSM_IMPED}"
+    graph_cache = {}
     for year in YEARS:
         print(f"{str(year)}\n--------------------")
         year_gdb = make_path(CLEANED, f"PMT_{year}.gdb")
         parcels = make_path(year_gdb, "Polygons", "Parcels")
         out_table = make_path(year_gdb, "WalkTime_parcels")
-        _append_ = False
+        combo_df = None
         # Iterate over targets and references
         net_fds = make_path(year_gdb, "Networks")
-        for tgt_name, ref_fc, preselect_fc in zip(target_names, ref_fcs, preselect_fcs):
-            print(f"- {tgt_name}")
-            ref_fc = make_path(net_fds, ref_fc)
-            preselect_fc = make_path(net_fds, preselect_fc)
-            walk_time_df = p_help.parcel_walk_times(
+        net_suffix = prep_conf.NET_BY_YEAR[year][0]
+        in_edges = make_path(NETS_DIR, f"walk{net_suffix}.gdb", "osm", "edges")
+        if engine == "graph":
+            # solve all targets against one graph and one set of snapped parcels
+            graph_dfs = p_help.parcel_network_walk_times(
                 parcel_fc=parcels,
                 parcel_id_field=prep_conf.PARCEL_COMMON_KEY,
-                ref_fc=ref_fc,
-                ref_name_field=ref_name_field,
-                ref_time_field=ref_time_field,
-                preselect_fc=preselect_fc,
-                target_name=tgt_name,
+                facilities=dict(zip(target_names, facilities)),
+                in_edges=in_edges,
+                mode="walk",
+                imped_attr=prep_conf.OSM_IMPED,
+                cutoff=max(float(c) for c in prep_conf.OSM_CUTOFF.split()),
+                restrictions=None,
+                search_tolerance=prep_conf.NET_LOADER.search_tolerance,
+                graph_cache=graph_cache,
             )
-            # Dump df to output table
-            if _append_:
-                extend_table_df(
-                    in_table=out_table,
-                    table_match_field=prep_conf.PARCEL_COMMON_KEY,
-                    df=walk_time_df,
-                    df_match_field=prep_conf.PARCEL_COMMON_KEY,
+        for tgt_name, ref_fc, preselect_fc in zip(target_names, ref_fcs, preselect_fcs):
+            print(f"- {tgt_name}")
+            if engine == "graph":
+                walk_time_df = graph_dfs[tgt_name]
+            else:
+                walk_time_df = p_help.parcel_walk_times(
+                    parcel_fc=parcels,
+                    parcel_id_field=prep_conf.PARCEL_COMMON_KEY,
+                    ref_fc=make_path(net_fds, ref_fc),
+                    ref_name_field=ref_name_field,
+                    ref_time_field=ref_time_field,
+                    preselect_fc=make_path(net_fds, preselect_fc),
+                    target_name=tgt_name,
                 )
+            # Extend the output records (parcels of the first target) with these results
+            if combo_df is None:
+                combo_df = walk_time_df
             else:
-                df_to_table(df=walk_time_df, out_table=out_table, overwrite=True)
-                _append_ = True
+                combo_df = combo_df.merge(
+                    walk_time_df, how="left", on=prep_conf.PARCEL_COMMON_KEY
+                )
             # Add time bin field
             print("--- classifying time bins")
-            bin_field = f"bin_{tgt_name}"
-            min_time_field = f"min_time_{tgt_name}"
-            p_help.parcel_walk_time_bin(
-                in_table=out_table,
-                bin_field=bin_field,
-                time_field=min_time_field,
-                code_block=prep_conf.TIME_BIN_CODE_BLOCK,
+            combo_df[f"bin_{tgt_name}"] = p_help.walk_time_bins(
+                times=combo_df[f"min_time_{tgt_name}"],
+                breaks=prep_conf.TIME_BIN_BREAKS,
+                labels=prep_conf.TIME_BIN_LABELS,
             )
+        # Dump df to output table
+        df_to_table(df=combo_df, out_table=out_table, overwrite=True)
 
 
-def process_ideal_walk_times(overwrite=True):
+def process_ideal_walk_times(overwrite=True, engine="kdtree"):
     """
     Estimates hypothetical walk times from parcels to stations and parcels to parks based on
     spatial relationships among parcel features and stations, parks. Assumes a constant walk
     speed.
 
+    Args:
+        overwrite (bool): if True, overwrite existing WalkTimeIdeal_parcels tables
+        engine (str): "kdtree" (default) finds parcels near each target from centroid arrays in
+            one pass; "arcpy" selects parcels by location for each target
+            (see `prepare_helpers.parcel_ideal_walk_time`)
+
     Inputs
         - CLEANED//PMT_{year}.gdb//Polygons//parcels
         - CLEANED//Park_Points.shp
@@ -1552,6 +1681,7 @@ def process_ideal_walk_times(overwrite=True):
                 overlap_type="HAVE_THEIR_CENTER_IN",
                 sr=None,
                 assumed_mph=prep_conf.IDEAL_WALK_MPH,
+                engine=engine,
             )
             dfs.append(df)
         # Combine dfs, dfToTable
@@ -1562,25 +1692,27 @@ def process_ideal_walk_times(overwrite=True):
             dfs,
         )
         # combo_df = dfs[0].merge(right=dfs[1], how="outer", on=prep_conf.PARCEL_COMMON_KEY)
-        df_to_table(df=combo_df, out_table=out_table, overwrite=overwrite)
         # Add bin fields
         for target in targets:
-            min_time_field = f"min_time_{target}"
-            bin_field = f"bin_{target}"
-            p_help.parcel_walk_time_bin(
-                in_table=out_table,
-                bin_field=bin_field,
-                time_field=min_time_field,
-                code_block=prep_conf.TIME_BIN_CODE_BLOCK,
+            combo_df[f"bin_{target}"] = p_help.walk_time_bins(
+                times=combo_df[f"min_time_{target}"],
+                breaks=prep_conf.TIME_BIN_BREAKS,
+                labels=prep_conf.TIME_BIN_LABELS,
             )
+        df_to_table(df=combo_df, out_table=out_table, overwrite=overwrite)
 
 
-def process_access():
+def process_access(single_pass=True):
     """
     Summarizes activities (jobs, school enrollments, housing units, etc.) reachable
     from zone features (MAZs for non-motorized modes, TAZs for motorized modes) by
     alternative travel modes (walk, bike, transit, auto).
 
+    Args:
+        single_pass (bool, default=True): if True, each skim is read once and access to
+            destinations and from origins is summarized for all years sharing the skim
+            (see `NET_BY_YEAR`); if False, the skim is read twice for each year
+
     Inputs
         - CLEANED//osm_networks//{mode})Skim_{vintage}.csv
         - CLEANED//SERPM//SERPM_OD_{model_year}.csv
@@ -1593,69 +1725,100 @@ def process_access():
         - CLEANED//PMT_{year}.gdb//Access_taz_Auto
         - CLEANED//PMT_{year}.gdb//Access_taz_Transit
     """
-    for year in YEARS:
-        print(f"Analysis year: {year}")
-        gdb = make_path(CLEANED, f"PMT_{year}.gdb")
-        for mode in prep_conf.ACCESS_MODES:
-            print(f"--- {mode}")
-            # Get reference info from globals
-            source, scale, id_field = prep_conf.MODE_SCALE_REF[mode]
+    for mode in prep_conf.ACCESS_MODES:
+        print(f"--- {mode}")
+        # Get reference info from globals
+        source, scale, id_field = prep_conf.MODE_SCALE_REF[mode]
+        # Group analysis years by skim
+        skim_years = {}
+        for year in YEARS:
             osm_year, model_year = prep_conf.NET_BY_YEAR[year]
             if source == "OSM_Networks":
                 skim_year = osm_year
                 imped_field = "Minutes"
-                skim_data = make_path(CLEANED, source, f"{mode}_Skim{skim_year}.csv")
+                skim_data = make_path(
+                    CLEANED, source, f"{mode}_Skim{skim_year}{prep_conf.SKIM_EXT}"
+                )
             else:
                 skim_year = model_year
                 imped_field = f"{prep_conf.SKIM_IMP_FIELD}_{mode[:2].upper()}"
-                skim_data = make_path(CLEANED, source, f"SERPM_OD_{skim_year}.csv")
-            # Look up zone and skim data for each mode
-            zone_data = make_path(gdb, f"EconDemog_{scale}")
-
+                skim_data = make_path(
+                    CLEANED, source, f"SERPM_OD_{skim_year}{prep_conf.SKIM_EXT}"
+                )
+            skim_years.setdefault((skim_data, imped_field), []).append(year)
+
+        for (skim_data, imped_field), years in skim_years.items():
+            print(f"--- --- {os.path.basename(skim_data)}: {years}")
+            # Look up zone data for each year
+            zone_data = {
+                year: make_path(CLEANED, f"PMT_{year}.gdb", f"EconDemog_{scale}")
+                for year in years
+            }
             # Analyze access
-            atd_df = p_help.summarize_access(
-                skim_table=skim_data,
-                o_field=prep_conf.SKIM_O_FIELD,
-                d_field=prep_conf.SKIM_D_FIELD,
-                imped_field=imped_field,
-                se_data=zone_data,
-                id_field=id_field,
-                act_fields=prep_conf.D_ACT_FIELDS,
-                imped_breaks=prep_conf.ACCESS_TIME_BREAKS,
-                units=prep_conf.ACCESS_UNITS,
-                join_by="D",
-                dtype=prep_conf.SKIM_DTYPES,
-                chunk_size=100000,
-            )
-            afo_df = p_help.summarize_access(
-                skim_table=skim_data,
-                o_field=prep_conf.SKIM_O_FIELD,
-                d_field=prep_conf.SKIM_D_FIELD,
-                imped_field=imped_field,
-                se_data=zone_data,
-                id_field=id_field,
-                act_fields=prep_conf.O_ACT_FIELDS,
-                imped_breaks=prep_conf.ACCESS_TIME_BREAKS,
-                units=prep_conf.ACCESS_UNITS,
-                join_by="O",
-                dtype=prep_conf.SKIM_DTYPES,
-                chunk_size=100000,
-            )
-            # Merge tables
-            atd_df.rename(columns={prep_conf.SKIM_O_FIELD: id_field}, inplace=True)
-            afo_df.rename(columns={prep_conf.SKIM_D_FIELD: id_field}, inplace=True)
-            full_table = atd_df.merge(right=afo_df, on=id_field)
+            if single_pass:
+                access = p_help.summarize_access_by_year(
+                    skim_table=skim_data,
+                    o_field=prep_conf.SKIM_O_FIELD,
+                    d_field=prep_conf.SKIM_D_FIELD,
+                    imped_field=imped_field,
+                    se_data=zone_data,
+                    id_field=id_field,
+                    d_act_fields=prep_conf.D_ACT_FIELDS,
+                    o_act_fields=prep_conf.O_ACT_FIELDS,
+                    imped_breaks=prep_conf.ACCESS_TIME_BREAKS,
+                    units=prep_conf.ACCESS_UNITS,
+                    dtype=prep_conf.SKIM_DTYPES,
+                    chunk_size=100000,
+                )
+            else:
+                access = {}
+                for year in years:
+                    access[year] = tuple(
+                        p_help.summarize_access(
+                            skim_table=skim_data,
+                            o_field=prep_conf.SKIM_O_FIELD,
+                            d_field=prep_conf.SKIM_D_FIELD,
+                            imped_field=imped_field,
+                            se_data=zone_data[year],
+                            id_field=id_field,
+                            act_fields=act_fields,
+                            imped_breaks=prep_conf.ACCESS_TIME_BREAKS,
+                            units=prep_conf.ACCESS_UNITS,
+                            join_by=join_by,
+                            dtype=prep_conf.SKIM_DTYPES,
+                            chunk_size=100000,
+                            vectorized=True,
+                        )
+                        for join_by, act_fields in [
+                            ("D", prep_conf.D_ACT_FIELDS),
+                            ("O", prep_conf.O_ACT_FIELDS),
+                        ]
+                    )
+
+            for year, (atd_df, afo_df) in access.items():
+                # Merge tables
+                atd_df.rename(columns={prep_conf.SKIM_O_FIELD: id_field}, inplace=True)
+                afo_df.rename(columns={prep_conf.SKIM_D_FIELD: id_field}, inplace=True)
+                full_table = atd_df.merge(right=afo_df, on=id_field)
 
-            # Export output
-            out_table = make_path(gdb, f"Access_{scale}_{mode}")
-            df_to_table(full_table, out_table, overwrite=True)
+                # Export output
+                gdb = make_path(CLEANED, f"PMT_{year}.gdb")
+                out_table = make_path(gdb, f"Access_{scale}_{mode}")
+                df_to_table(full_table, out_table, overwrite=True)
 
 
-def process_contiguity(overwrite=True):
+def process_contiguity(overwrite=True, incremental=False):
     """
     Estimates contiguity of developable land year over year by removing building footprints and other non-developable
     areas from the parcel layer and calculating the area of the remaining space on each parcel
 
+    Args:
+        overwrite (bool): if True, overwrite existing contiguity tables
+        incremental (bool): if True, only parcels in areas where parcel geometries or the mask changed
+            since the previous run are recalculated; results for other parcels are carried forward
+            (see `prepare_helpers.calculate_contiguity_index`). The state of the last run is kept in
+            CLEANED//contiguity_state.pkl.
+
     Inputs:
         - CLEANED//BASIC_FEATURES//MiamiDadeCountyBoundary
         - CLEANED//PMT_YYYY.gdb//Polygons//Parcels
@@ -1706,6 +1869,9 @@ def process_contiguity(overwrite=True):
             parcels_id_field=prep_conf.PARCEL_COMMON_KEY,
             cell_size=prep_conf.CTGY_CELL_SIZE,
             weights=prep_conf.CTGY_WEIGHTS,
+            workers=prep_conf.CTGY_WORKERS,
+            rasterizer=prep_conf.CTGY_RASTERIZER,
+            state_path=make_path(CLEANED, "contiguity_state.pkl") if incremental else None,
         )
         if prep_conf.CTGY_SAVE_FULL:
             full_path = make_path(gdb, "Contiguity_full_singlepart")
@@ -1904,6 +2070,7 @@ def process_lu_diversity(overwrite=True):
 
     Outputs:
         - CLEANED//PMT_YYYY.gdb//Diversity_summaryareas
+        - CLEANED//PMT_YYYY.gdb//Diversity_parcels (if `prep_conf.DIV_FLOATING_ZONE` is set)
     """
     print("\nProcessing Land Use Diversity...")
     summary_areas_fc = make_path(BASIC_FEATURES, "SummaryAreas")
@@ -1975,6 +2142,31 @@ def process_lu_diversity(overwrite=True):
         print(" - exporting results")
         df_to_table(div_df, out_fc, overwrite=overwrite)
 
+        # Floating zone diversity around each parcel
+        if prep_conf.DIV_FLOATING_ZONE is not None:
+            print(f" - calculating diversity in {prep_conf.DIV_FLOATING_ZONE} floating zones")
+            par_df = PMT.featureclass_to_df(
+                in_fc=parcel_fc, keep_fields=par_fields + ["SHAPE@X", "SHAPE@Y"]
+            )
+            par_df = par_df.merge(
+                recode_df, how="left", on=prep_conf.LAND_USE_COMMON_KEY
+            )
+            mpu = float(arcpy.Describe(parcel_fc).spatialReference.metersPerUnit)
+            fz_df = p_help.floating_zone_diversity(
+                parcel_ids=par_df[prep_conf.PARCEL_COMMON_KEY],
+                parcel_xy=par_df[["SHAPE@X", "SHAPE@Y"]].values,
+                land_uses=par_df[prep_conf.LU_RECODE_FIELD],
+                weights=par_df[prep_conf.PARCEL_BLD_AREA_COL] / 1000,
+                radius=prep_conf.DIV_FLOATING_ZONE,
+                div_funcs=div_funcs,
+                count_lu=count_lu,
+                regional_comp=True,
+                parcel_id_field=prep_conf.PARCEL_COMMON_KEY,
+                lu_field=prep_conf.LU_RECODE_FIELD,
+                meters_per_unit=mpu,
+            )
+            df_to_table(fz_df, make_path(gdb, "Diversity_parcels"), overwrite=overwrite)
+
 
 def process_travel_stats(overwrite=True):
     """
@@ -2007,7 +2199,9 @@ def process_travel_stats(overwrite=True):
         model_year = prep_conf.NET_BY_YEAR[year][1]
         if model_year not in rates:
             # Calculate per cap/per job vmt rates
-            skim_csv = make_path(CLEANED, "SERPM", f"SERPM_OD_{model_year}.csv")
+            skim_csv = make_path(
+                CLEANED, "SERPM", f"SERPM_OD_{model_year}{prep_conf.SKIM_EXT}"
+            )
             taz_ref_csv = make_path(CLEANED, f"PMT_{model_year}.gdb", "EconDemog_TAZ")
             taz_ref = PMT.table_to_df(taz_ref_csv, keep_fields="*")
             trips_field = "TRIPS"
@@ -2064,6 +2258,9 @@ def process_walk_to_transit_skim():
     tap_nodes = make_path(serpm_raw, "SERPM_TAP_Nodes.shp")
     tap_id = "TAP"
     tap_cutoff = "15"  # minutes
+    net_cache = PMT.NetResultCache(
+        make_path(CLEANED, prep_conf.NET_CACHE_DIR), max_size=prep_conf.NET_CACHE_MAX_SIZE
+    )
     solved = []
     for year in YEARS:
         net_suffix, model_year = prep_conf.NET_BY_YEAR[year]
@@ -2074,6 +2271,20 @@ def process_walk_to_transit_skim():
             nd = make_path(NETS_DIR, f"Walk{net_suffix}.gdb", "osm", "osm_ND")
             skim = make_path(serpm_clean, f"TAZ_to_TAP{net_suffix}.csv")
             restrictions = None
+            # - Skip the solve if these inputs have been solved before
+            cache_key = net_cache.key(
+                [nd, taz_centroids, tap_nodes],
+                name_fields=[prep_conf.TAZ_COMMON_KEY, tap_id],
+                imped_attr=prep_conf.OSM_IMPED,
+                cutoff=tap_cutoff,
+                net_loader=prep_conf.NET_LOADER,
+                restrictions=restrictions,
+                walk_radius=prep_conf.IDEAL_WALK_RADIUS,
+                walk_mph=prep_conf.IDEAL_WALK_MPH,
+            )
+            if net_cache.fetch(cache_key, skim):
+                solved.append(model_year)
+                continue
             # - Create and load problem
             print(" - Network-based")
             p_help.generate_od_table(
@@ -2170,14 +2381,23 @@ def process_walk_to_transit_skim():
                 arcpy.Delete_management(net_layer)
 
             # Mark as solved
+            net_cache.store(cache_key, skim)
             solved.append(model_year)
 
 
-def process_serpm_transit():
+def process_serpm_transit(engine="networkx", workers=1):
     """
     Combines estimates of TAP to TAP and TAZ to TAP travel times (in minutes) to create
     an OD table of TAZ to TAZ travel time estimates.
 
+    Args:
+        engine (str, default="networkx"): The shortest path engine used to solve TAZ to TAZ
+            times. "networkx" builds a networkx graph and solves one origin at a time
+            (`prepare_helpers.full_skim`); "csr" loads the skims into a sparse matrix and solves
+            origins in batches (`prepare_helpers.full_skim_csr`). Both produce the same records.
+        workers (int, default=1): Number of processes used to solve origins in parallel. Only
+            applies to the "csr" engine.
+
     Inputs:
         - RAW//SERPM//SERPM_TAZ_Centroids.shp
         - RAW//SERPM//TAP_to_TAP_{skim version}_{model_year}.csv
@@ -2186,11 +2406,20 @@ def process_serpm_transit():
         - CLEANED//SERPM//TAP_to_TAP_{skim version}_{model_year}_clean.csv
         - CLEANED//SERPM//TAZ_to_TAZ_{skim version}_{model_year}.csv
     """
+    skim_engines = {
+        "networkx": p_help.full_skim,
+        "csr": partial(p_help.full_skim_csr, workers=workers),
+    }
+    if engine not in skim_engines:
+        raise ValueError(f"Expected one of {list(skim_engines)} as `engine` value - got {engine}")
     # Make a graph from TAP to TAP skim
     serpm_raw = make_path(RAW, "SERPM")
     serpm_clean = make_path(CLEANED, "SERPM")
     skim_versions = ["local", "prem"]
     cutoff = 60  # TODO: move to prep_conf?
+    net_cache = PMT.NetResultCache(
+        make_path(CLEANED, prep_conf.NET_CACHE_DIR), max_size=prep_conf.NET_CACHE_MAX_SIZE
+    )
     solved = []
     for year in YEARS:
         net_suffix, model_year = prep_conf.NET_BY_YEAR[year]
@@ -2222,6 +2451,17 @@ def process_serpm_transit():
                     "dest": "DName",
                     "flow": "Minutes",
                 }  # TODO move to prep_conf?
+                taz_to_taz = PMT.make_path(serpm_clean, f"TAZ_to_TAZ_{skim_version}_{model_year}.csv")
+                # Skip cleaning and solving if these inputs have been solved before
+                #  (both engines produce the same records)
+                cache_key = net_cache.key(
+                    [tap_to_tap, taz_to_tap, tazs],
+                    renames=tap_renames,
+                    cutoff=cutoff,
+                    impedance_attr="Minutes",
+                )
+                if net_cache.fetch(cache_key, [tap_to_tap_clean, taz_to_taz]):
+                    continue
                 p_help.clean_skim_csv(
                     in_file=tap_to_tap,
                     out_file=tap_to_tap_clean,
@@ -2239,8 +2479,7 @@ def process_serpm_transit():
                 #                           origin_zones=taz_nodes, total_cutoff=cutoff)
                 # Make tap to tap network
                 print(" - - building TAZ to TAZ graph")
-                taz_to_taz = PMT.make_path(serpm_clean, f"TAZ_to_TAZ_{skim_version}_{model_year}.csv")
-                p_help.full_skim(
+                skim_engines[engine](
                     # clean_serpm_dir=make_path(CLEANED, "SERPM"),
                     tap_to_tap=tap_to_tap_clean,
                     taz_to_tap=taz_to_tap,
@@ -2252,7 +2491,8 @@ def process_serpm_transit():
                     all_tazs=all_tazs,
                     impedance_attr="Minutes"
                 )
-                solved.append(model_year)
+                net_cache.store(cache_key, [tap_to_tap_clean, taz_to_taz])
+            solved.append(model_year)
 
 
 if __name__ == "__main__":